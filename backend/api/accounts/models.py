@@ -1,9 +1,11 @@
 from django.conf import settings
-from django.core.exceptions import ValidationError
 from django.db import models
 
+from backend.api.core.mixins.unique_constraint import UniqueConstraintMixin
+from backend.api.dashboard.cache import invalidate_dashboard
 
-class Account(models.Model):
+
+class Account(UniqueConstraintMixin, models.Model):
     # TODO change to enum: Account types
     ACCOUNT_TYPES = [
         ('corrente', 'Corrente'),
@@ -39,29 +41,26 @@ class Account(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
-    def clean(self):
-        """
-        Valida se já existe conta com mesmo nome para o mesmo usuário e perfil.
-        """
-        existing = Account.objects.filter(
-            user=self.user,
-            relative=self.relative,
-            name=self.name
-        )
-
-        if self.pk:  # Se for update, exclui o próprio registro da validação
-            existing = existing.exclude(pk=self.pk)
-
-        if existing.exists():
-            raise ValidationError({
-                'name': 'Você já possui uma conta com este nome. Use outro nome.'
-            })
+    # Mensagens para violações de unicidade detectadas pelo banco ao salvar
+    unique_error_messages = {
+        ('user', 'relative', 'name'): {
+            'name': 'Você já possui uma conta com este nome. Use outro nome.'
+        },
+    }
 
     def save(self, *args, **kwargs):
-        self.clean()
         if self.is_archived:
             self.include_calc = False
+
+        # Em contas existentes o saldo é mantido apenas pelos lançamentos (UPDATE com F()),
+        # então não é regravado aqui para não sobrescrever deltas concorrentes
+        if not self._state.adding and not kwargs.get('force_insert') and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'balance'
+            ]
         super().save(*args, **kwargs)
+        invalidate_dashboard(self.relative_id)
 
     def delete(self, *args, **kwargs):
         raise NotImplementedError("Não é permitido deletar contas.")
@@ -75,3 +74,17 @@ class Account(models.Model):
         verbose_name_plural = 'Contas'
         # Garante que o usuário não tenha duas contas com o mesmo nome no mesmo perfil
         unique_together = ['user', 'relative', 'name']
+        indexes = [
+            # Listagem padrão: contas ativas do perfil ordenadas por nome (id desempata o cursor)
+            models.Index(
+                fields=['user', 'relative', 'name', 'id'],
+                condition=models.Q(is_archived=False),
+                name='account_active_name_idx'
+            ),
+            # Listagem sem X-Relative-Id: contas ativas de todos os perfis do usuário
+            models.Index(
+                fields=['user', 'name', 'id'],
+                condition=models.Q(is_archived=False),
+                name='account_user_active_name_idx'
+            ),
+        ]
@@ -2,13 +2,15 @@ import re
 
 from rest_framework import serializers
 
+from backend.api.core.mixins.relative_scope import RelativeScopedSerializerMixin
+
 from .models import Account
 
 # Padrão hexadecimal #RRGGBB (exatamente 6 dígitos hex após o #)
 HEX_COLOR_PATTERN = re.compile(r'^#[0-9A-Fa-f]{6}$')
 
 
-class AccountSerializer(serializers.ModelSerializer):
+class AccountSerializer(RelativeScopedSerializerMixin, serializers.ModelSerializer):
     balance = serializers.DecimalField(
         max_digits=10,
         decimal_places=2,
@@ -36,17 +38,8 @@ class AccountSerializer(serializers.ModelSerializer):
         """
         validated_data['user'] = self.context['request'].user
 
-        # Busca o relative_id do header
-        relative_id = self.context['request'].headers.get('X-Relative-Id')
-        if relative_id:
-            try:
-                from backend.api.relatives.models import Relative
-                relative = Relative.objects.get(id=relative_id, user=validated_data['user'])
-                validated_data['relative'] = relative
-            except Relative.DoesNotExist:
-                raise serializers.ValidationError("Perfil não encontrado ou não pertence ao usuário.")
-        else:
-            raise serializers.ValidationError("Header X-Relative-Id é obrigatório.")
+        # Perfil do header já resolvido e autorizado para este request
+        validated_data['relative_id'] = self.get_request_relative_id()
 
         return super().create(validated_data)
 
@@ -1,17 +1,23 @@
 from decimal import Decimal
 
+from django.utils.dateparse import parse_date
 from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from backend.api.relatives.models import Relative
+from backend.api.balances.history import MAX_BALANCE_DATES, balances_as_of
+from backend.api.core.mixins.export import StreamingExportMixin
+from backend.api.core.mixins.relative_scope import RelativeScopedViewSetMixin
+from backend.api.core.pagination.keyset import KeysetPagination
+from backend.api.core.search.unaccent import filter_name_search
 
 from .models import Account
 from .serializers import AccountSerializer
 
 
-class AccountViewSet(viewsets.ModelViewSet):
+class AccountViewSet(RelativeScopedViewSetMixin, StreamingExportMixin, viewsets.ModelViewSet):
     """
     ViewSet para operações CRUD da entidade Account.
     Permite criar, listar, recuperar, atualizar e arquivar contas financeiras.
@@ -19,6 +25,10 @@ class AccountViewSet(viewsets.ModelViewSet):
     queryset = Account.objects.all()
     serializer_class = AccountSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
+    export_fields = ('id', 'relative_id', 'bank_name', 'name', 'description', 'account_type', 'color',
+                     'include_calc', 'balance', 'is_archived', 'created_at', 'updated_at')
+    export_filename = 'contas'
 
     def get_queryset(self):
         """
@@ -30,30 +40,21 @@ class AccountViewSet(viewsets.ModelViewSet):
         queryset = Account.objects.filter(user=self.request.user)
 
         # Filtro por perfil se X-Relative-Id estiver presente no header
-        relative_id = self.request.headers.get('X-Relative-Id')
-        if relative_id:
-            try:
-                relative = Relative.objects.get(id=relative_id, user=self.request.user)
-                queryset = queryset.filter(relative=relative)
-            except Relative.DoesNotExist:
-                # Se perfil não existir, retorna um erro
-                raise ValidationError({
-                    'X-Relative-Id': f'Perfil com ID {relative_id} não encontrado ou não pertence ao usuário. Por favor limpar os Cookies do Navegador.'
-                })
-
-        # Filtro por is_archived aplicado apenas na listagem
+        queryset = self.filter_by_relative(queryset)
+
+        # Filtro por is_archived aplicado apenas na listagem (e na exportação)
         # Retrieve, update e destroy devem funcionar independente do status de arquivamento
-        if self.action == 'list':
+        if self.action in ('list', 'export'):
             only_archived = self.request.query_params.get('only_archived', 'false')
             if only_archived.lower() == 'true':
                 queryset = queryset.filter(is_archived=True)
             else:
                 queryset = queryset.filter(is_archived=False)
 
-        # Se houver parâmetro 'name', filtra por nome
+        # Se houver parâmetro 'name', filtra por nome (sem diferenciar acentos)
         name = self.request.query_params.get('name', None)
         if name:
-            queryset = queryset.filter(name__icontains=name)
+            queryset = filter_name_search(queryset, name)
 
         return queryset.order_by('name')
 
@@ -63,6 +64,39 @@ class AccountViewSet(viewsets.ModelViewSet):
         """
         serializer.save(user=self.request.user)
 
+    @action(detail=True, methods=['get'])
+    def balance(self, request, pk=None):
+        """
+        Saldo da conta em uma ou mais datas: ?date=AAAA-MM-DD ou ?date=AAAA-MM-DD,AAAA-MM-DD,...
+        """
+        account = self.get_object()
+        dates = self.get_balance_dates()
+
+        series = balances_as_of([account], dates)[account.pk]
+        return Response({
+            'account': account.pk,
+            'balances': [{'date': day.isoformat(), 'balance': str(value)} for day, value in series],
+        })
+
+    def get_balance_dates(self):
+        raw_value = self.request.query_params.get('date', '')
+        values = [value.strip() for value in raw_value.split(',') if value.strip()]
+        if not values:
+            raise ValidationError({'date': 'Informe ao menos uma data no formato AAAA-MM-DD.'})
+        if len(values) > MAX_BALANCE_DATES:
+            raise ValidationError({'date': f'Informe no máximo {MAX_BALANCE_DATES} datas.'})
+
+        dates = []
+        for value in values:
+            try:
+                parsed = parse_date(value)
+            except ValueError:
+                parsed = None
+            if parsed is None:
+                raise ValidationError({'date': 'Data inválida. Use o formato AAAA-MM-DD.'})
+            dates.append(parsed)
+        return dates
+
     def destroy(self, request, *args, **kwargs):
         """
         Sobrescreve o método destroy para implementar soft delete.
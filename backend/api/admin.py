@@ -4,6 +4,9 @@ from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from .users.models import User
 from .accounts.models import Account
 from .categories.models import Category
+from .transactions.models import Transaction, Transfer
+from .recurring.models import RecurringEntry
+from .credit_cards.models import CreditCard, CreditCardExpense
 
 
 @admin.register(User)
@@ -59,8 +62,74 @@ class CategoryAdmin(admin.ModelAdmin):
     """
     Admin para o modelo Category.
     """
-    list_display = ['name', 'user', 'type_category', 'subcategory', 'color', 'icon', 'is_archived', 'created_at']
+    list_display = ['full_name', 'user', 'type_category', 'subcategory', 'color', 'icon', 'is_archived', 'created_at']
     list_filter = ['type_category', 'is_archived', 'created_at']
-    search_fields = ['name', 'user__email', 'user__first_name']
+    list_select_related = ['user', 'subcategory']
+    search_fields = ['full_name', 'user__email', 'user__first_name']
     ordering = ['-created_at']
     readonly_fields = ['created_at', 'updated_at']
+
+
+@admin.register(Transaction)
+class TransactionAdmin(admin.ModelAdmin):
+    """
+    Admin para o modelo Transaction.
+    """
+    list_display = ['date', 'description', 'type', 'direction', 'amount', 'account', 'category', 'user', 'is_archived']
+    list_filter = ['type', 'is_archived', 'date']
+    list_select_related = ['account', 'category', 'user']
+    search_fields = ['description', 'user__email', 'account__name', 'category__full_name']
+    ordering = ['-date', '-id']
+    readonly_fields = ['created_at', 'updated_at']
+
+
+@admin.register(Transfer)
+class TransferAdmin(admin.ModelAdmin):
+    """
+    Admin para o modelo Transfer.
+    """
+    list_display = ['date', 'description', 'amount', 'from_account', 'to_account', 'user', 'is_archived']
+    list_filter = ['is_archived', 'date']
+    list_select_related = ['from_account', 'to_account', 'user']
+    search_fields = ['description', 'user__email', 'from_account__name', 'to_account__name']
+    ordering = ['-date', '-id']
+    readonly_fields = ['created_at', 'updated_at']
+
+
+@admin.register(RecurringEntry)
+class RecurringEntryAdmin(admin.ModelAdmin):
+    """
+    Admin para o modelo RecurringEntry.
+    """
+    list_display = ['description', 'type', 'amount', 'frequency', 'interval', 'start_date', 'end_date',
+                    'account', 'user', 'is_archived']
+    list_filter = ['type', 'frequency', 'is_archived']
+    list_select_related = ['account', 'user']
+    search_fields = ['description', 'user__email', 'account__name']
+    ordering = ['start_date', 'id']
+    readonly_fields = ['created_at', 'updated_at']
+
+
+@admin.register(CreditCard)
+class CreditCardAdmin(admin.ModelAdmin):
+    """
+    Admin para o modelo CreditCard.
+    """
+    list_display = ['name', 'user', 'limit', 'closing_day', 'due_day', 'is_archived', 'created_at']
+    list_filter = ['is_archived', 'created_at']
+    search_fields = ['name', 'user__email']
+    ordering = ['-created_at']
+    readonly_fields = ['created_at', 'updated_at']
+
+
+@admin.register(CreditCardExpense)
+class CreditCardExpenseAdmin(admin.ModelAdmin):
+    """
+    Admin para o modelo CreditCardExpense.
+    """
+    list_display = ['purchase_date', 'description', 'total_amount', 'installments_count', 'card', 'user', 'is_archived']
+    list_filter = ['is_archived', 'purchase_date']
+    list_select_related = ['card', 'user']
+    search_fields = ['description', 'user__email', 'card__name']
+    ordering = ['-purchase_date', '-id']
+    readonly_fields = ['created_at', 'updated_at']
@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'backend.api'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+
+        from backend.api.core import checks  # noqa: F401 (registra as verificações)
+        from backend.api.core.search.unaccent import register_sqlite_unaccent
+
+        connection_created.connect(register_sqlite_unaccent)
@@ -0,0 +1,157 @@
+"""
+Saldo das contas em datas passadas (para gráficos).
+
+Para cada data, parte do checkpoint do mês anterior e soma apenas os lançamentos do mês
+da data até ela (varredura limitada a um mês); no último dia de um mês fechado, o próprio
+checkpoint é a resposta. Sem checkpoint (mês ainda não fechado), parte do saldo atual e
+desconta os lançamentos posteriores à data.
+Uma série de datas é respondida com uma consulta de checkpoints e uma de somas diárias.
+"""
+from bisect import bisect_left, bisect_right
+from datetime import timedelta
+from decimal import Decimal
+from functools import reduce
+from itertools import accumulate
+from operator import or_
+
+from django.db.models import F, Q, Sum, Window
+from django.db.models.expressions import RowRange
+
+from .models import BalanceCheckpoint, month_end, month_start, previous_month, signed_amount
+
+# Quantidade máxima de datas por consulta
+MAX_BALANCE_DATES = 366
+
+
+def _merge_ranges(ranges):
+    """
+    Une intervalos de datas (início, fim ou None = sem limite) sobrepostos ou contíguos.
+    """
+    merged = []
+    for start, end in sorted(ranges, key=lambda item: item[0]):
+        if merged:
+            last_start, last_end = merged[-1]
+            if last_end is None or start <= last_end + timedelta(days=1):
+                if last_end is not None and (end is None or end > last_end):
+                    merged[-1] = (last_start, end)
+                continue
+        merged.append((start, end))
+    return merged
+
+
+def balances_as_of(accounts, dates):
+    """
+    Retorna {account_id: [(data, saldo), ...]} para as contas e datas informadas.
+    """
+    from backend.api.transactions.models import Transaction
+
+    dates = sorted(set(dates))
+    current = {account.pk: account.balance for account in accounts}
+    if not current or not dates:
+        return {account_id: [] for account_id in current}
+
+    month_ends = {day for day in dates if day == month_end(day)}
+    checkpoints = {
+        (account_id, month): balance
+        for account_id, month, balance in BalanceCheckpoint.objects.filter(
+            account_id__in=current,
+            month__in={previous_month(day) for day in dates} | {month_start(day) for day in month_ends}
+        ).values_list('account_id', 'month', 'balance')
+    }
+
+    def get_checkpoint(account_id, day):
+        """
+        Retorna (saldo inicial, início da varredura) para a data, ou None sem checkpoint.
+        """
+        if day in month_ends and (account_id, month_start(day)) in checkpoints:
+            return checkpoints[(account_id, month_start(day))], day + timedelta(days=1)
+        if (account_id, previous_month(day)) in checkpoints:
+            return checkpoints[(account_id, previous_month(day))], month_start(day)
+        return None
+
+    # Intervalos de lançamentos necessários: o mês da data (com checkpoint) ou tudo após a data (sem)
+    ranges = set()
+    for day in dates:
+        for account_id in current:
+            checkpoint = get_checkpoint(account_id, day)
+            if checkpoint is None:
+                ranges.add((day + timedelta(days=1), None))
+            elif checkpoint[1] <= day:
+                ranges.add((checkpoint[1], day))
+
+    daily = {}
+    if ranges:
+        condition = reduce(or_, (
+            Q(date__gte=start) if end is None else Q(date__range=(start, end))
+            for start, end in _merge_ranges(ranges)
+        ))
+        for account_id, day, total in (
+            Transaction.objects.filter(condition, account_id__in=current, is_archived=False)
+            .values('account_id', 'date').annotate(total=Sum(signed_amount())).order_by('account_id', 'date')
+            .values_list('account_id', 'date', 'total')
+        ):
+            days, totals = daily.setdefault(account_id, ([], []))
+            days.append(day)
+            totals.append(total)
+
+    result = {}
+    for account_id, balance in current.items():
+        days, totals = daily.get(account_id, ([], []))
+        prefix = [Decimal('0'), *accumulate(totals)]
+
+        def total_between(start, end):
+            lower = bisect_left(days, start)
+            upper = len(days) if end is None else bisect_right(days, end)
+            return prefix[upper] - prefix[lower] if upper > lower else Decimal('0')
+
+        series = []
+        for day in dates:
+            checkpoint = get_checkpoint(account_id, day)
+            if checkpoint is not None:
+                value = checkpoint[0] + total_between(checkpoint[1], day)
+            else:
+                value = balance - total_between(day + timedelta(days=1), None)
+            series.append((day, value))
+        result[account_id] = series
+
+    return result
+
+
+def running_balances(transactions):
+    """
+    Retorna {transaction_id: saldo da conta logo após o lançamento} para uma página de lançamentos.
+
+    O saldo acumulado é calculado no banco com Window(Sum) por conta, em ordem de (data, id),
+    sobre todos os lançamentos ativos das contas da página — não só os da página, então o
+    resultado não depende de filtros nem do cursor. A janela começa no início do mês do
+    lançamento mais antigo da página e parte do saldo do fim do mês anterior (checkpoint).
+    """
+    from backend.api.accounts.models import Account
+    from backend.api.transactions.models import Transaction
+
+    active = [item for item in transactions if not item.is_archived]
+    if not active:
+        return {}
+
+    start = month_start(min(item.date for item in active))
+    end = max(item.date for item in active)
+    accounts = Account.objects.filter(pk__in={item.account_id for item in active}).only('pk', 'balance')
+    opening = {
+        account_id: series[0][1]
+        for account_id, series in balances_as_of(accounts, [start - timedelta(days=1)]).items()
+    }
+
+    window = Window(
+        Sum(signed_amount()),
+        partition_by=[F('account_id')],
+        order_by=[F('date').asc(), F('id').asc()],
+        frame=RowRange(start=None, end=0),
+    )
+    rows = (
+        Transaction.objects
+        .filter(account_id__in=opening, is_archived=False, date__gte=start, date__lte=end)
+        .annotate(running=window)
+        .values_list('id', 'account_id', 'running')
+    )
+    page_ids = {item.pk for item in active}
+    return {pk: opening[account_id] + running for pk, account_id, running in rows if pk in page_ids}
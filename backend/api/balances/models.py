@@ -0,0 +1,171 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db import models, transaction
+from django.db.models import Case, F, Q, Sum, When
+from django.utils import timezone
+
+
+def month_start(value):
+    return value.replace(day=1)
+
+
+def month_end(month):
+    return month_start(month_start(month) + timedelta(days=32)) - timedelta(days=1)
+
+
+def previous_month(month):
+    return month_start(month_start(month) - timedelta(days=1))
+
+
+def signed_amount():
+    """
+    Expressão do efeito de um lançamento no saldo da conta (despesas e saídas negativas).
+    """
+    return Case(
+        When(Q(type='despesas') | Q(direction='saida'), then=-F('amount')),
+        default=F('amount'),
+        output_field=models.DecimalField(max_digits=14, decimal_places=2),
+    )
+
+
+class BalanceCheckpoint(models.Model):
+    """
+    Saldo de uma conta no fim de um mês já fechado.
+    Escrito ao fechar o mês (close_month) e corrigido a cada lançamento retroativo: o delta
+    do lançamento é somado a todos os checkpoints a partir do mês dele. O saldo em uma data
+    é o checkpoint do mês anterior mais os lançamentos do próprio mês até a data.
+    """
+    account = models.ForeignKey(
+        'api.Account',
+        on_delete=models.CASCADE,
+        related_name='balance_checkpoints',
+        verbose_name='Conta'
+    )
+    # Primeiro dia do mês; o saldo é o do último dia desse mês
+    month = models.DateField(verbose_name='Mês')
+    balance = models.DecimalField(max_digits=14, decimal_places=2, verbose_name='Saldo')
+
+    class Meta:
+        db_table = 'balance_checkpoint'
+        verbose_name = 'Saldo de fechamento'
+        verbose_name_plural = 'Saldos de fechamento'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['account', 'month'],
+                name='balance_checkpoint_unique_month'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.account_id} {self.month:%Y-%m} - {self.balance}"
+
+    @classmethod
+    def close_month(cls, month=None, batch_size=1000):
+        """
+        Grava (ou regrava) o checkpoint de todas as contas para o mês informado.
+        Por padrão, o último mês fechado (mês anterior ao atual). Retorna a quantidade gravada.
+        """
+        month = month_start(month) if month else previous_month(timezone.localdate())
+        return cls._write(month, month, batch_size=batch_size)
+
+    @classmethod
+    def rebuild(cls, account_id=None, batch_size=1000):
+        """
+        Reconstrói todos os checkpoints (de todas as contas ou de uma) até o último mês fechado,
+        a partir do mês anterior ao primeiro lançamento de cada conta. Retorna a quantidade gravada.
+        """
+        last_month = previous_month(timezone.localdate())
+        return cls._write(None, last_month, account_id=account_id, batch_size=batch_size)
+
+    @classmethod
+    def _write(cls, first_month, last_month, account_id=None, batch_size=1000):
+        from backend.api.accounts.models import Account
+        from backend.api.transactions.models import lock_accounts
+
+        accounts = Account.objects.order_by('pk')
+        if account_id is not None:
+            accounts = accounts.filter(pk=account_id)
+        account_ids = list(accounts.values_list('pk', flat=True))
+
+        written = 0
+        for start in range(0, len(account_ids), batch_size):
+            batch = account_ids[start:start + batch_size]
+            with transaction.atomic():
+                # Mesma ordem de bloqueio das escritas de lançamentos: saldo e checkpoints consistentes
+                balances = {pk: account.balance for pk, account in lock_accounts(batch).items()}
+                checkpoints = cls._compute(balances, first_month, last_month)
+
+                stale = cls.objects.filter(account_id__in=batch, month__lte=last_month)
+                if first_month is not None:
+                    stale = stale.filter(month__gte=first_month)
+                stale.delete()
+                cls.objects.bulk_create(checkpoints, batch_size=batch_size)
+            written += len(checkpoints)
+
+        return written
+
+    @classmethod
+    def _compute(cls, balances, first_month, last_month):
+        """
+        Calcula os checkpoints a partir do saldo atual, descontando os lançamentos posteriores
+        a cada mês: duas consultas agregadas por lote de contas.
+        """
+        from backend.api.transactions.models import Transaction
+
+        active = Transaction.objects.filter(account_id__in=balances, is_archived=False)
+        after = dict(
+            active.filter(date__gt=month_end(last_month))
+            .values('account_id').annotate(total=Sum(signed_amount())).order_by()
+            .values_list('account_id', 'total')
+        )
+        monthly = {}
+        months = active.filter(month__lte=last_month)
+        if first_month is not None:
+            months = months.filter(month__gte=first_month)
+        for account_id, month, total in (
+            months.values('account_id', 'month').annotate(total=Sum(signed_amount())).order_by()
+            .values_list('account_id', 'month', 'total')
+        ):
+            monthly.setdefault(account_id, {})[month] = total
+
+        checkpoints = []
+        for account_id, balance in balances.items():
+            totals = monthly.get(account_id, {})
+            first = first_month or previous_month(min(totals, default=last_month))
+
+            running = balance - after.get(account_id, Decimal('0'))
+            month = last_month
+            while month >= first:
+                checkpoints.append(cls(account_id=account_id, month=month, balance=running))
+                running -= totals.get(month, Decimal('0'))
+                month = previous_month(month)
+
+        return checkpoints
+
+
+def checkpoint_deltas(original, current):
+    """
+    Combina a entrada anterior e a atual em {(account_id, mês): delta}.
+    Cada entrada é (account_id, mês, delta) ou None quando o lançamento não afeta o saldo.
+    """
+    deltas = {}
+    for entry, sign in ((original, -1), (current, 1)):
+        if entry is None:
+            continue
+        account_id, month, amount = entry
+        key = (account_id, month)
+        deltas[key] = deltas.get(key, Decimal('0')) + sign * amount
+
+    return {key: delta for key, delta in deltas.items() if delta}
+
+
+def apply_checkpoint_deltas(deltas):
+    """
+    Corrige os checkpoints do mês do lançamento em diante (balance = balance + delta).
+    Meses ainda sem checkpoint não precisam de correção: serão calculados ao fechar.
+    """
+    for account_id, month in sorted(deltas):
+        BalanceCheckpoint.objects.filter(account_id=account_id, month__gte=month).update(
+            balance=F('balance') + deltas[(account_id, month)]
+        )
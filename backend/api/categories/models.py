@@ -1,9 +1,17 @@
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import F, Value
+from django.db.models.functions import Concat
 
+from backend.api.core.mixins.unique_constraint import UniqueConstraintMixin
+from backend.api.dashboard.cache import invalidate_dashboard
 
-class Category(models.Model):
+# Separador entre os níveis do caminho completo da categoria
+PATH_SEPARATOR = ' > '
+
+
+class Category(UniqueConstraintMixin, models.Model):
     # Tipos de categoria disponíveis
     CATEGORY_TYPES = [
         ('despesas', 'Despesas'),
@@ -24,6 +32,8 @@ class Category(models.Model):
         verbose_name='Parente'
     )
     name = models.CharField(max_length=50)
+    # Caminho completo desnormalizado ("Pai > Filha"), mantido no save
+    full_name = models.CharField(max_length=255, blank=True, default='', editable=False)
     color = models.CharField(max_length=7)  # Formato hex: #RRGGBB
     icon = models.CharField(max_length=20)
     type_category = models.CharField(max_length=10, choices=CATEGORY_TYPES)
@@ -41,54 +51,111 @@ class Category(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Mensagens para violações de unicidade detectadas pelo banco ao salvar
+    unique_error_messages = {
+        ('user', 'relative', 'name', 'subcategory'): {
+            'name': 'Você já possui uma categoria com este nome. Use outro nome ou escolha outra categoria pai.'
+        },
+        ('user', 'relative', 'name'): {
+            'name': 'Você já possui uma categoria com este nome. Use outro nome ou escolha outra categoria pai.'
+        },
+    }
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Guarda o type_category e o nome carregados do banco para validar alterações
+        e detectar renomeações sem nova consulta.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = {
+            field: value for field, value in zip(field_names, values)
+            if field in ('type_category', 'name')
+        }
+        return instance
+
+    def _get_validation_data(self):
+        """
+        Retorna os dados da categoria pai e os valores originais (type_category, name)
+        usando no máximo uma consulta. A categoria pai já carregada na instância é reaproveitada.
+        """
+        fields = ('id', 'subcategory_id', 'user_id', 'relative_id', 'type_category', 'name', 'full_name')
+        parent = None
+        original = getattr(self, '_loaded_values', None) if self.pk else None
+        if original is not None and len(original) < 2:
+            original = None
+
+        ids = []
+        if self.subcategory_id:
+            if self._meta.get_field('subcategory').is_cached(self):
+                parent = {field: getattr(self.subcategory, field) for field in fields}
+            else:
+                ids.append(self.subcategory_id)
+        if self.pk and original is None:
+            ids.append(self.pk)
+
+        if ids:
+            rows = {row['id']: row for row in Category.objects.filter(pk__in=ids).values(*fields)}
+            if parent is None and self.subcategory_id:
+                parent = rows.get(self.subcategory_id)
+            if self.pk and original is None and self.pk in rows:
+                original = rows[self.pk]
+
+        return parent, original
+
     def clean(self):
         """
-        Valida se já existe categoria com mesmo nome e mesma subcategoria para o mesmo usuário.
         Validação o nível máximo de subcategorias em 1.
+        A unicidade do nome é verificada pelo banco ao salvar (unique_error_messages).
         """
-        existing = Category.objects.filter(
-            user=self.user,
-            relative=self.relative,
-            name=self.name,
-            subcategory=self.subcategory
-        )
-
-        if self.pk:  # Se for update, exclui o próprio registro da validação
-            existing = existing.exclude(pk=self.pk)
-
-        if existing.exists():
-            raise ValidationError({
-                'name': 'Você já possui uma categoria com este nome. Use outro nome ou escolha outra categoria pai.'
-            })
+        self._validate_hierarchy(*self._get_validation_data())
 
-        if self.subcategory and self.subcategory.subcategory:
+    def _validate_hierarchy(self, parent, original):
+        if parent and parent['subcategory_id']:
             raise ValidationError({
                 'subcategory': 'Não é permitido ter mais de um nível de subcategoria.'
             })
 
         # Valida se a subcategoria pertence ao mesmo usuário e relative
-        if self.subcategory and (self.subcategory.user != self.user or self.subcategory.relative != self.relative):
+        if parent and (parent['user_id'] != self.user_id or parent['relative_id'] != self.relative_id):
             raise ValidationError({
                 'subcategory': 'A categoria pai deve pertencer ao mesmo usuário e perfil.'
             })
 
         # Valida se o tipo da subcategoria é igual ao tipo da categoria pai
-        if self.subcategory and self.type_category != self.subcategory.type_category:
+        if parent and self.type_category != parent['type_category']:
             raise ValidationError({
                 'type_category': 'O tipo da subcategoria deve ser igual ao tipo da categoria pai.'
             })
 
         # Impede qualquer alteração de type_category após a criação da categoria
-        if self.pk:
-            original = Category.objects.get(pk=self.pk)
-            if original.type_category != self.type_category:
-                raise ValidationError({
-                    'type_category': 'Não é possível alterar o tipo de uma categoria após sua criação.'
-                })
+        if original and original['type_category'] != self.type_category:
+            raise ValidationError({
+                'type_category': 'Não é possível alterar o tipo de uma categoria após sua criação.'
+            })
 
     def save(self, *args, **kwargs):
-        self.clean()
-        return super().save(*args, **kwargs)
+        parent, original = self._get_validation_data()
+        self._validate_hierarchy(parent, original)
+
+        # Caminho materializado: "Pai > Filha" (apenas um nível de subcategoria)
+        self.full_name = f"{parent['full_name'] or parent['name']}{PATH_SEPARATOR}{self.name}" if parent else self.name
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'name' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'full_name'}
+
+        result = super().save(*args, **kwargs)
+        self._loaded_values = {'type_category': self.type_category, 'name': self.name}
+
+        # Renomear uma categoria atualiza em lote o caminho das filhas
+        if original and original['name'] != self.name:
+            Category.objects.filter(subcategory_id=self.pk).update(
+                full_name=Concat(Value(f'{self.full_name}{PATH_SEPARATOR}'), F('name'))
+            )
+
+        invalidate_dashboard(self.relative_id)
+        return result
 
     def delete(self, *args, **kwargs):
         """
@@ -97,16 +164,7 @@ class Category(models.Model):
         raise NotImplementedError("Não é permitido deletar categorias.")
 
     def __str__(self):
-        if self.subcategory:
-            hierarchy = []
-            parent = self.subcategory
-            while parent:
-                hierarchy.append(parent.name)
-                parent = parent.subcategory
-            hierarchy.reverse()
-            hierarchy.append(self.name)
-            return " > ".join(hierarchy)
-        return self.name
+        return self.full_name or self.name
 
     class Meta:
         db_table = 'category'
@@ -114,3 +172,25 @@ class Category(models.Model):
         verbose_name_plural = 'Categorias'
         # Garante que não haja categorias com nomes duplicados no mesmo nível para o mesmo usuário e perfil
         unique_together = ['user', 'relative', 'name', 'subcategory']
+        indexes = [
+            # Listagem padrão e árvore: categorias ativas do perfil ordenadas por nome (id desempata o cursor)
+            models.Index(
+                fields=['user', 'relative', 'name', 'id'],
+                condition=models.Q(is_archived=False),
+                name='category_active_name_idx'
+            ),
+            # Listagem sem X-Relative-Id: categorias ativas de todos os perfis do usuário
+            models.Index(
+                fields=['user', 'name', 'id'],
+                condition=models.Q(is_archived=False),
+                name='category_user_active_name_idx'
+            ),
+        ]
+        constraints = [
+            # NULL não é considerado igual no unique_together, então categorias raiz precisam de constraint própria
+            models.UniqueConstraint(
+                fields=['user', 'relative', 'name'],
+                condition=models.Q(subcategory__isnull=True),
+                name='category_unique_root_name'
+            ),
+        ]
@@ -1,9 +1,12 @@
 from rest_framework import serializers
 
+from backend.api.core.mixins.relative_scope import (RelativeScopedSerializerMixin,
+                                                   resolve_relative_id)
+
 from .models import Category
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(RelativeScopedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = '__all__'
@@ -15,17 +18,8 @@ class CategorySerializer(serializers.ModelSerializer):
         """
         validated_data['user'] = self.context['request'].user
 
-        # Busca o relative_id do header
-        relative_id = self.context['request'].headers.get('X-Relative-Id')
-        if relative_id:
-            try:
-                from backend.api.relatives.models import Relative
-                relative = Relative.objects.get(id=relative_id, user=validated_data['user'])
-                validated_data['relative'] = relative
-            except Relative.DoesNotExist:
-                raise serializers.ValidationError("Perfil não encontrado ou não pertence ao usuário.")
-        else:
-            raise serializers.ValidationError("Header X-Relative-Id é obrigatório.")
+        # Perfil do header já resolvido e autorizado para este request
+        validated_data['relative_id'] = self.get_request_relative_id()
 
         return super().create(validated_data)
 
@@ -60,14 +54,14 @@ class CategorySerializer(serializers.ModelSerializer):
         # (também validado no modelo, sendo uma boa prática validar aqui também)
         if value and hasattr(self, 'context') and 'request' in self.context:
             user = self.context['request'].user
-            relative_id = self.context['request'].headers.get('X-Relative-Id')
+            relative_id = resolve_relative_id(self.context['request'])
 
-            if value.user != user:
+            if value.user_id != user.pk:
                 raise serializers.ValidationError(
                     "A categoria pai deve pertencer ao mesmo usuário."
                 )
 
-            if relative_id and str(value.relative.id) != relative_id:
+            if relative_id is not None and value.relative_id != relative_id:
                 raise serializers.ValidationError(
                     "A categoria pai deve pertencer ao mesmo perfil."
                 )
@@ -0,0 +1,38 @@
+import hashlib
+import json
+
+# Campos de cada nó da árvore de categorias
+TREE_FIELDS = ('id', 'name', 'color', 'icon', 'type_category', 'is_archived', 'subcategory_id')
+
+
+def build_category_tree(rows):
+    """
+    Monta a árvore de categorias em memória a partir das linhas de uma única consulta.
+    As linhas devem vir ordenadas; a ordem é mantida em cada nível.
+    Subcategorias cuja categoria pai não está no resultado (ex: pai arquivado filtrado)
+    são exibidas na raiz.
+    """
+    nodes = {}
+    for row in rows:
+        node = {field: row[field] for field in TREE_FIELDS if field != 'subcategory_id'}
+        node['subcategory'] = row['subcategory_id']
+        node['children'] = []
+        nodes[row['id']] = node
+
+    roots = []
+    for node in nodes.values():
+        parent = nodes.get(node['subcategory'])
+        if parent is not None:
+            parent['children'].append(node)
+        else:
+            roots.append(node)
+
+    return roots
+
+
+def get_tree_etag(tree):
+    """
+    Gera o ETag da árvore a partir do seu conteúdo serializado.
+    """
+    content = json.dumps(tree, sort_keys=True, default=str).encode()
+    return f'"{hashlib.md5(content).hexdigest()}"'
@@ -1,15 +1,20 @@
+from django.utils.http import parse_etags
 from rest_framework import status, viewsets
-from rest_framework.exceptions import ValidationError
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from backend.api.relatives.models import Relative
+from backend.api.core.mixins.export import StreamingExportMixin
+from backend.api.core.mixins.relative_scope import RelativeScopedViewSetMixin
+from backend.api.core.pagination.keyset import KeysetPagination
+from backend.api.core.search.unaccent import filter_name_search
 
 from .models import Category
 from .serializers import CategorySerializer
+from .tree import TREE_FIELDS, build_category_tree, get_tree_etag
 
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(RelativeScopedViewSetMixin, StreamingExportMixin, viewsets.ModelViewSet):
     """
     ViewSet para operações CRUD da entidade Category.
     Permite criar, listar, recuperar, atualizar e arquivar categorias e subcategorias.
@@ -17,6 +22,10 @@ class CategoryViewSet(viewsets.ModelViewSet):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
+    export_fields = ('id', 'relative_id', 'name', 'full_name', 'type_category', 'subcategory_id', 'color',
+                     'icon', 'is_archived', 'created_at', 'updated_at')
+    export_filename = 'categorias'
 
     def get_queryset(self):
         """
@@ -28,30 +37,21 @@ class CategoryViewSet(viewsets.ModelViewSet):
         queryset = Category.objects.filter(user=self.request.user)
 
         # Filtro por perfil se X-Relative-Id estiver presente no header
-        relative_id = self.request.headers.get('X-Relative-Id')
-        if relative_id:
-            try:
-                relative = Relative.objects.get(id=relative_id, user=self.request.user)
-                queryset = queryset.filter(relative=relative)
-            except Relative.DoesNotExist:
-                # Se perfil não existir, retorna um erro
-                raise ValidationError({
-                    'X-Relative-Id': f'Perfil com ID {relative_id} não encontrado ou não pertence ao usuário. Por favor limpar os Cookies do Navegador.'
-                })
-
-        # Filtro por is_archived aplicado apenas na listagem
+        queryset = self.filter_by_relative(queryset)
+
+        # Filtro por is_archived aplicado apenas na listagem (e na exportação)
         # Retrieve, update e destroy devem funcionar independente do status de arquivamento
-        if self.action == 'list':
+        if self.action in ('list', 'export'):
             only_archived = self.request.query_params.get('only_archived', 'false')
             if only_archived.lower() == 'true':
                 queryset = queryset.filter(is_archived=True)
             else:
                 queryset = queryset.filter(is_archived=False)
 
-        # Se houver parâmetro 'name', filtra por nome
+        # Se houver parâmetro 'name', filtra por nome (sem diferenciar acentos)
         name = self.request.query_params.get('name', None)
         if name:
-            queryset = queryset.filter(name__icontains=name)
+            queryset = filter_name_search(queryset, name)
 
         return queryset.order_by('name')
 
@@ -88,3 +88,27 @@ class CategoryViewSet(viewsets.ModelViewSet):
             {"detail": message},
             status=status.HTTP_200_OK
         )
+
+    @action(detail=False, methods=['get'])
+    def tree(self, request):
+        """
+        Retorna todas as categorias do perfil (X-Relative-Id) como árvore aninhada.
+        Montada a partir de uma única consulta; arquivadas só com ?include_archived=true.
+        Suporta revalidação via ETag / If-None-Match (304).
+        """
+        queryset = Category.objects.filter(
+            user=request.user,
+            relative_id=self.require_relative_id()
+        )
+
+        include_archived = request.query_params.get('include_archived', 'false')
+        if include_archived.lower() != 'true':
+            queryset = queryset.filter(is_archived=False)
+
+        tree = build_category_tree(queryset.order_by('name', 'id').values(*TREE_FIELDS))
+        etag = get_tree_etag(tree)
+
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+
+        return Response(tree, headers={'ETag': etag})
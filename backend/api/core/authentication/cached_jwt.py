@@ -0,0 +1,27 @@
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+from backend.api.users.cache import get_cached_auth_user, set_cached_auth_user
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    Autenticação JWT que evita buscar o usuário no banco a cada requisição.
+    O usuário é guardado em cache por (user_id, jti) com TTL curto e descartado
+    sempre que o usuário é salvo (desativação, troca de senha, edição de perfil).
+    """
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        jti = validated_token.get(api_settings.JTI_CLAIM)
+
+        if user_id is None or jti is None:
+            return super().get_user(validated_token)
+
+        user = get_cached_auth_user(user_id, jti)
+        if user is None:
+            # Apenas usuários aprovados pelas validações do SimpleJWT (ex: ativos) vão para o cache
+            user = super().get_user(validated_token)
+            set_cached_auth_user(user_id, jti, user)
+
+        return user
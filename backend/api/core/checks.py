@@ -0,0 +1,16 @@
+from django.conf import settings
+from django.core.checks import Warning, register
+
+
+@register()
+def check_shared_cache(app_configs, **kwargs):
+    """
+    Em produção as versões de cache (dashboard, autenticação) precisam valer para todos os workers.
+    """
+    if settings.DEBUG or settings.TESTING or settings.CACHE_IS_SHARED:
+        return []
+    return [Warning(
+        'CACHE_BACKEND=locmem keeps one cache per process: invalidations do not reach other workers.',
+        hint='Set CACHE_BACKEND=redis or memcached and CACHE_LOCATION.',
+        id='api.W001',
+    )]
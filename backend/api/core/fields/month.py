@@ -0,0 +1,27 @@
+from django.db import models
+
+
+class MonthField(models.DateField):
+    """
+    Primeiro dia do mês da data local de outro campo (source), gravado junto com o registro.
+    Preenchido no pre_save, inclusive em bulk_create: agregações "por mês" agrupam e filtram
+    por esta coluna indexada em vez de aplicar DATE_TRUNC/TruncMonth linha a linha.
+    """
+
+    def __init__(self, *args, source='date', **kwargs):
+        self.source = source
+        kwargs.setdefault('editable', False)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs['source'] = self.source
+        kwargs.pop('editable', None)
+        return name, path, args, kwargs
+
+    def pre_save(self, model_instance, add):
+        value = getattr(model_instance, self.source)
+        if value is not None:
+            value = self.to_python(value).replace(day=1)
+        setattr(model_instance, self.attname, value)
+        return value
@@ -0,0 +1,20 @@
+from rest_framework.decorators import action
+
+from backend.api.core.export.streaming import EXPORT_FORMATS, streaming_export_response
+
+
+class StreamingExportMixin:
+    """
+    Mixin para ViewSets que adiciona GET .../export/csv/ e .../export/jsonl/.
+    Exporta o mesmo queryset filtrado da listagem, sem paginação, em streaming.
+
+    A view deve definir export_fields (campos/lookups do values_list) e export_filename,
+    e tratar a action 'export' como a 'list' no get_queryset.
+    """
+    export_fields = ()
+    export_filename = 'export'
+
+    @action(detail=False, methods=['get'], url_path=f"export/(?P<export_format>{'|'.join(EXPORT_FORMATS)})")
+    def export(self, request, export_format=None):
+        queryset = self.filter_queryset(self.get_queryset())
+        return streaming_export_response(queryset, self.export_fields, self.export_filename, export_format)
@@ -0,0 +1,90 @@
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from backend.api.relatives.cache import is_owned_relative
+
+RELATIVE_HEADER = 'X-Relative-Id'
+
+
+def resolve_relative_id(request):
+    """
+    Resolve e autoriza o header X-Relative-Id uma única vez por requisição.
+    O resultado fica guardado no próprio request (request.relative_id), que é
+    compartilhado entre a view e o serializer.
+    Retorna o id do perfil, ou None se o header estiver ausente ou inválido.
+    """
+    if not hasattr(request, 'relative_id'):
+        raw_value = request.headers.get(RELATIVE_HEADER)
+        relative_id = None
+
+        if raw_value:
+            try:
+                candidate = int(raw_value)
+            except (TypeError, ValueError):
+                candidate = None
+
+            if candidate is not None and is_owned_relative(request.user.pk, candidate):
+                relative_id = candidate
+
+        request.relative_header = raw_value
+        request.relative_id = relative_id
+
+    return request.relative_id
+
+
+class RelativeScopedViewSetMixin:
+    """
+    Mixin para ViewSets com escopo de perfil (X-Relative-Id).
+    Filtra o queryset pelo perfil do header, quando informado.
+    """
+
+    def get_relative_id(self):
+        """
+        Retorna o id do perfil do header, validando que pertence ao usuário.
+        """
+        relative_id = resolve_relative_id(self.request)
+        if self.request.relative_header and relative_id is None:
+            # Se perfil não existir, retorna um erro
+            raise ValidationError({
+                RELATIVE_HEADER: f'Perfil com ID {self.request.relative_header} não encontrado ou não pertence ao usuário. Por favor limpar os Cookies do Navegador.'
+            })
+        return relative_id
+
+    def require_relative_id(self):
+        """
+        Retorna o id do perfil do header, exigindo que esteja presente.
+        """
+        relative_id = self.get_relative_id()
+        if relative_id is None:
+            raise ValidationError({RELATIVE_HEADER: 'Header X-Relative-Id é obrigatório.'})
+        return relative_id
+
+    def filter_by_relative(self, queryset):
+        """
+        Filtra o queryset pelo perfil do header, se presente.
+        """
+        relative_id = self.get_relative_id()
+        if relative_id is not None:
+            queryset = queryset.filter(relative_id=relative_id)
+        return queryset
+
+
+class RelativeScopedSerializerMixin:
+    """
+    Mixin para serializers que associam o registro ao perfil do header na criação.
+    Reaproveita o perfil já resolvido pela view no mesmo request.
+    """
+
+    def get_request_relative_id(self):
+        """
+        Retorna o id do perfil do header, exigindo que esteja presente e seja válido.
+        """
+        request = self.context['request']
+        relative_id = resolve_relative_id(request)
+
+        if not request.relative_header:
+            raise serializers.ValidationError("Header X-Relative-Id é obrigatório.")
+        if relative_id is None:
+            raise serializers.ValidationError("Perfil não encontrado ou não pertence ao usuário.")
+
+        return relative_id
@@ -0,0 +1,119 @@
+import re
+from contextlib import contextmanager
+
+from django.core.exceptions import ValidationError
+from django.db import DEFAULT_DB_ALIAS, IntegrityError, connections, router, transaction
+from rest_framework import serializers
+
+# SQLite: 'UNIQUE constraint failed: account.user_id, account.relative_id, account.name'
+SQLITE_KEY_PATTERN = re.compile(r'UNIQUE constraint failed: (?P<columns>.+)$')
+
+# Colunas de cada constraint unique por (banco, tabela), lidas por introspecção na primeira violação
+_unique_columns_cache = {}
+
+
+def get_violated_constraint(exc):
+    """
+    Nome da constraint violada informado pelo driver do PostgreSQL (diag.constraint_name).
+    Não depende do idioma das mensagens do servidor (lc_messages).
+    """
+    diag = getattr(exc.__cause__, 'diag', None)
+    return getattr(diag, 'constraint_name', None)
+
+
+def get_unique_constraint_columns(model, using=DEFAULT_DB_ALIAS):
+    """
+    Retorna {nome da constraint: frozenset das colunas} das constraints/índices unique da tabela.
+    """
+    connection = connections[using]
+    key = (using, model._meta.db_table)
+    if key not in _unique_columns_cache:
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, model._meta.db_table)
+        _unique_columns_cache[key] = {
+            name: frozenset(info['columns']) for name, info in constraints.items() if info['unique']
+        }
+    return _unique_columns_cache[key]
+
+
+def get_violated_columns(exc, model=None, using=DEFAULT_DB_ALIAS):
+    """
+    Identifica as colunas da constraint unique violada.
+    No PostgreSQL usa o nome da constraint (diag) e as colunas da tabela do model;
+    no SQLite, que não informa o nome, extrai as colunas da mensagem.
+    Retorna um frozenset com os nomes das colunas, ou None se não for possível identificar.
+    """
+    constraint = get_violated_constraint(exc)
+    if constraint:
+        if model is None:
+            return None
+        return get_unique_constraint_columns(model, using).get(constraint)
+
+    match = SQLITE_KEY_PATTERN.search(str(exc))
+    if match:
+        return frozenset(
+            column.strip().split('.')[-1] for column in match.group('columns').split(',')
+        )
+
+    return None
+
+
+class UniqueConstraintMixin:
+    """
+    Mixin de modelo que delega a verificação de unicidade ao banco.
+    O registro é gravado diretamente e a violação de uma constraint conhecida
+    (declarada em unique_error_messages) é traduzida no ValidationError do modelo,
+    evitando o SELECT prévio e a condição de corrida entre a verificação e o INSERT.
+
+    Exemplo:
+        unique_error_messages = {
+            ('user', 'name'): {'name': 'Você já possui um registro com este nome.'},
+        }
+    """
+    unique_error_messages = {}
+
+    def save(self, *args, **kwargs):
+        using = kwargs.get('using') or router.db_for_write(self.__class__, instance=self)
+        connection = transaction.get_connection(using)
+
+        try:
+            # Dentro de uma transação o erro invalidaria o bloco inteiro, então usa savepoint
+            if connection.in_atomic_block:
+                with transaction.atomic(using=using):
+                    return super().save(*args, **kwargs)
+            return super().save(*args, **kwargs)
+        except IntegrityError as exc:
+            errors = self.get_unique_error(exc, using)
+            if errors is None:
+                raise
+            raise ValidationError(errors) from exc
+
+    @classmethod
+    def get_unique_error(cls, exc, using=DEFAULT_DB_ALIAS):
+        """
+        Retorna as mensagens de erro da constraint violada, ou None se ela não for conhecida.
+        """
+        columns = get_violated_columns(exc, cls, using)
+        if columns is None:
+            return None
+
+        for fields, errors in cls.unique_error_messages.items():
+            expected = frozenset(cls._meta.get_field(field).column for field in fields)
+            if expected == columns:
+                return errors
+
+        return None
+
+
+@contextmanager
+def field_errors_from_model():
+    """
+    Converte erros de campo levantados pelo modelo ao salvar (ex: unicidade)
+    em erros de campo do serializer, mantendo o formato de resposta do DRF.
+    """
+    try:
+        yield
+    except ValidationError as exc:
+        if not hasattr(exc, 'error_dict'):
+            raise
+        raise serializers.ValidationError(exc.message_dict) from exc
@@ -0,0 +1,147 @@
+import base64
+import json
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(PageNumberPagination):
+    """
+    Paginação opcional por cursor (keyset), sem COUNT(*) e sem OFFSET.
+    Por padrão se comporta como PageNumberPagination; com ?pagination=cursor
+    (ou ao receber um ?cursor=) pagina pela chave composta keyset_ordering
+    (campos não nulos; prefixo "-" para ordem descendente),
+    de forma que páginas profundas custam o mesmo que a primeira.
+
+    Resposta no modo cursor: { "next", "previous", "results": [...] }
+
+    No modo cursor a ordem é sempre keyset_ordering: ?ordering= (OrderingFilter)
+    é recusado com 400, pois o cursor só é válido para a ordem da chave.
+    """
+    keyset_ordering = ('name', 'id')
+    mode_query_param = 'pagination'
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering_query_param = api_settings.ORDERING_PARAM
+    invalid_cursor_message = 'Cursor inválido.'
+    ordering_not_allowed_message = 'A ordenação não pode ser alterada na paginação por cursor.'
+
+    def is_keyset_request(self, request):
+        return (
+            request.query_params.get(self.mode_query_param) == 'cursor'
+            or self.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset_mode = self.is_keyset_request(request)
+        if not self.keyset_mode:
+            return super().paginate_queryset(queryset, request, view)
+
+        if self.ordering_query_param in request.query_params:
+            raise ValidationError({self.ordering_query_param: [self.ordering_not_allowed_message]})
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request, queryset.model)
+        reverse = bool(cursor and cursor.get('reverse'))
+
+        ordering = [self.invert_ordering(field) if reverse else field for field in self.keyset_ordering]
+        queryset = queryset.order_by(*ordering)
+        if cursor:
+            queryset = queryset.filter(self.build_keyset_filter(cursor['position'], reverse))
+
+        # Busca um registro a mais para saber se existe próxima página
+        results = list(queryset[:page_size + 1])
+        has_more = len(results) > page_size
+        results = results[:page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_next = cursor is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+
+        self.page = results
+        return results
+
+    @staticmethod
+    def invert_ordering(field):
+        return field[1:] if field.startswith('-') else f'-{field}'
+
+    def build_keyset_filter(self, position, reverse):
+        """
+        Monta a comparação lexicográfica (a, b) > (x, y) como
+        a > x OR (a = x AND b > y), compatível com os índices compostos.
+        Campos descendentes ("-date") usam a comparação invertida.
+        """
+        condition = Q()
+        equals = {}
+        for field, value in zip(self.keyset_ordering, position):
+            descending = field.startswith('-')
+            name = field.lstrip('-')
+            lookup = 'lt' if descending != reverse else 'gt'
+            condition |= Q(**equals, **{f'{name}__{lookup}': value})
+            equals[name] = value
+        return condition
+
+    def decode_cursor(self, request, model):
+        """
+        Decodifica o cursor e converte cada valor da posição com o to_python() do campo
+        correspondente, para que valores de tipo errado resultem em 404 e não em erro no filtro.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            position = cursor['position']
+            if not isinstance(position, list) or len(position) != len(self.keyset_ordering):
+                raise ValueError
+            if None in position:
+                raise ValueError
+            cursor['position'] = [
+                model._meta.get_field(field.lstrip('-')).to_python(value)
+                for field, value in zip(self.keyset_ordering, position)
+            ]
+        except (TypeError, ValueError, KeyError, AttributeError, UnicodeDecodeError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+        return cursor
+
+    def encode_cursor(self, instance, reverse):
+        position = [getattr(instance, field.lstrip('-')) for field in self.keyset_ordering]
+        payload = json.dumps({'position': position, 'reverse': reverse}, cls=DjangoJSONEncoder)
+        encoded = base64.urlsafe_b64encode(payload.encode()).decode()
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, encoded)
+
+    def get_keyset_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_keyset_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.request.build_absolute_uri(), self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        if not self.keyset_mode:
+            return super().get_paginated_response(data)
+
+        return Response({
+            'next': self.get_keyset_next_link(),
+            'previous': self.get_keyset_previous_link(),
+            'results': data,
+        })
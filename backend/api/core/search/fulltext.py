@@ -0,0 +1,46 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connections
+from django.db.models import F, FloatField, Value
+
+from .unaccent import filter_name_search
+
+# Configuração de busca textual criada na migration 0016: dicionário português com unaccent
+SEARCH_CONFIG = 'portuguese_unaccent'
+
+SEARCH_TERM_MAX_WORDS = 8
+
+
+def search_words(term):
+    """
+    Palavras do texto digitado: apenas letras e números passam para a consulta.
+    """
+    return re.findall(r'\w+', term or '')[:SEARCH_TERM_MAX_WORDS]
+
+
+def build_prefix_query(words):
+    """
+    tsquery com prefixo em cada palavra (["merc", "pao"] -> "merc:* & pao:*"),
+    para que trechos iniciais também encontrem a palavra.
+    """
+    return ' & '.join(f'{word}:*' for word in words)
+
+
+def filter_full_text_search(queryset, term, vector_field='search_vector', fallback_field='description'):
+    """
+    Filtra pela coluna tsvector (índice GIN) e anota a relevância em search_rank.
+    No SQLite (modo degradado, sem tsvector) busca o trecho do texto sem acentos e a relevância é 0.
+    """
+    words = search_words(term)
+    no_rank = Value(0.0, output_field=FloatField())
+    if not words:
+        return queryset.annotate(search_rank=no_rank).none()
+
+    if connections[queryset.db].vendor != 'postgresql':
+        for word in words:
+            queryset = filter_name_search(queryset, word, field=fallback_field)
+        return queryset.annotate(search_rank=no_rank)
+
+    query = SearchQuery(build_prefix_query(words), config=SEARCH_CONFIG, search_type='raw')
+    return queryset.filter(**{vector_field: query}).annotate(search_rank=SearchRank(F(vector_field), query))
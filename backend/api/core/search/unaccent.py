@@ -0,0 +1,45 @@
+import unicodedata
+
+from django.db import models
+from django.db.models.functions import Upper
+
+# Função SQL IMMUTABLE que envolve unaccent(), permitindo usá-la em índices (PostgreSQL)
+UNACCENT_FUNCTION = 'immutable_unaccent'
+
+
+def strip_accents(value):
+    """
+    Remove acentos de um texto ("Saúde" -> "Saude").
+    """
+    if value is None:
+        return None
+    normalized = unicodedata.normalize('NFKD', value)
+    return ''.join(char for char in normalized if not unicodedata.combining(char))
+
+
+class ImmutableUnaccent(models.Func):
+    """
+    immutable_unaccent(<campo>): no PostgreSQL é a função criada na migration 0005
+    (unaccent + pg_trgm); no SQLite é registrada em Python a cada conexão.
+    """
+    function = UNACCENT_FUNCTION
+    output_field = models.TextField()
+
+
+def register_sqlite_unaccent(sender, connection, **kwargs):
+    """
+    Registra immutable_unaccent nas conexões SQLite (modo degradado: sem índice).
+    """
+    if connection.vendor == 'sqlite':
+        connection.connection.create_function(UNACCENT_FUNCTION, 1, strip_accents, deterministic=True)
+
+
+def filter_name_search(queryset, term, field='name'):
+    """
+    Filtra por trecho do nome sem diferenciar maiúsculas nem acentos.
+    A expressão UPPER(immutable_unaccent(name)) LIKE '%TERMO%' é a mesma dos índices
+    GIN trigram, então no PostgreSQL a busca usa o índice em vez de varrer a tabela.
+    """
+    return queryset.alias(
+        search_name=Upper(ImmutableUnaccent(field))
+    ).filter(search_name__contains=strip_accents(term).upper())
@@ -0,0 +1,54 @@
+"""
+Ciclo de fatura do cartão: em qual fatura cada compra/parcela cai.
+
+Cada fatura é identificada pelo mês de fechamento (primeiro dia do mês). A fatura fecha
+no closing_day; compras a partir do dia de fechamento entram na fatura seguinte.
+Dias maiores que o último dia do mês são limitados a ele (ex: fechamento 31 em fevereiro).
+"""
+from calendar import monthrange
+from datetime import date
+from decimal import ROUND_DOWN, Decimal
+
+
+def add_months(month, count):
+    """
+    Soma meses a um mês (primeiro dia do mês).
+    """
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def clamp_day(month, day):
+    """
+    Data do dia no mês, limitada ao último dia do mês.
+    """
+    return month.replace(day=min(day, monthrange(month.year, month.month)[1]))
+
+
+def invoice_month_for(purchase_date, closing_day):
+    """
+    Mês da fatura em que uma compra feita em purchase_date é cobrada.
+    """
+    month = purchase_date.replace(day=1)
+    if purchase_date >= clamp_day(month, closing_day):
+        return add_months(month, 1)
+    return month
+
+
+def invoice_dates(invoice_month, closing_day, due_day):
+    """
+    Retorna (data de fechamento, data de vencimento) da fatura.
+    O vencimento cai no mesmo mês do fechamento se due_day for posterior a closing_day,
+    senão no mês seguinte.
+    """
+    closing_date = clamp_day(invoice_month, closing_day)
+    due_month = invoice_month if due_day > closing_day else add_months(invoice_month, 1)
+    return closing_date, clamp_day(due_month, due_day)
+
+
+def split_installments(total, count):
+    """
+    Divide o valor total em parcelas iguais; os centavos restantes vão para a primeira parcela.
+    """
+    base = (total / count).quantize(Decimal('0.01'), rounding=ROUND_DOWN)
+    return [total - base * (count - 1)] + [base] * (count - 1)
@@ -0,0 +1,223 @@
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db import models, transaction
+from django.db.models import Q, Sum
+
+from backend.api.core.mixins.unique_constraint import UniqueConstraintMixin
+
+from .invoice import add_months, invoice_month_for, split_installments
+
+
+class CreditCard(UniqueConstraintMixin, models.Model):
+    """
+    Cartão de crédito de um perfil.
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='credit_cards',
+        verbose_name='Usuário'
+    )
+    relative = models.ForeignKey(
+        'api.Relative',
+        on_delete=models.CASCADE,
+        related_name='credit_cards',
+        verbose_name='Parente'
+    )
+    name = models.CharField(max_length=50, verbose_name='Nome')
+    limit = models.DecimalField(max_digits=10, decimal_places=2, verbose_name='Limite')
+    closing_day = models.PositiveSmallIntegerField(
+        validators=[MinValueValidator(1), MaxValueValidator(31)], verbose_name='Dia de fechamento')
+    due_day = models.PositiveSmallIntegerField(
+        validators=[MinValueValidator(1), MaxValueValidator(31)], verbose_name='Dia de vencimento')
+    # Cor em formato hexadecimal (#RRGGBB) — validação de formato feita no serializer
+    color = models.CharField(max_length=7, verbose_name='Cor')
+    is_archived = models.BooleanField(default=False, verbose_name='Arquivado')
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # Mensagens para violações de unicidade detectadas pelo banco ao salvar
+    unique_error_messages = {
+        ('user', 'relative', 'name'): {
+            'name': 'Você já possui um cartão com este nome. Use outro nome.'
+        },
+    }
+
+    class Meta:
+        db_table = 'credit_card'
+        verbose_name = 'Cartão de crédito'
+        verbose_name_plural = 'Cartões de crédito'
+        unique_together = ['user', 'relative', 'name']
+
+    def __str__(self):
+        return self.name
+
+    def delete(self, *args, **kwargs):
+        raise NotImplementedError("Não é permitido deletar cartões.")
+
+    def get_used_limit(self, current_invoice_month):
+        """
+        Limite comprometido: parcelas ativas da fatura atual em diante (faturas anteriores
+        são consideradas pagas). Uma única consulta por intervalo no índice (card, invoice_month).
+        """
+        used = self.installments.filter(
+            is_archived=False, invoice_month__gte=current_invoice_month
+        ).aggregate(total=Sum('amount'))['total']
+        return (used or Decimal('0')).quantize(Decimal('0.01'))
+
+
+class CreditCardExpense(models.Model):
+    """
+    Gasto no cartão, simples (1 parcela) ou parcelado.
+    As parcelas e a fatura de cada uma são calculadas na criação e gravadas em CreditCardInstallment.
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='credit_card_expenses',
+        verbose_name='Usuário'
+    )
+    relative = models.ForeignKey(
+        'api.Relative',
+        on_delete=models.CASCADE,
+        related_name='credit_card_expenses',
+        verbose_name='Parente'
+    )
+    card = models.ForeignKey(
+        CreditCard,
+        on_delete=models.CASCADE,
+        related_name='expenses',
+        verbose_name='Cartão'
+    )
+    category = models.ForeignKey(
+        'api.Category',
+        on_delete=models.CASCADE,
+        related_name='credit_card_expenses',
+        verbose_name='Categoria'
+    )
+    description = models.CharField(max_length=200, blank=True, default='', verbose_name='Descrição')
+    total_amount = models.DecimalField(max_digits=10, decimal_places=2, verbose_name='Valor total')
+    installments_count = models.PositiveSmallIntegerField(
+        default=1, validators=[MinValueValidator(1), MaxValueValidator(48)], verbose_name='Parcelas')
+    purchase_date = models.DateField(verbose_name='Data da compra')
+    is_archived = models.BooleanField(default=False, verbose_name='Excluído')
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'credit_card_expense'
+        verbose_name = 'Gasto de cartão'
+        verbose_name_plural = 'Gastos de cartão'
+        ordering = ['-purchase_date', '-id']
+        constraints = [
+            models.CheckConstraint(
+                condition=Q(total_amount__gt=0),
+                name='credit_card_expense_amount_positive'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.description} - {self.total_amount} ({self.installments_count}x)"
+
+    def clean(self):
+        if self.total_amount is None or self.total_amount <= 0:
+            raise ValidationError({'total_amount': 'O valor deve ser maior que zero.'})
+        if self.installments_count < 1:
+            raise ValidationError({'installments_count': 'O número de parcelas deve ser maior que zero.'})
+
+    def build_installments(self):
+        """
+        Monta (sem salvar) as parcelas do gasto com a fatura de cada uma.
+        """
+        first_invoice = invoice_month_for(self.purchase_date, self.card.closing_day)
+        return [
+            CreditCardInstallment(
+                expense=self,
+                card_id=self.card_id,
+                relative_id=self.relative_id,
+                number=number,
+                amount=amount,
+                invoice_month=add_months(first_invoice, number - 1),
+            )
+            for number, amount in enumerate(split_installments(self.total_amount, self.installments_count), start=1)
+        ]
+
+    def save(self, *args, **kwargs):
+        """
+        Na criação, grava o gasto e todas as parcelas com um único bulk_create.
+        Valor, parcelas, data e cartão não mudam depois de criado (exclua e lance outro).
+        """
+        self.clean()
+        creating = self._state.adding
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if creating:
+                CreditCardInstallment.objects.bulk_create(self.build_installments())
+
+    def delete(self, *args, **kwargs):
+        raise NotImplementedError("Não é permitido deletar gastos. Use soft_delete().")
+
+    def soft_delete(self):
+        """
+        Exclui logicamente o gasto e, em lote, suas parcelas (liberando o limite).
+        """
+        with transaction.atomic():
+            self.is_archived = True
+            self.save(update_fields=['is_archived', 'updated_at'])
+            self.installments.update(is_archived=True)
+
+
+class CreditCardInstallment(models.Model):
+    """
+    Parcela de um gasto de cartão, com a fatura (mês de fechamento) pré-calculada.
+    Faturas e limite disponível são consultas por intervalo no índice (card, invoice_month).
+    """
+    expense = models.ForeignKey(
+        CreditCardExpense,
+        on_delete=models.CASCADE,
+        related_name='installments',
+        verbose_name='Gasto'
+    )
+    card = models.ForeignKey(
+        CreditCard,
+        on_delete=models.CASCADE,
+        related_name='installments',
+        verbose_name='Cartão'
+    )
+    relative = models.ForeignKey(
+        'api.Relative',
+        on_delete=models.CASCADE,
+        related_name='credit_card_installments',
+        verbose_name='Parente'
+    )
+    number = models.PositiveSmallIntegerField(verbose_name='Parcela')
+    amount = models.DecimalField(max_digits=10, decimal_places=2, verbose_name='Valor')
+    # Primeiro dia do mês de fechamento da fatura
+    invoice_month = models.DateField(verbose_name='Fatura')
+    is_archived = models.BooleanField(default=False, verbose_name='Excluída')
+
+    class Meta:
+        db_table = 'credit_card_installment'
+        verbose_name = 'Parcela de cartão'
+        verbose_name_plural = 'Parcelas de cartão'
+        ordering = ['invoice_month', 'id']
+        constraints = [
+            models.UniqueConstraint(fields=['expense', 'number'], name='credit_card_installment_unique_number'),
+        ]
+        indexes = [
+            # Fatura de um mês e limite comprometido (fatura atual em diante) do cartão
+            models.Index(
+                fields=['card', 'invoice_month'],
+                condition=Q(is_archived=False),
+                name='installment_card_invoice_idx'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.expense_id} {self.number}/{self.expense.installments_count}"
@@ -0,0 +1,100 @@
+from rest_framework import serializers
+
+from backend.api.accounts.serializers import HEX_COLOR_PATTERN
+from backend.api.core.mixins.relative_scope import RelativeScopedSerializerMixin
+from backend.api.transactions.serializers import validate_account_and_category
+
+from .models import CreditCard, CreditCardExpense, CreditCardInstallment
+
+
+class CreditCardSerializer(RelativeScopedSerializerMixin, serializers.ModelSerializer):
+    class Meta:
+        model = CreditCard
+        fields = '__all__'
+        read_only_fields = ['user', 'relative']  # Usuário e relative são definidos automaticamente
+
+    def validate_color(self, value):
+        """
+        Valida se a cor está no formato hexadecimal #RRGGBB.
+        """
+        if not HEX_COLOR_PATTERN.match(value):
+            raise serializers.ValidationError(
+                "Cor inválida. Use o formato hexadecimal #RRGGBB (ex: #FF5733)."
+            )
+        return value
+
+    def validate_closing_day(self, value):
+        """
+        Impede alteração do fechamento após criação: as parcelas já gravadas guardam o mês da fatura
+        calculado com este dia.
+        """
+        if self.instance and self.instance.closing_day != value:
+            raise serializers.ValidationError("O dia de fechamento não pode ser alterado.")
+        return value
+
+    def validate_due_day(self, value):
+        """
+        Impede alteração do vencimento após criação, junto com o ciclo de fechamento das faturas.
+        """
+        if self.instance and self.instance.due_day != value:
+            raise serializers.ValidationError("O dia de vencimento não pode ser alterado.")
+        return value
+
+    def validate_limit(self, value):
+        if value < 0:
+            raise serializers.ValidationError("O limite não pode ser negativo.")
+        return value
+
+    def create(self, validated_data):
+        """
+        Cria um novo cartão associando automaticamente ao usuário logado e relative do header.
+        """
+        validated_data['user'] = self.context['request'].user
+
+        # Perfil do header já resolvido e autorizado para este request
+        validated_data['relative_id'] = self.get_request_relative_id()
+
+        return super().create(validated_data)
+
+
+class CreditCardInstallmentSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = CreditCardInstallment
+        fields = ['id', 'number', 'amount', 'invoice_month']
+
+
+class CreditCardExpenseSerializer(serializers.ModelSerializer):
+    installments = CreditCardInstallmentSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = CreditCardExpense
+        fields = '__all__'
+        read_only_fields = ['user', 'relative', 'card', 'is_archived']  # Definidos pelo cartão da URL
+
+    def validate_total_amount(self, value):
+        if value <= 0:
+            raise serializers.ValidationError("O valor deve ser maior que zero.")
+        return value
+
+    def validate(self, attrs):
+        """
+        Valida que a categoria é de despesa e pertence ao mesmo usuário e perfil do cartão.
+        """
+        card = self.context['card']
+        if card.is_archived:
+            raise serializers.ValidationError("Não é permitido lançar gastos em um cartão arquivado.")
+
+        validate_account_and_category(card.user_id, card.relative_id, None, attrs.get('category'), 'despesas')
+        return attrs
+
+    def create(self, validated_data):
+        """
+        Cria o gasto no cartão da URL; as parcelas são geradas em lote pelo modelo.
+        """
+        card = self.context['card']
+        return CreditCardExpense.objects.create(
+            user_id=card.user_id,
+            relative_id=card.relative_id,
+            card=card,
+            **validated_data
+        )
@@ -0,0 +1,11 @@
+from django.urls import include, path
+from rest_framework.routers import DefaultRouter
+
+from .views import CreditCardViewSet
+
+router = DefaultRouter()
+router.register(r'credit-cards', CreditCardViewSet)
+
+urlpatterns = [
+    path('', include(router.urls)),
+]
@@ -0,0 +1,156 @@
+from datetime import datetime
+from decimal import Decimal
+
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from backend.api.core.mixins.relative_scope import RelativeScopedViewSetMixin
+
+from .invoice import invoice_dates, invoice_month_for
+from .models import CreditCard, CreditCardInstallment
+from .serializers import CreditCardExpenseSerializer, CreditCardSerializer
+
+
+class CreditCardViewSet(RelativeScopedViewSetMixin, viewsets.ModelViewSet):
+    """
+    ViewSet para operações CRUD da entidade CreditCard, com os gastos do cartão,
+    a fatura de um mês e o limite disponível.
+    """
+    queryset = CreditCard.objects.all()
+    serializer_class = CreditCardSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        """
+        Mostra apenas cartões do usuário autenticado (e do perfil do header, se presente).
+        Por padrão, a listagem mostra apenas cartões ativos.
+        """
+        queryset = CreditCard.objects.filter(user=self.request.user)
+        queryset = self.filter_by_relative(queryset)
+
+        if self.action == 'list':
+            only_archived = self.request.query_params.get('only_archived', 'false')
+            queryset = queryset.filter(is_archived=only_archived.lower() == 'true')
+
+        return queryset.order_by('name')
+
+    def perform_create(self, serializer):
+        """
+        Associa o cartão ao usuário autenticado durante a criação.
+        """
+        serializer.save(user=self.request.user)
+
+    def destroy(self, request, *args, **kwargs):
+        """
+        Sobrescreve o método destroy para implementar soft delete.
+        """
+        card = self.get_object()
+        card.is_archived = True
+        card.save()
+
+        return Response(
+            {"detail": "Cartão arquivado com sucesso."},
+            status=status.HTTP_200_OK
+        )
+
+    @action(detail=True, methods=['get', 'post'])
+    def expenses(self, request, pk=None):
+        """
+        GET: gastos ativos do cartão (com as parcelas).
+        POST: lança um gasto simples ou parcelado; as parcelas são geradas num único bulk_create.
+        """
+        card = self.get_object()
+
+        if request.method == 'POST':
+            serializer = CreditCardExpenseSerializer(data=request.data, context={'request': request, 'card': card})
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+        queryset = card.expenses.filter(is_archived=False).prefetch_related('installments')
+        page = self.paginate_queryset(queryset)
+        serializer = CreditCardExpenseSerializer(page, many=True, context={'request': request, 'card': card})
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=True, methods=['get', 'delete'], url_path=r'expenses/(?P<expense_id>\d+)')
+    def expense_detail(self, request, pk=None, expense_id=None):
+        """
+        GET: detalhe de um gasto do cartão.
+        DELETE: exclui logicamente o gasto e suas parcelas.
+        """
+        card = self.get_object()
+        expense = get_object_or_404(card.expenses.prefetch_related('installments'), pk=expense_id)
+
+        if request.method == 'DELETE':
+            expense.soft_delete()
+            return Response({"detail": "Gasto excluído com sucesso."}, status=status.HTTP_200_OK)
+
+        return Response(CreditCardExpenseSerializer(expense, context={'request': request, 'card': card}).data)
+
+    @action(detail=True, methods=['get'])
+    def invoice(self, request, pk=None):
+        """
+        Fatura do cartão (?month=AAAA-MM; padrão: fatura atual) com as parcelas e o total,
+        obtida com uma única consulta por intervalo no índice (card, invoice_month).
+        """
+        card = self.get_object()
+        invoice_month = self.get_invoice_month(card)
+        closing_date, due_date = invoice_dates(invoice_month, card.closing_day, card.due_day)
+
+        installments = list(
+            CreditCardInstallment.objects.filter(card=card, is_archived=False, invoice_month=invoice_month)
+            .select_related('expense')
+            .order_by('expense__purchase_date', 'id')
+        )
+
+        return Response({
+            'month': invoice_month.strftime('%Y-%m'),
+            'closing_date': closing_date,
+            'due_date': due_date,
+            'total': str(sum((item.amount for item in installments), start=Decimal('0.00'))),
+            'installments': [
+                {
+                    'expense': item.expense_id,
+                    'description': item.expense.description,
+                    'purchase_date': item.expense.purchase_date,
+                    'category': item.expense.category_id,
+                    'number': item.number,
+                    'installments_count': item.expense.installments_count,
+                    'amount': str(item.amount),
+                }
+                for item in installments
+            ],
+        })
+
+    @action(detail=True, methods=['get'])
+    def limit(self, request, pk=None):
+        """
+        Limite disponível: limite do cartão menos as parcelas da fatura atual em diante.
+        """
+        card = self.get_object()
+        current_invoice = invoice_month_for(timezone.localdate(), card.closing_day)
+        used = card.get_used_limit(current_invoice)
+
+        return Response({
+            'limit': str(card.limit),
+            'used': str(used),
+            'available': str(card.limit - used),
+            'current_invoice': current_invoice.strftime('%Y-%m'),
+        })
+
+    def get_invoice_month(self, card):
+        """
+        Converte o parâmetro month (AAAA-MM); sem ele, usa a fatura em aberto hoje.
+        """
+        value = self.request.query_params.get('month')
+        if not value:
+            return invoice_month_for(timezone.localdate(), card.closing_day)
+        try:
+            return datetime.strptime(value, '%Y-%m').date()
+        except ValueError:
+            raise ValidationError({'month': 'Mês inválido. Use o formato AAAA-MM.'})
@@ -0,0 +1,70 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+# Versão por perfil: qualquer escrita no perfil troca a versão e descarta todas as entradas de uma vez
+DASHBOARD_VERSION_KEY = 'dashboard:version:{relative_id}'
+DASHBOARD_KEY = 'dashboard:{relative_id}:{version}:{month}'
+DASHBOARD_LOCK_KEY = 'dashboard:lock:{relative_id}:{version}:{month}'
+
+# Intervalo entre verificações enquanto outro request calcula o mesmo dashboard
+DASHBOARD_POLL_INTERVAL = 0.05
+
+
+def _get_version(relative_id):
+    """
+    Retorna a versão atual do dashboard do perfil, criando-a se necessário.
+    """
+    key = DASHBOARD_VERSION_KEY.format(relative_id=relative_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def get_or_build_dashboard(relative_id, month, build):
+    """
+    Retorna o dashboard do perfil/mês em cache ou o calcula com build().
+    Falhas simultâneas para a mesma chave são agrupadas: apenas o request que obtém
+    o lock (cache.add) calcula; os demais aguardam o resultado ficar disponível.
+    """
+    version = _get_version(relative_id)
+    key = DASHBOARD_KEY.format(relative_id=relative_id, version=version, month=month)
+    data = cache.get(key)
+    if data is not None:
+        return data
+
+    lock_key = DASHBOARD_LOCK_KEY.format(relative_id=relative_id, version=version, month=month)
+    if cache.add(lock_key, True, timeout=settings.DASHBOARD_LOCK_TIMEOUT):
+        try:
+            data = build()
+            cache.set(key, data, timeout=settings.DASHBOARD_CACHE_TIMEOUT)
+        finally:
+            cache.delete(lock_key)
+        return data
+
+    deadline = time.monotonic() + settings.DASHBOARD_LOCK_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(DASHBOARD_POLL_INTERVAL)
+        data = cache.get(key)
+        if data is not None:
+            return data
+        if cache.get(lock_key) is None:
+            break
+
+    # O request que calculava falhou ou demorou demais: calcula sem guardar
+    return build()
+
+
+def invalidate_dashboard(relative_id):
+    """
+    Troca a versão do dashboard do perfil após o commit da escrita,
+    de forma que um cálculo concorrente nunca guarde dados antigos na versão nova.
+    """
+    def bump():
+        cache.set(DASHBOARD_VERSION_KEY.format(relative_id=relative_id), time.time_ns(), timeout=None)
+
+    transaction.on_commit(bump)
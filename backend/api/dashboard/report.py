@@ -0,0 +1,54 @@
+from decimal import Decimal
+
+from django.db.models import Sum
+
+from backend.api.accounts.models import Account
+from backend.api.summaries.models import MonthlySummary
+
+TOP_CATEGORIES_LIMIT = 5
+
+
+def _money(value):
+    return str((value or Decimal('0')).quantize(Decimal('0.01')))
+
+
+def build_dashboard(relative_id, month):
+    """
+    Monta o dashboard do perfil para o mês (primeiro dia do mês) a partir do resumo mensal.
+    """
+    summaries = MonthlySummary.objects.filter(relative_id=relative_id, month=month)
+
+    totals = dict(summaries.values('type').annotate(total=Sum('total')).values_list('type', 'total'))
+    income = totals.get('receitas') or Decimal('0')
+    expenses = totals.get('despesas') or Decimal('0')
+
+    balance = Account.objects.filter(
+        relative_id=relative_id, include_calc=True, is_archived=False
+    ).aggregate(total=Sum('balance'))['total']
+
+    top_categories = (
+        summaries.filter(type='despesas')
+        .values('category_id', 'category__full_name', 'category__color', 'category__icon')
+        .annotate(total=Sum('total'))
+        .order_by('-total', 'category_id')[:TOP_CATEGORIES_LIMIT]
+    )
+
+    return {
+        'month': month.strftime('%Y-%m'),
+        'totals': {
+            'receitas': _money(income),
+            'despesas': _money(expenses),
+            'resultado': _money(income - expenses),
+        },
+        'balance': _money(balance),
+        'top_categories': [
+            {
+                'id': row['category_id'],
+                'name': row['category__full_name'],
+                'color': row['category__color'],
+                'icon': row['category__icon'],
+                'total': _money(row['total']),
+            }
+            for row in top_categories
+        ],
+    }
@@ -0,0 +1,43 @@
+from datetime import datetime
+
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from backend.api.core.mixins.relative_scope import RelativeScopedViewSetMixin
+
+from .cache import get_or_build_dashboard
+from .report import build_dashboard
+
+
+class DashboardView(RelativeScopedViewSetMixin, APIView):
+    """
+    Dashboard do perfil: totais do mês, saldo das contas com include_calc e principais categorias.
+    Endpoint: GET /api/v1/dashboard/?month=AAAA-MM (padrão: mês atual)
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        relative_id = self.require_relative_id()
+        month = self.get_month()
+
+        data = get_or_build_dashboard(
+            relative_id,
+            month.strftime('%Y-%m'),
+            lambda: build_dashboard(relative_id, month)
+        )
+        return Response(data)
+
+    def get_month(self):
+        """
+        Converte o parâmetro month (AAAA-MM) no primeiro dia do mês.
+        """
+        value = self.request.query_params.get('month')
+        if not value:
+            return timezone.localdate().replace(day=1)
+        try:
+            return datetime.strptime(value, '%Y-%m').date()
+        except ValueError:
+            raise ValidationError({'month': 'Mês inválido. Use o formato AAAA-MM.'})
@@ -0,0 +1,95 @@
+from decimal import Decimal
+
+from django.db import connection
+
+# Chave usada para a linha consolidada (todos os perfis) nos resultados
+FAMILY_TOTAL = None
+
+
+def _grouped_sql(select, from_clause, where, group_by):
+    """
+    Monta uma única consulta agrupada por perfil e consolidada (sem o perfil).
+    PostgreSQL: GROUPING SETS ((perfil, ...), (...)).
+    Outros bancos (SQLite): as duas agregações unidas com UNION ALL no mesmo comando.
+    Na linha consolidada as colunas do perfil vêm como NULL. Perfis arquivados ficam de fora.
+    Retorna (sql, repetições dos parâmetros do where).
+    """
+    relative_columns = ['r.id', 'r.name']
+    per_relative = ', '.join(relative_columns + group_by)
+    consolidated = ', '.join(group_by)
+
+    if connection.vendor == 'postgresql':
+        sql = (
+            f"SELECT {per_relative}, {select} FROM {from_clause} WHERE {where} "
+            f"GROUP BY GROUPING SETS (({per_relative}), ({consolidated}))"
+        )
+        return sql, 1
+
+    consolidated_columns = ', '.join(['NULL', 'NULL'] + group_by)
+    sql = (
+        f"SELECT {per_relative}, {select} FROM {from_clause} WHERE {where} GROUP BY {per_relative} "
+        f"UNION ALL "
+        f"SELECT {consolidated_columns}, {select} FROM {from_clause} WHERE {where}"
+        + (f" GROUP BY {consolidated}" if group_by else "")
+    )
+    return sql, 2
+
+
+def _fetch(select, from_clause, where, group_by, params):
+    sql, repeat = _grouped_sql(select, from_clause, where, group_by)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params * repeat)
+        return cursor.fetchall()
+
+
+def _decimal(value):
+    return Decimal(value or 0).quantize(Decimal('0.01'))
+
+
+def family_balances(user_id):
+    """
+    Saldo das contas ativas com include_calc por perfil e consolidado.
+    Retorna linhas (relative_id, relative_name, balance, accounts); relative_id None = consolidado.
+    """
+    rows = _fetch(
+        select='SUM(a.balance), COUNT(a.id)',
+        from_clause='account a JOIN relative r ON r.id = a.relative_id',
+        where='a.user_id = %s AND r.is_archived = %s AND a.is_archived = %s AND a.include_calc = %s',
+        group_by=[],
+        params=[user_id, False, False, True],
+    )
+    return [(relative_id, name, _decimal(balance), count) for relative_id, name, balance, count in rows]
+
+
+def family_monthly_totals(user_id, start, end):
+    """
+    Totais de receitas e despesas por mês, por perfil e consolidado, a partir do resumo mensal.
+    Retorna linhas (relative_id, relative_name, month, type, total).
+    """
+    rows = _fetch(
+        select='SUM(s.total)',
+        from_clause='monthly_summary s JOIN relative r ON r.id = s.relative_id',
+        where='s.user_id = %s AND r.is_archived = %s AND s.month >= %s AND s.month <= %s',
+        group_by=['s.month', 's.type'],
+        params=[user_id, False, start, end],
+    )
+    return [(relative_id, name, month, type_, _decimal(total)) for relative_id, name, month, type_, total in rows]
+
+
+def family_category_breakdown(user_id, start, end):
+    """
+    Totais por categoria (pelo caminho completo, já que cada perfil tem suas próprias categorias)
+    no período, por perfil e consolidado.
+    Retorna linhas (relative_id, relative_name, category_name, type, total).
+    """
+    rows = _fetch(
+        select='SUM(s.total)',
+        from_clause=(
+            'monthly_summary s JOIN relative r ON r.id = s.relative_id '
+            'JOIN category c ON c.id = s.category_id'
+        ),
+        where='s.user_id = %s AND r.is_archived = %s AND s.month >= %s AND s.month <= %s',
+        group_by=['c.full_name', 's.type'],
+        params=[user_id, False, start, end],
+    )
+    return [(relative_id, name, category, type_, _decimal(total)) for relative_id, name, category, type_, total in rows]
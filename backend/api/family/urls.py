@@ -0,0 +1,11 @@
+from django.urls import include, path
+from rest_framework.routers import DefaultRouter
+
+from .views import FamilyViewSet
+
+router = DefaultRouter()
+router.register(r'family', FamilyViewSet, basename='family')
+
+urlpatterns = [
+    path('', include(router.urls)),
+]
@@ -0,0 +1,134 @@
+from datetime import datetime
+from decimal import Decimal
+
+from django.utils import timezone
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from .queries import (FAMILY_TOTAL, family_balances, family_category_breakdown,
+                      family_monthly_totals)
+
+# Período máximo aceito nas consultas por mês
+MAX_PERIOD_MONTHS = 24
+
+
+def _month_key(value):
+    """
+    Normaliza o mês retornado pelo banco (date ou texto 'AAAA-MM-DD') para 'AAAA-MM'.
+    """
+    return str(value)[:7]
+
+
+def _group_rows(rows, build_entry):
+    """
+    Separa as linhas por perfil e a linha consolidada (perfil NULL) no formato da resposta.
+    """
+    relatives = {}
+    total = []
+    for relative_id, name, *values in rows:
+        if relative_id is FAMILY_TOTAL:
+            total.append(build_entry(*values))
+        else:
+            relatives.setdefault(relative_id, {'id': relative_id, 'name': name, 'items': []})
+            relatives[relative_id]['items'].append(build_entry(*values))
+    return sorted(relatives.values(), key=lambda item: item['name']), total
+
+
+class FamilyViewSet(viewsets.ViewSet):
+    """
+    Perfil "Família": visão somente leitura que consolida todos os perfis ativos do usuário.
+    Cada endpoint retorna os números por perfil e o consolidado, calculados numa única consulta agrupada.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get_period(self):
+        """
+        Converte os parâmetros start e end (AAAA-MM) no primeiro dia de cada mês.
+        Padrão: mês atual.
+        """
+        current = timezone.localdate().replace(day=1)
+        period = {}
+        for param in ('start', 'end'):
+            value = self.request.query_params.get(param)
+            if not value:
+                period[param] = current
+                continue
+            try:
+                period[param] = datetime.strptime(value, '%Y-%m').date()
+            except ValueError:
+                raise ValidationError({param: 'Mês inválido. Use o formato AAAA-MM.'})
+
+        start, end = period['start'], period['end']
+        months = (end.year - start.year) * 12 + end.month - start.month + 1
+        if months < 1:
+            raise ValidationError({'end': 'O mês final deve ser igual ou posterior ao inicial.'})
+        if months > MAX_PERIOD_MONTHS:
+            raise ValidationError({'end': f'O período máximo é de {MAX_PERIOD_MONTHS} meses.'})
+        return start, end
+
+    @action(detail=False, methods=['get'])
+    def balances(self, request):
+        """
+        Saldo das contas (ativas e com include_calc) por perfil e consolidado.
+        """
+        relatives, total = _group_rows(
+            family_balances(request.user.pk),
+            lambda balance, accounts: {'balance': str(balance), 'accounts': accounts}
+        )
+        return Response({
+            'relatives': [{'id': item['id'], 'name': item['name'], **item['items'][0]} for item in relatives],
+            'total': total[0],
+        })
+
+    @action(detail=False, methods=['get'], url_path='monthly-totals')
+    def monthly_totals(self, request):
+        """
+        Receitas e despesas por mês no período (?start=AAAA-MM&end=AAAA-MM), por perfil e consolidado.
+        """
+        start, end = self.get_period()
+        relatives, total = _group_rows(
+            family_monthly_totals(request.user.pk, start, end),
+            lambda month, type_, amount: (_month_key(month), type_, str(amount))
+        )
+
+        def by_month(items):
+            months = {}
+            for month, type_, amount in sorted(items):
+                months.setdefault(month, {'month': month, 'receitas': '0.00', 'despesas': '0.00'})[type_] = amount
+            return list(months.values())
+
+        return Response({
+            'start': start.strftime('%Y-%m'),
+            'end': end.strftime('%Y-%m'),
+            'relatives': [
+                {'id': item['id'], 'name': item['name'], 'months': by_month(item['items'])} for item in relatives
+            ],
+            'total': {'months': by_month(total)},
+        })
+
+    @action(detail=False, methods=['get'])
+    def categories(self, request):
+        """
+        Totais por categoria no período (?start=AAAA-MM&end=AAAA-MM), por perfil e consolidado.
+        Categorias de perfis diferentes com o mesmo caminho são somadas no consolidado.
+        """
+        start, end = self.get_period()
+        relatives, total = _group_rows(
+            family_category_breakdown(request.user.pk, start, end),
+            lambda category, type_, amount: {'category': category, 'type': type_, 'total': str(amount)}
+        )
+
+        def ordered(items):
+            return sorted(items, key=lambda item: (item['type'], -Decimal(item['total']), item['category']))
+
+        return Response({
+            'start': start.strftime('%Y-%m'),
+            'end': end.strftime('%Y-%m'),
+            'relatives': [
+                {'id': item['id'], 'name': item['name'], 'categories': ordered(item['items'])} for item in relatives
+            ],
+            'total': {'categories': ordered(total)},
+        })
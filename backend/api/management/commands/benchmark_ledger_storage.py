@@ -0,0 +1,168 @@
+import statistics
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from backend.api.balances.models import month_start
+from backend.api.transactions.partitions import (
+    BRIN_PAGES_PER_RANGE,
+    add_months,
+    default_partition_name,
+    ensure_partitions,
+)
+
+# Tabelas de rascunho com as colunas usadas pelas consultas por período do livro de lançamentos
+LAYOUTS = {
+    'btree': 'bench_ledger_btree',
+    'brin': 'bench_ledger_brin',
+    'partitioned': 'bench_ledger_partitioned',
+}
+
+LEDGER_COLUMNS = (
+    'id bigint NOT NULL, relative_id bigint NOT NULL, account_id bigint NOT NULL, date date NOT NULL, '
+    'amount numeric(10, 2) NOT NULL, type varchar(15) NOT NULL, is_archived boolean NOT NULL'
+)
+
+FIRST_DATE = date(2023, 1, 1)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark of period-filter latency on a plain B-tree, a BRIN and a partitioned ledger (PostgreSQL)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=50_000_000, help='Synthetic transactions per layout')
+        parser.add_argument('--relatives', type=int, default=10_000,
+                            help='Number of profiles the rows are spread across')
+        parser.add_argument('--months', type=int, default=36, help='Months covered by the dates')
+        parser.add_argument('--backdated', type=int, default=5,
+                            help='Percentage of rows inserted out of date order (up to one year back)')
+        parser.add_argument('--repeat', type=int, default=5,
+                            help='Executions per query (median is reported)')
+        parser.add_argument('--skip-seed', action='store_true',
+                            help='Reuse the tables seeded by a previous run')
+        parser.add_argument('--cleanup', action='store_true',
+                            help='Drop the benchmark tables at the end')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('The ledger storage benchmark requires PostgreSQL.')
+
+        if not options['skip_seed']:
+            self.seed(options['rows'], options['relatives'], options['months'], options['backdated'])
+        elif not self.tables_exist():
+            raise CommandError('No benchmark tables found. Run without --skip-seed.')
+
+        queries = self.get_queries(options['months'])
+        results = {}
+        for layout, table in LAYOUTS.items():
+            self.stdout.write(self.style.WARNING(f'=== {layout} ({self.table_size(table)}) ==='))
+            results[layout] = self.run_queries(table, queries, options['repeat'])
+
+        self.stdout.write(self.style.WARNING('=== Summary (median ms) ==='))
+        self.stdout.write(f"{'':<28}" + ''.join(f'{layout:>14}' for layout in LAYOUTS))
+        for name in queries:
+            self.stdout.write(f'{name:<28}' + ''.join(f'{results[layout][name]:>14.2f}' for layout in LAYOUTS))
+
+        if options['cleanup']:
+            self.cleanup()
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete!'))
+
+    def get_queries(self, months):
+        """
+        Consultas por período no formato das agregações e listagens de lançamentos.
+        """
+        month = add_months(FIRST_DATE, months // 2)
+        next_month = add_months(month, 1)
+        return {
+            'day detail': ('SELECT id, amount FROM {table} WHERE date = %s', [month + timedelta(days=14)]),
+            'month total': (
+                'SELECT COUNT(*), SUM(amount) FROM {table} '
+                'WHERE date >= %s AND date < %s AND NOT is_archived', [month, next_month]),
+            'quarter by type': (
+                'SELECT type, SUM(amount) FROM {table} '
+                'WHERE date >= %s AND date < %s AND NOT is_archived GROUP BY type', [month, add_months(month, 3)]),
+            'relative month first page': (
+                'SELECT id, date, amount FROM {table} WHERE relative_id = %s AND date >= %s AND date < %s '
+                'ORDER BY date DESC, id DESC LIMIT 10', [42, month, next_month]),
+        }
+
+    def run_queries(self, table, queries, repeat):
+        results = {}
+        with connection.cursor() as cursor:
+            for name, (sql, params) in queries.items():
+                sql = sql.format(table=table)
+                self.stdout.write(self.style.MIGRATE_HEADING(name))
+                cursor.execute(f'EXPLAIN (ANALYZE, BUFFERS) {sql}', params)
+                self.stdout.write('\n'.join(row[0] for row in cursor.fetchall()))
+
+                timings = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    cursor.execute(sql, params)
+                    cursor.fetchall()
+                    timings.append((time.perf_counter() - start) * 1000)
+
+                results[name] = statistics.median(timings)
+                self.stdout.write(f'median: {results[name]:.2f} ms\n')
+        return results
+
+    def seed(self, rows, relatives, months, backdated):
+        self.stdout.write(f'Seeding {rows} transactions per layout over {months} months...')
+        self.cleanup()
+
+        btree, brin, partitioned = LAYOUTS.values()
+        days = (add_months(FIRST_DATE, months) - FIRST_DATE).days
+        with connection.cursor() as cursor:
+            for table in (btree, brin):
+                cursor.execute(f'CREATE TABLE {table} ({LEDGER_COLUMNS})')
+            cursor.execute(f'CREATE TABLE {partitioned} ({LEDGER_COLUMNS}) PARTITION BY RANGE (date)')
+            cursor.execute(f'CREATE TABLE {default_partition_name(partitioned)} PARTITION OF {partitioned} DEFAULT')
+
+            # Datas crescentes com o id (livro só de inserções), com uma fração lançada retroativamente
+            cursor.execute(
+                f'INSERT INTO {btree} '
+                'SELECT g, 1 + g %% %s, 1 + g %% (%s * 3), '
+                '%s::date + (g * %s::bigint / %s)::int - CASE WHEN g %% 100 < %s THEN (g %% 365)::int ELSE 0 END, '
+                '1 + (g %% 50000) / 100.0, CASE WHEN g %% 5 = 0 THEN %s ELSE %s END, g %% 50 = 0 '
+                'FROM generate_series(1, %s::bigint) AS g',
+                [relatives, relatives, FIRST_DATE, days, rows, backdated, 'receitas', 'despesas', rows]
+            )
+            self.stdout.write(f'  {btree}: done')
+
+            ensure_partitions(month_start(FIRST_DATE - timedelta(days=365)), add_months(FIRST_DATE, months),
+                              table=partitioned, unique_indexes={}, unique_key_table=None)
+            for table in (brin, partitioned):
+                cursor.execute(f'INSERT INTO {table} SELECT * FROM {btree}')
+                self.stdout.write(f'  {table}: done')
+
+            cursor.execute(f'CREATE INDEX {btree}_date_idx ON {btree} (date)')
+            cursor.execute(
+                f'CREATE INDEX {brin}_date_idx ON {brin} USING brin (date) '
+                f'WITH (pages_per_range = {BRIN_PAGES_PER_RANGE})')
+            # Mesmo índice por perfil nos três layouts (equivalente a transaction_active_date_idx)
+            for table in LAYOUTS.values():
+                cursor.execute(f'CREATE INDEX {table}_relative_date_idx ON {table} (relative_id, date, id)')
+                # Mapa de visibilidade e estatísticas do planner após a carga
+                cursor.execute(f'VACUUM ANALYZE {table}')
+
+    def tables_exist(self):
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT ' + ', '.join(['to_regclass(%s) IS NOT NULL'] * len(LAYOUTS)),
+                           list(LAYOUTS.values()))
+            return all(cursor.fetchone())
+
+    def table_size(self, table):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT pg_size_pretty(SUM(pg_table_size(relid))), pg_size_pretty(SUM(pg_indexes_size(relid))) '
+                'FROM pg_partition_tree(%s)', [table])
+            data, indexes = cursor.fetchone()
+        return f'table {data}, indexes {indexes}'
+
+    def cleanup(self):
+        with connection.cursor() as cursor:
+            for table in LAYOUTS.values():
+                cursor.execute(f'DROP TABLE IF EXISTS {table} CASCADE')
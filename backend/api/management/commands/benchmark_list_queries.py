@@ -0,0 +1,191 @@
+import statistics
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from backend.api.accounts.models import Account
+from backend.api.categories.models import Category
+from backend.api.core.search.unaccent import filter_name_search
+from backend.api.relatives.models import Relative
+from backend.api.users.models import User
+
+# Índices compostos/parciais avaliados pelo benchmark (criados na migration 0004)
+BENCHMARK_INDEXES = {
+    'account': ['account_active_name_idx', 'account_user_active_name_idx'],
+    'category': ['category_active_name_idx', 'category_user_active_name_idx'],
+}
+
+BENCHMARK_EMAIL_DOMAIN = 'benchmark.orfin.local'
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Benchmark of account/category list queries with and without the list indexes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1_000_000,
+                            help='Number of accounts and of categories to seed (each)')
+        parser.add_argument('--users', type=int, default=100,
+                            help='Number of users the rows are spread across')
+        parser.add_argument('--batch-size', type=int, default=5_000)
+        parser.add_argument('--repeat', type=int, default=5,
+                            help='Executions per query (median is reported)')
+        parser.add_argument('--skip-seed', action='store_true',
+                            help='Reuse the dataset seeded by a previous run')
+        parser.add_argument('--cleanup', action='store_true',
+                            help='Remove the benchmark dataset at the end')
+
+    def handle(self, *args, **options):
+        if not options['skip_seed']:
+            self.seed(options['rows'], options['users'], options['batch_size'])
+
+        relative = Relative.objects.filter(
+            user__email__endswith=BENCHMARK_EMAIL_DOMAIN).order_by('id').first()
+        if relative is None:
+            self.stdout.write(self.style.ERROR('No benchmark dataset found. Run without --skip-seed.'))
+            return
+
+        queries = self.get_queries(relative)
+
+        self.stdout.write(self.style.WARNING('=== With list indexes ==='))
+        with_indexes = self.run_queries(queries, options['repeat'])
+
+        self.stdout.write(self.style.WARNING('=== Without list indexes ==='))
+        try:
+            # DDL transacional (PostgreSQL/SQLite): os índices voltam no rollback
+            with transaction.atomic():
+                self.drop_indexes()
+                without_indexes = self.run_queries(queries, options['repeat'])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        self.stdout.write(self.style.WARNING('=== Summary (median ms) ==='))
+        for name in queries:
+            self.stdout.write(
+                f'{name:<40} without: {without_indexes[name]:>10.2f}  with: {with_indexes[name]:>10.2f}')
+
+        if options['cleanup']:
+            self.cleanup()
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete!'))
+
+    def get_queries(self, relative):
+        """
+        Consultas com o mesmo formato das listagens dos ViewSets.
+        """
+        accounts = Account.objects.filter(user_id=relative.user_id, relative_id=relative.id, is_archived=False)
+        categories = Category.objects.filter(user_id=relative.user_id, relative_id=relative.id, is_archived=False)
+        middle_name = accounts.order_by('name', 'id').values_list('name', flat=True)[accounts.count() // 2]
+
+        return {
+            'accounts: first page': accounts.order_by('name')[:10],
+            'accounts: deep page (offset)': accounts.order_by('name')[5_000:5_010],
+            'accounts: deep page (keyset)': accounts.filter(name__gt=middle_name).order_by('name', 'id')[:10],
+            'accounts: all relatives first page': Account.objects.filter(
+                user_id=relative.user_id, is_archived=False).order_by('name')[:10],
+            'accounts: name search': filter_name_search(accounts, '0042').order_by('name')[:10],
+            'categories: first page': categories.order_by('name')[:10],
+            'categories: deep page (offset)': categories.order_by('name')[5_000:5_010],
+        }
+
+    def run_queries(self, queries, repeat):
+        results = {}
+        for name, queryset in queries.items():
+            self.stdout.write(self.style.MIGRATE_HEADING(name))
+            options = {'analyze': True} if connection.vendor == 'postgresql' else {}
+            self.stdout.write(queryset.explain(**options))
+
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                list(queryset.all())
+                timings.append((time.perf_counter() - start) * 1000)
+
+            results[name] = statistics.median(timings)
+            self.stdout.write(f'median: {results[name]:.2f} ms\n')
+        return results
+
+    def drop_indexes(self):
+        with connection.cursor() as cursor:
+            for index_names in BENCHMARK_INDEXES.values():
+                for name in index_names:
+                    cursor.execute(f'DROP INDEX {connection.ops.quote_name(name)}')
+
+    def seed(self, rows, users_count, batch_size):
+        self.stdout.write(f'Seeding {rows} accounts and {rows} categories across {users_count} users...')
+        self.cleanup()
+
+        User.objects.bulk_create([
+            User(
+                email=f'user{i}@{BENCHMARK_EMAIL_DOMAIN}',
+                first_name='Benchmark',
+                last_name=str(i),
+                social_name=f'Benchmark {i}',
+                cpf=f'{90000000000 + i}',
+                password='!'
+            )
+            for i in range(users_count)
+        ])
+        users = list(User.objects.filter(email__endswith=BENCHMARK_EMAIL_DOMAIN).order_by('id'))
+        Relative.objects.bulk_create([Relative(name='Benchmark', user=user) for user in users])
+        relatives = list(Relative.objects.filter(user__in=users).order_by('user_id'))
+
+        per_relative = max(rows // len(relatives), 1)
+        for model, build in ((Account, self.build_account), (Category, self.build_category)):
+            batch = []
+            created = 0
+            for relative in relatives:
+                for i in range(per_relative):
+                    batch.append(build(relative, i))
+                    if len(batch) >= batch_size:
+                        model.objects.bulk_create(batch)
+                        created += len(batch)
+                        batch = []
+                        self.stdout.write(f'  {model.__name__}: {created}/{rows}', ending='\r')
+            if batch:
+                model.objects.bulk_create(batch)
+            self.stdout.write(f'  {model.__name__}: done')
+
+        # Atualiza as estatísticas do planner após a carga
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    @staticmethod
+    def build_account(relative, i):
+        return Account(
+            user_id=relative.user_id,
+            relative=relative,
+            bank_name='Benchmark',
+            name=f'Conta {i:07d}',
+            account_type='corrente',
+            color='#FF5733',
+            balance=Decimal('0.00'),
+            include_calc=i % 4 != 0,
+            is_archived=i % 4 == 0,
+        )
+
+    @staticmethod
+    def build_category(relative, i):
+        return Category(
+            user_id=relative.user_id,
+            relative=relative,
+            name=f'Categoria {i:07d}',
+            full_name=f'Categoria {i:07d}',
+            color='#FF5733',
+            icon='bench',
+            type_category='despesas',
+            is_archived=i % 4 == 0,
+        )
+
+    def cleanup(self):
+        users = User.objects.filter(email__endswith=BENCHMARK_EMAIL_DOMAIN)
+        Account.objects.filter(user__in=users).delete()
+        Category.objects.filter(user__in=users).delete()
+        Relative.objects.filter(user__in=users).delete()
+        users.delete()
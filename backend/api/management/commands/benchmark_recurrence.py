@@ -0,0 +1,78 @@
+import random
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+
+from backend.api.recurring.engine import DAILY, FREQUENCIES, MONTHLY, WEEKLY, YEARLY, expand_rules
+
+
+def naive_occurrences(frequency, interval, start_date, end_date, window_start, window_end):
+    """
+    Referência ingênua: percorre dia a dia desde a data inicial da regra.
+    Usada apenas para comparar tempo e conferir o resultado do motor.
+    """
+    last = min(end_date, window_end) if end_date else window_end
+    current = start_date
+    while current <= last:
+        if current >= window_start:
+            days = (current - start_date).days
+            months = (current.year - start_date.year) * 12 + current.month - start_date.month
+            month_end = (current.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+            same_day = current.day == min(start_date.day, month_end.day)
+            if ((frequency == DAILY and days % interval == 0)
+                    or (frequency == WEEKLY and days % (7 * interval) == 0)
+                    or (frequency == MONTHLY and same_day and months % interval == 0)
+                    or (frequency == YEARLY and same_day and months % (12 * interval) == 0)):
+                yield current
+        current += timedelta(days=1)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark of the recurrence engine expanding many rules over a window of months'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rules', type=int, default=100_000, help='Number of recurring rules')
+        parser.add_argument('--months', type=int, default=12, help='Window size in months')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--naive-sample', type=int, default=1_000,
+                            help='Rules also expanded day by day for comparison and verification (0 disables)')
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        window_start = date(2026, 1, 1)
+        window_end = date(2026 + options['months'] // 12, options['months'] % 12 + 1, 1) - timedelta(days=1)
+        frequencies = [key for key, _ in FREQUENCIES]
+
+        rules = []
+        for rule_id in range(options['rules']):
+            start_date = window_start - timedelta(days=rng.randint(0, 3 * 365))
+            end_date = window_start + timedelta(days=rng.randint(0, 500)) if rng.random() < 0.3 else None
+            rules.append((rule_id, rng.choice(frequencies), rng.choice((1, 1, 1, 2, 3)), start_date, end_date))
+
+        self.stdout.write(f'Expanding {len(rules)} rules from {window_start} to {window_end}...')
+        start = time.perf_counter()
+        total = sum(1 for _ in expand_rules(rules, window_start, window_end))
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            f'engine: {total} occurrences in {elapsed * 1000:.1f} ms '
+            f'({len(rules) / elapsed:,.0f} rules/s)')
+
+        sample = rules[:options['naive_sample']]
+        if sample:
+            start = time.perf_counter()
+            naive = [(rule[0], occurrence) for rule in sample
+                     for occurrence in naive_occurrences(*rule[1:], window_start, window_end)]
+            naive_elapsed = time.perf_counter() - start
+
+            engine = list(expand_rules(sample, window_start, window_end))
+            if engine != naive:
+                self.stdout.write(self.style.ERROR('Engine and naive expansion differ!'))
+                return
+
+            per_rule = naive_elapsed / len(sample)
+            self.stdout.write(
+                f'naive (day by day), {len(sample)} rules: {naive_elapsed * 1000:.1f} ms '
+                f'-> ~{per_rule * len(rules):.1f} s estimated for {len(rules)} rules')
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete!'))
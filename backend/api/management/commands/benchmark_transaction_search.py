@@ -0,0 +1,128 @@
+import statistics
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from backend.api.core.search.fulltext import SEARCH_CONFIG, build_prefix_query, search_words
+from backend.api.core.search.unaccent import strip_accents
+
+BENCHMARK_TABLE = 'bench_transaction_search'
+
+# Vocabulário das descrições sintéticas (com e sem acentos, como digitado pelos usuários)
+DESCRIPTION_WORDS = [
+    'Mercado', 'Supermercado', 'Padaria', 'Farmácia', 'Uber', 'Posto', 'Combustível', 'Restaurante',
+    'Aluguel', 'Condomínio', 'Energia', 'Água', 'Internet', 'Celular', 'Academia', 'Escola',
+    'Salário', 'Reembolso', 'Pix', 'Transferência', 'Cinema', 'Livraria', 'Pet', 'Açougue',
+]
+
+FIRST_DATE = date(2024, 1, 1)
+
+TARGET_MS = 50
+
+
+class Command(BaseCommand):
+    help = 'Benchmark of transaction description search: full-text (tsvector + GIN) vs. icontains (PostgreSQL)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10_000_000, help='Synthetic transactions to seed')
+        parser.add_argument('--relatives', type=int, default=100,
+                            help='Number of profiles the rows are spread across')
+        parser.add_argument('--term', default='mercado', help='Search term')
+        parser.add_argument('--repeat', type=int, default=5,
+                            help='Executions per query (median is reported)')
+        parser.add_argument('--skip-seed', action='store_true',
+                            help='Reuse the table seeded by a previous run')
+        parser.add_argument('--cleanup', action='store_true',
+                            help='Drop the benchmark table at the end')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('The search benchmark requires PostgreSQL.')
+
+        if not options['skip_seed']:
+            self.seed(options['rows'], options['relatives'])
+
+        results = {}
+        for name, (sql, params) in self.get_queries(options['term']).items():
+            self.stdout.write(self.style.MIGRATE_HEADING(name))
+            results[name] = self.run_query(sql, params, options['repeat'])
+
+        self.stdout.write(self.style.WARNING(f'=== Summary (median ms, target < {TARGET_MS} ms) ==='))
+        for name, elapsed in results.items():
+            style = self.style.SUCCESS if elapsed < TARGET_MS else self.style.ERROR
+            self.stdout.write(style(f'{name:<40} {elapsed:>10.2f}'))
+
+        if options['cleanup']:
+            with connection.cursor() as cursor:
+                cursor.execute(f'DROP TABLE IF EXISTS {BENCHMARK_TABLE}')
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete!'))
+
+    def get_queries(self, term):
+        """
+        Mesmo formato da busca da API: perfil, período e primeira página (20) ordenada.
+        """
+        words = search_words(term)
+        if not words:
+            raise CommandError('Invalid --term.')
+        tsquery = f"to_tsquery('{SEARCH_CONFIG}', %s)"
+        like = f'%{strip_accents(term).upper()}%'
+        year = [FIRST_DATE + timedelta(days=365), FIRST_DATE + timedelta(days=730)]
+
+        queries = {}
+        for scope, condition, params in (
+            ('profile, one year', 'relative_id = %s AND date >= %s AND date < %s', [1, *year]),
+            ('profile, all periods', 'relative_id = %s', [1]),
+        ):
+            queries[f'icontains: {scope}'] = (
+                f'SELECT id, date, description FROM {BENCHMARK_TABLE} WHERE {condition} '
+                'AND UPPER(immutable_unaccent(description)) LIKE %s ORDER BY date DESC, id DESC LIMIT 20',
+                [*params, like])
+            queries[f'full-text: {scope}'] = (
+                f'SELECT id, date, description, ts_rank(search_vector, {tsquery}) AS rank '
+                f'FROM {BENCHMARK_TABLE} WHERE {condition} AND search_vector @@ {tsquery} '
+                'ORDER BY rank DESC, date DESC, id DESC LIMIT 20',
+                [build_prefix_query(words), *params, build_prefix_query(words)])
+        return queries
+
+    def run_query(self, sql, params, repeat):
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN (ANALYZE, BUFFERS) {sql}', params)
+            self.stdout.write('\n'.join(row[0] for row in cursor.fetchall()))
+
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                cursor.execute(sql, params)
+                cursor.fetchall()
+                timings.append((time.perf_counter() - start) * 1000)
+
+        elapsed = statistics.median(timings)
+        self.stdout.write(f'median: {elapsed:.2f} ms\n')
+        return elapsed
+
+    def seed(self, rows, relatives):
+        self.stdout.write(f'Seeding {rows} transactions across {relatives} profiles...')
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {BENCHMARK_TABLE}')
+            cursor.execute(
+                f'CREATE TABLE {BENCHMARK_TABLE} (id bigint PRIMARY KEY, relative_id bigint NOT NULL, '
+                'date date NOT NULL, description varchar(200) NOT NULL, search_vector tsvector)')
+            # Duas palavras do vocabulário e um número por descrição; datas ao longo de três anos
+            cursor.execute(
+                f'INSERT INTO {BENCHMARK_TABLE} (id, relative_id, date, description) '
+                'SELECT g, 1 + g %% %s, %s::date + (g %% 1095)::int, '
+                "words[1 + g %% array_length(words, 1)] || ' ' "
+                "|| words[1 + (g / 7) %% array_length(words, 1)] || ' ' || (g %% 1000) "
+                'FROM generate_series(1, %s::bigint) AS g, (SELECT %s::text[] AS words) AS vocabulary',
+                [relatives, FIRST_DATE, rows, DESCRIPTION_WORDS]
+            )
+            # Mesma expressão do trigger da migration 0016
+            cursor.execute(
+                f"UPDATE {BENCHMARK_TABLE} SET search_vector = to_tsvector('{SEARCH_CONFIG}', description)")
+            cursor.execute(f'CREATE INDEX {BENCHMARK_TABLE}_gin_idx ON {BENCHMARK_TABLE} USING gin (search_vector)')
+            cursor.execute(
+                f'CREATE INDEX {BENCHMARK_TABLE}_relative_date_idx ON {BENCHMARK_TABLE} (relative_id, date, id)')
+            cursor.execute(f'VACUUM ANALYZE {BENCHMARK_TABLE}')
@@ -0,0 +1,32 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from backend.api.balances.models import BalanceCheckpoint
+
+
+class Command(BaseCommand):
+    help = 'Write month-end balance checkpoints (run monthly); --rebuild recomputes all months'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--month', help='Month to close (YYYY-MM). Default: previous month')
+        parser.add_argument('--rebuild', action='store_true',
+                            help='Rebuild every checkpoint up to the previous month (repair)')
+        parser.add_argument('--account', type=int, default=None, help='With --rebuild: only this account id')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        if options['rebuild']:
+            rows = BalanceCheckpoint.rebuild(account_id=options['account'], batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(f'Balance checkpoints rebuilt: {rows} rows.'))
+            return
+
+        month = None
+        if options['month']:
+            try:
+                month = datetime.strptime(options['month'], '%Y-%m').date()
+            except ValueError:
+                raise CommandError('Invalid --month. Use YYYY-MM.')
+
+        rows = BalanceCheckpoint.close_month(month, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Balance checkpoints written: {rows} rows.'))
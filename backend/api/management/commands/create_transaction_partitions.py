@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from backend.api.transactions.partitions import convert_to_partitioned, ensure_future_partitions, is_partitioned
+
+
+class Command(BaseCommand):
+    help = 'Create monthly transaction partitions ahead of time (run monthly); --convert partitions the table'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--months-ahead', type=int, default=settings.TRANSACTION_PARTITIONS_AHEAD,
+                            help='Future months that must already have a partition')
+        parser.add_argument('--convert', action='store_true',
+                            help='Convert the plain transaction table into a partitioned one '
+                                 '(copies every row; run in a maintenance window)')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('Transaction partitioning requires PostgreSQL.')
+
+        if not is_partitioned():
+            if not options['convert']:
+                self.stdout.write(self.style.WARNING(
+                    'The transaction table is not partitioned (BRIN layout). Use --convert to partition it.'))
+                return
+            self.stdout.write('Converting the transaction table into monthly partitions...')
+            try:
+                convert_to_partitioned(months_ahead=options['months_ahead'])
+            except ValueError as exc:
+                raise CommandError(str(exc))
+            self.stdout.write(self.style.SUCCESS('Transaction table partitioned.'))
+
+        created = ensure_future_partitions(months_ahead=options['months_ahead'])
+        for name in created:
+            self.stdout.write(f'  {name}')
+        self.stdout.write(self.style.SUCCESS(f'Transaction partitions created: {len(created)}.'))
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from backend.api.users.models import User
+from backend.api.users.portability import write_user_archive
+
+
+class Command(BaseCommand):
+    help = "Export all data owned by a user to a gzip JSON Lines archive (LGPD data portability)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('output', help='Destination file (e.g. user.jsonl.gz)')
+        parser.add_argument('--user', required=True, help='User email')
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(email=options['user']).first()
+        if user is None:
+            raise CommandError(f"User {options['user']} not found.")
+
+        write_user_archive(user, options['output'])
+        self.stdout.write(self.style.SUCCESS(f"Data of {user.email} exported to {options['output']}."))
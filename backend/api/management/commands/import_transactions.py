@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from backend.api.accounts.models import Account
+from backend.api.categories.models import Category
+from backend.api.transactions.importers import IMPORT_BATCH_SIZE, TransactionImporter, parse_csv, parse_ofx
+
+
+class Command(BaseCommand):
+    help = 'Import a CSV/OFX bank statement into an account (streamed, batched bulk inserts)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV or OFX file')
+        parser.add_argument('--account', type=int, required=True, help='Default account id')
+        parser.add_argument('--expense-category', type=int, help='Default category id for expenses')
+        parser.add_argument('--income-category', type=int, help='Default category id for income')
+        parser.add_argument('--format', choices=['csv', 'ofx'], help='File format (default: file extension)')
+        parser.add_argument('--encoding', default='utf-8-sig')
+        parser.add_argument('--batch-size', type=int, default=IMPORT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        account = Account.objects.filter(pk=options['account']).first()
+        if account is None:
+            raise CommandError(f"Account {options['account']} not found.")
+
+        categories = {}
+        for option, type_category in (('expense_category', 'despesas'), ('income_category', 'receitas')):
+            if options[option] is None:
+                continue
+            category = Category.objects.filter(
+                pk=options[option], user_id=account.user_id, relative_id=account.relative_id,
+                type_category=type_category
+            ).first()
+            if category is None:
+                raise CommandError(f"Category {options[option]} not found for this account's relative ({type_category}).")
+            categories[option] = category
+
+        file_format = options['format'] or options['path'].rsplit('.', 1)[-1].lower()
+        if file_format not in ('csv', 'ofx'):
+            raise CommandError('Unknown file format. Use --format=csv or --format=ofx.')
+
+        with open(options['path'], encoding=options['encoding'], errors='replace', newline='') as stream:
+            rows = parse_csv(stream) if file_format == 'csv' else parse_ofx(stream)
+            result = TransactionImporter(
+                account.user,
+                account.relative_id,
+                account,
+                batch_size=options['batch_size'],
+                **categories
+            ).run(rows)
+
+        for error in result['errors']:
+            self.stdout.write(self.style.WARNING(f"line {error['line']}: {error['errors']}"))
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {result['created']} transactions "
+            f"({result['duplicates']} duplicates skipped, {result['error_count']} invalid rows)."))
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from backend.api.summaries.models import MonthlySummary
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the monthly summary table from transactions (repair)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--relative', type=int, default=None,
+                            help='Rebuild only the given relative (profile) id')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        scope = f"relative {options['relative']}" if options['relative'] else 'all relatives'
+        self.stdout.write(f'Rebuilding monthly summary for {scope}...')
+
+        rows = MonthlySummary.rebuild(relative_id=options['relative'], batch_size=options['batch_size'])
+
+        self.stdout.write(self.style.SUCCESS(f'Monthly summary rebuilt: {rows} rows.'))
@@ -0,0 +1,37 @@
+import gzip
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError as APIValidationError
+
+from backend.api.users.models import User
+from backend.api.users.portability import RESTORE_BATCH_SIZE, restore_user_archive
+
+
+class Command(BaseCommand):
+    help = 'Restore a user data archive (created by export_user_data) into a fresh account'
+
+    def add_arguments(self, parser):
+        parser.add_argument('archive', help='Archive file (.jsonl.gz)')
+        parser.add_argument('--user', help='Existing user email with no data (default: create the user from the archive)')
+        parser.add_argument('--batch-size', type=int, default=RESTORE_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        user = None
+        if options['user']:
+            user = User.objects.filter(email=options['user']).first()
+            if user is None:
+                raise CommandError(f"User {options['user']} not found.")
+
+        try:
+            with gzip.open(options['archive'], 'rt', encoding='utf-8') as lines:
+                user, counts = restore_user_archive(lines, user=user, batch_size=options['batch_size'])
+        except ValidationError as exc:
+            raise CommandError(' '.join(exc.messages))
+        except APIValidationError as exc:
+            # Validações do User (ex.: CPF) ao criar o usuário a partir do arquivo
+            raise CommandError(str(exc.detail))
+
+        for model_name, count in counts.items():
+            self.stdout.write(f'  {model_name}: {count}')
+        self.stdout.write(self.style.SUCCESS(f'Data restored into {user.email}.'))
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.15 on 2026-10-17 01:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='category',
+            constraint=models.UniqueConstraint(condition=models.Q(('subcategory__isnull', True)), fields=('user', 'relative', 'name'), name='category_unique_root_name'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.1.15 on 2026-10-17 01:06
+
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery, Value
+from django.db.models.functions import Concat
+
+
+def populate_full_name(apps, schema_editor):
+    """
+    Preenche o caminho completo das categorias existentes.
+    """
+    Category = apps.get_model('api', 'Category')
+    Category.objects.filter(subcategory__isnull=True).update(full_name=F('name'))
+
+    parent_name = Category.objects.filter(pk=OuterRef('subcategory_id')).values('name')[:1]
+    Category.objects.filter(subcategory__isnull=False).update(
+        full_name=Concat(Subquery(parent_name), Value(' > '), F('name'))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_category_unique_root_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='full_name',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255),
+        ),
+        migrations.RunPython(populate_full_name, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.15 on 2026-10-17 01:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_category_full_name'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='account',
+            index=models.Index(condition=models.Q(('is_archived', False)), fields=['user', 'relative', 'name', 'id'], name='account_active_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='account',
+            index=models.Index(condition=models.Q(('is_archived', False)), fields=['user', 'name', 'id'], name='account_user_active_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(condition=models.Q(('is_archived', False)), fields=['user', 'relative', 'name', 'id'], name='category_active_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(condition=models.Q(('is_archived', False)), fields=['user', 'name', 'id'], name='category_user_active_name_idx'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+from django.contrib.postgres.operations import TrigramExtension, UnaccentExtension
+from django.db import migrations
+
+# Índices GIN trigram sobre a mesma expressão usada por filter_name_search
+NAME_SEARCH_INDEXES = {
+    'account_name_trgm_idx': 'account',
+    'category_name_trgm_idx': 'category',
+}
+
+
+def create_name_search_indexes(apps, schema_editor):
+    """
+    Cria a função immutable_unaccent e os índices GIN trigram (apenas PostgreSQL).
+    No SQLite a função é registrada em Python a cada conexão e a busca varre a tabela.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute(
+        "CREATE OR REPLACE FUNCTION immutable_unaccent(text) RETURNS text AS "
+        "$$ SELECT public.unaccent('public.unaccent', $1) $$ "
+        "LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT"
+    )
+    for index_name, table in NAME_SEARCH_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {index_name} ON {table} '
+            f'USING gin (UPPER(immutable_unaccent(name)) gin_trgm_ops)'
+        )
+
+
+def drop_name_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for index_name in NAME_SEARCH_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {index_name}')
+    schema_editor.execute('DROP FUNCTION IF EXISTS immutable_unaccent(text)')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_list_query_indexes'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        UnaccentExtension(),
+        migrations.RunPython(create_name_search_indexes, drop_name_search_indexes),
+    ]
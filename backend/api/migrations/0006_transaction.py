@@ -0,0 +1,40 @@
+# Generated by Django 5.1.15 on 2026-10-17 01:11
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_name_search_trigram'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Transaction',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('type', models.CharField(choices=[('despesas', 'Despesas'), ('receitas', 'Receitas')], max_length=15, verbose_name='Tipo')),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='Valor')),
+                ('description', models.CharField(blank=True, default='', max_length=200, verbose_name='Descrição')),
+                ('date', models.DateField(verbose_name='Data')),
+                ('is_archived', models.BooleanField(default=False, verbose_name='Excluída')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='transactions', to='api.account', verbose_name='Conta')),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='transactions', to='api.category', verbose_name='Categoria')),
+                ('relative', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='transactions', to='api.relative', verbose_name='Parente')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='transactions', to=settings.AUTH_USER_MODEL, verbose_name='Usuário')),
+            ],
+            options={
+                'verbose_name': 'Transação',
+                'verbose_name_plural': 'Transações',
+                'db_table': 'transaction',
+                'ordering': ['-date', '-id'],
+                'indexes': [models.Index(condition=models.Q(('is_archived', False)), fields=['user', 'relative', '-date', '-id'], name='transaction_active_date_idx')],
+                'constraints': [models.CheckConstraint(condition=models.Q(('amount__gt', 0)), name='transaction_amount_positive')],
+            },
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.1.15 on 2026-10-17 01:13
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_transaction'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transaction',
+            name='direction',
+            field=models.CharField(blank=True, choices=[('saida', 'Saída'), ('entrada', 'Entrada')], default='', max_length=10, verbose_name='Sentido'),
+        ),
+        migrations.AlterField(
+            model_name='transaction',
+            name='category',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='transactions', to='api.category', verbose_name='Categoria'),
+        ),
+        migrations.AlterField(
+            model_name='transaction',
+            name='type',
+            field=models.CharField(choices=[('despesas', 'Despesas'), ('receitas', 'Receitas'), ('transferencia', 'Transferência')], max_length=15, verbose_name='Tipo'),
+        ),
+        migrations.CreateModel(
+            name='Transfer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='Valor')),
+                ('description', models.CharField(blank=True, default='', max_length=200, verbose_name='Descrição')),
+                ('date', models.DateField(verbose_name='Data')),
+                ('is_archived', models.BooleanField(default=False, verbose_name='Excluída')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('from_account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='outgoing_transfers', to='api.account', verbose_name='Conta de origem')),
+                ('relative', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='transfers', to='api.relative', verbose_name='Parente')),
+                ('to_account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='incoming_transfers', to='api.account', verbose_name='Conta de destino')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='transfers', to=settings.AUTH_USER_MODEL, verbose_name='Usuário')),
+            ],
+            options={
+                'verbose_name': 'Transferência',
+                'verbose_name_plural': 'Transferências',
+                'db_table': 'transfer',
+                'ordering': ['-date', '-id'],
+            },
+        ),
+        migrations.AddField(
+            model_name='transaction',
+            name='transfer',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='legs', to='api.transfer', verbose_name='Transferência'),
+        ),
+        migrations.AddConstraint(
+            model_name='transfer',
+            constraint=models.CheckConstraint(condition=models.Q(('amount__gt', 0)), name='transfer_amount_positive'),
+        ),
+        migrations.AddConstraint(
+            model_name='transfer',
+            constraint=models.CheckConstraint(condition=models.Q(('from_account', models.F('to_account')), _negated=True), name='transfer_distinct_accounts'),
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.1.15 on 2026-10-17 01:19
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_monthly_summary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transaction',
+            name='recurrence_date',
+            field=models.DateField(blank=True, null=True, verbose_name='Data da ocorrência'),
+        ),
+        migrations.CreateModel(
+            name='RecurringEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('type', models.CharField(choices=[('despesas', 'Despesas'), ('receitas', 'Receitas')], max_length=15, verbose_name='Tipo')),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='Valor')),
+                ('description', models.CharField(blank=True, default='', max_length=200, verbose_name='Descrição')),
+                ('frequency', models.CharField(choices=[('diaria', 'Diária'), ('semanal', 'Semanal'), ('mensal', 'Mensal'), ('anual', 'Anual')], max_length=10, verbose_name='Frequência')),
+                ('interval', models.PositiveSmallIntegerField(default=1, verbose_name='Intervalo')),
+                ('start_date', models.DateField(verbose_name='Data inicial')),
+                ('end_date', models.DateField(blank=True, null=True, verbose_name='Data final')),
+                ('is_archived', models.BooleanField(default=False, verbose_name='Excluído')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recurring_entries', to='api.account', verbose_name='Conta')),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recurring_entries', to='api.category', verbose_name='Categoria')),
+                ('relative', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recurring_entries', to='api.relative', verbose_name='Parente')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recurring_entries', to=settings.AUTH_USER_MODEL, verbose_name='Usuário')),
+            ],
+            options={
+                'verbose_name': 'Lançamento recorrente',
+                'verbose_name_plural': 'Lançamentos recorrentes',
+                'db_table': 'recurring_entry',
+                'ordering': ['start_date', 'id'],
+            },
+        ),
+        migrations.AddField(
+            model_name='transaction',
+            name='recurring_entry',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='transactions', to='api.recurringentry', verbose_name='Lançamento recorrente'),
+        ),
+        migrations.AddConstraint(
+            model_name='transaction',
+            constraint=models.UniqueConstraint(condition=models.Q(('recurring_entry__isnull', False)), fields=('recurring_entry', 'recurrence_date'), name='transaction_unique_recurring_date'),
+        ),
+        migrations.AddConstraint(
+            model_name='recurringentry',
+            constraint=models.CheckConstraint(condition=models.Q(('amount__gt', 0)), name='recurring_entry_amount_positive'),
+        ),
+        migrations.AddConstraint(
+            model_name='recurringentry',
+            constraint=models.CheckConstraint(condition=models.Q(('interval__gte', 1)), name='recurring_entry_interval_positive'),
+        ),
+    ]
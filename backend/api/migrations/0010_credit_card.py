@@ -0,0 +1,94 @@
+# Generated by Django 5.1.15 on 2026-10-17 01:21
+
+import backend.api.core.mixins.unique_constraint
+import django.core.validators
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_recurring_entry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CreditCard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, verbose_name='Nome')),
+                ('limit', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='Limite')),
+                ('closing_day', models.PositiveSmallIntegerField(validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(31)], verbose_name='Dia de fechamento')),
+                ('due_day', models.PositiveSmallIntegerField(validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(31)], verbose_name='Dia de vencimento')),
+                ('color', models.CharField(max_length=7, verbose_name='Cor')),
+                ('is_archived', models.BooleanField(default=False, verbose_name='Arquivado')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('relative', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='credit_cards', to='api.relative', verbose_name='Parente')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='credit_cards', to=settings.AUTH_USER_MODEL, verbose_name='Usuário')),
+            ],
+            options={
+                'verbose_name': 'Cartão de crédito',
+                'verbose_name_plural': 'Cartões de crédito',
+                'db_table': 'credit_card',
+                'unique_together': {('user', 'relative', 'name')},
+            },
+            bases=(backend.api.core.mixins.unique_constraint.UniqueConstraintMixin, models.Model),
+        ),
+        migrations.CreateModel(
+            name='CreditCardExpense',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('description', models.CharField(blank=True, default='', max_length=200, verbose_name='Descrição')),
+                ('total_amount', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='Valor total')),
+                ('installments_count', models.PositiveSmallIntegerField(default=1, validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(48)], verbose_name='Parcelas')),
+                ('purchase_date', models.DateField(verbose_name='Data da compra')),
+                ('is_archived', models.BooleanField(default=False, verbose_name='Excluído')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('card', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='expenses', to='api.creditcard', verbose_name='Cartão')),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='credit_card_expenses', to='api.category', verbose_name='Categoria')),
+                ('relative', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='credit_card_expenses', to='api.relative', verbose_name='Parente')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='credit_card_expenses', to=settings.AUTH_USER_MODEL, verbose_name='Usuário')),
+            ],
+            options={
+                'verbose_name': 'Gasto de cartão',
+                'verbose_name_plural': 'Gastos de cartão',
+                'db_table': 'credit_card_expense',
+                'ordering': ['-purchase_date', '-id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='CreditCardInstallment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('number', models.PositiveSmallIntegerField(verbose_name='Parcela')),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='Valor')),
+                ('invoice_month', models.DateField(verbose_name='Fatura')),
+                ('is_archived', models.BooleanField(default=False, verbose_name='Excluída')),
+                ('card', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='installments', to='api.creditcard', verbose_name='Cartão')),
+                ('expense', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='installments', to='api.creditcardexpense', verbose_name='Gasto')),
+                ('relative', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='credit_card_installments', to='api.relative', verbose_name='Parente')),
+            ],
+            options={
+                'verbose_name': 'Parcela de cartão',
+                'verbose_name_plural': 'Parcelas de cartão',
+                'db_table': 'credit_card_installment',
+                'ordering': ['invoice_month', 'id'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='creditcardexpense',
+            constraint=models.CheckConstraint(condition=models.Q(('total_amount__gt', 0)), name='credit_card_expense_amount_positive'),
+        ),
+        migrations.AddIndex(
+            model_name='creditcardinstallment',
+            index=models.Index(condition=models.Q(('is_archived', False)), fields=['card', 'invoice_month'], name='installment_card_invoice_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='creditcardinstallment',
+            constraint=models.UniqueConstraint(fields=('expense', 'number'), name='credit_card_installment_unique_number'),
+        ),
+    ]
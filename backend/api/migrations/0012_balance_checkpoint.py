@@ -0,0 +1,29 @@
+# Generated by Django 5.1.15 on 2026-10-17 01:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_transaction_external_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BalanceCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(verbose_name='Mês')),
+                ('balance', models.DecimalField(decimal_places=2, max_digits=14, verbose_name='Saldo')),
+                ('account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='balance_checkpoints', to='api.account', verbose_name='Conta')),
+            ],
+            options={
+                'verbose_name': 'Saldo de fechamento',
+                'verbose_name_plural': 'Saldos de fechamento',
+                'db_table': 'balance_checkpoint',
+                'constraints': [models.UniqueConstraint(fields=('account', 'month'), name='balance_checkpoint_unique_month')],
+            },
+        ),
+    ]
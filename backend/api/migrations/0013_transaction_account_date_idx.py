@@ -0,0 +1,17 @@
+# Generated by Django 5.1.15 on 2026-10-17 01:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_balance_checkpoint'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(condition=models.Q(('is_archived', False)), fields=['account', 'date', 'id'], name='transaction_account_date_idx'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.1.15 on 2026-10-17 01:40
+
+import backend.api.core.fields.month
+from django.db import migrations, models
+from django.db.models.functions import TruncMonth
+
+
+def populate_month(apps, schema_editor):
+    """
+    Preenche o mês local dos lançamentos existentes.
+    """
+    Transaction = apps.get_model('api', 'Transaction')
+    Transaction.objects.update(month=TruncMonth('date'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_transaction_account_date_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transaction',
+            name='month',
+            field=backend.api.core.fields.month.MonthField(null=True, source='date', verbose_name='Mês'),
+        ),
+        migrations.RunPython(populate_month, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='transaction',
+            name='month',
+            field=backend.api.core.fields.month.MonthField(source='date', verbose_name='Mês'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(condition=models.Q(('is_archived', False)), fields=['relative', 'month'], name='transaction_relative_month_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='monthlysummary',
+            index=models.Index(fields=['user', 'month'], name='monthly_summary_user_month_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+from django.db import migrations
+
+from backend.api.transactions.partitions import drop_brin_index, setup_ledger_storage
+
+
+def setup_storage(apps, schema_editor):
+    """
+    Índice BRIN em date ou tabela particionada por mês, conforme TRANSACTION_PARTITIONING
+    (apenas PostgreSQL). Bancos existentes podem ser particionados depois com
+    create_transaction_partitions --convert.
+    """
+    setup_ledger_storage(schema_editor.connection)
+
+
+def teardown_storage(apps, schema_editor):
+    # A tabela particionada é compatível com o model e permanece como está
+    if schema_editor.connection.vendor == 'postgresql':
+        drop_brin_index(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_transaction_month'),
+    ]
+
+    operations = [
+        migrations.RunPython(setup_storage, teardown_storage),
+    ]
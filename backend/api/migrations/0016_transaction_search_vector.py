@@ -0,0 +1,63 @@
+import django.contrib.postgres.search
+from django.db import migrations
+
+# Configuração de busca: português (stemming e stopwords) precedido de unaccent
+SEARCH_CONFIG = 'portuguese_unaccent'
+SEARCH_INDEX = 'transaction_search_idx'
+SEARCH_TRIGGER = 'transaction_search_vector_trigger'
+SEARCH_FUNCTION = 'transaction_search_vector_update'
+
+
+def create_full_text_search(apps, schema_editor):
+    """
+    Cria a configuração de busca, o trigger que mantém transaction.search_vector a partir da
+    descrição e o índice GIN (apenas PostgreSQL). No SQLite a busca compara o texto sem acentos.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute(f'DROP TEXT SEARCH CONFIGURATION IF EXISTS {SEARCH_CONFIG}')
+    schema_editor.execute(f'CREATE TEXT SEARCH CONFIGURATION {SEARCH_CONFIG} (COPY = pg_catalog.portuguese)')
+    schema_editor.execute(
+        f'ALTER TEXT SEARCH CONFIGURATION {SEARCH_CONFIG} '
+        f'ALTER MAPPING FOR hword, hword_part, word WITH public.unaccent, portuguese_stem'
+    )
+    schema_editor.execute(
+        f'CREATE OR REPLACE FUNCTION {SEARCH_FUNCTION}() RETURNS trigger AS $$ '
+        f"BEGIN NEW.search_vector := to_tsvector('public.{SEARCH_CONFIG}', COALESCE(NEW.description, '')); "
+        f'RETURN NEW; END $$ LANGUAGE plpgsql'
+    )
+    schema_editor.execute(
+        f'CREATE TRIGGER {SEARCH_TRIGGER} BEFORE INSERT OR UPDATE OF description ON transaction '
+        f'FOR EACH ROW EXECUTE FUNCTION {SEARCH_FUNCTION}()'
+    )
+    schema_editor.execute(
+        f"UPDATE transaction SET search_vector = to_tsvector('public.{SEARCH_CONFIG}', description)"
+    )
+    schema_editor.execute(f'CREATE INDEX IF NOT EXISTS {SEARCH_INDEX} ON transaction USING gin (search_vector)')
+
+
+def drop_full_text_search(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute(f'DROP INDEX IF EXISTS {SEARCH_INDEX}')
+    schema_editor.execute(f'DROP TRIGGER IF EXISTS {SEARCH_TRIGGER} ON transaction')
+    schema_editor.execute(f'DROP FUNCTION IF EXISTS {SEARCH_FUNCTION}()')
+    schema_editor.execute(f'DROP TEXT SEARCH CONFIGURATION IF EXISTS {SEARCH_CONFIG}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_transaction_ledger_storage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transaction',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_full_text_search, drop_full_text_search),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations
+
+from backend.api.transactions.partitions import ensure_unique_keys, is_partitioned
+
+
+def create_unique_keys(apps, schema_editor):
+    """
+    Tabelas particionadas antes desta migration tinham só índices únicos por partição:
+    cria a tabela de unicidade global e preenche as chaves dos lançamentos existentes.
+    """
+    if is_partitioned(connection=schema_editor.connection):
+        ensure_unique_keys(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_transaction_search_vector'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_unique_keys, migrations.RunPython.noop),
+    ]
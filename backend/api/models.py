@@ -5,3 +5,8 @@ from .users.models import User
 from .relatives.models import Relative
 from .accounts.models import Account
 from .categories.models import Category
+from .transactions.models import Transaction, Transfer
+from .recurring.models import RecurringEntry
+from .credit_cards.models import CreditCard, CreditCardExpense, CreditCardInstallment
+from .summaries.models import MonthlySummary
+from .balances.models import BalanceCheckpoint
@@ -0,0 +1,87 @@
+"""
+Motor de recorrência: gera as datas de ocorrência apenas dentro da janela pedida,
+sem percorrer dia a dia nem pré-gerar lançamentos.
+
+As datas são datas locais (America/Sao_Paulo, settings.TIME_ZONE). Em regras mensais e
+anuais o dia da data inicial é preservado e limitado ao último dia de meses mais curtos
+(31/01 -> 28/02 -> 31/03; 29/02 -> 28/02 em anos não bissextos).
+"""
+from calendar import monthrange
+from datetime import date
+from functools import lru_cache
+
+DAILY = 'diaria'
+WEEKLY = 'semanal'
+MONTHLY = 'mensal'
+YEARLY = 'anual'
+
+FREQUENCIES = [
+    (DAILY, 'Diária'),
+    (WEEKLY, 'Semanal'),
+    (MONTHLY, 'Mensal'),
+    (YEARLY, 'Anual'),
+]
+
+# Passo de cada frequência: em dias (diária/semanal) ou em meses (mensal/anual)
+DAY_STEPS = {DAILY: 1, WEEKLY: 7}
+MONTH_STEPS = {MONTHLY: 1, YEARLY: 12}
+
+
+def _month_index(value):
+    return value.year * 12 + value.month - 1
+
+
+@lru_cache(maxsize=None)
+def _clamped_date(month_index, day):
+    """
+    Data do dia no mês (índice absoluto), limitada ao último dia do mês.
+    Compartilhada entre todas as regras: só existem 31 dias possíveis por mês da janela.
+    """
+    year, month = divmod(month_index, 12)
+    return date(year, month + 1, min(day, monthrange(year, month + 1)[1]))
+
+
+def _ceil_div(numerator, denominator):
+    return -(-numerator // denominator)
+
+
+def occurrences(frequency, interval, start_date, end_date, window_start, window_end):
+    """
+    Gera (lazy) as datas de ocorrência da regra dentro de [window_start, window_end].
+    A primeira ocorrência da janela é calculada diretamente, sem iterar desde start_date.
+    """
+    first = max(start_date, window_start)
+    last = min(end_date, window_end) if end_date else window_end
+    if first > last:
+        return
+
+    if frequency in DAY_STEPS:
+        step = DAY_STEPS[frequency] * interval
+        anchor = start_date.toordinal()
+        offset = _ceil_div(first.toordinal() - anchor, step) * step
+        for ordinal in range(anchor + offset, last.toordinal() + 1, step):
+            yield date.fromordinal(ordinal)
+        return
+
+    step = MONTH_STEPS[frequency] * interval
+    anchor = _month_index(start_date)
+    month = anchor + max(0, _ceil_div(_month_index(first) - anchor, step)) * step
+    last_month = _month_index(last)
+    while month <= last_month:
+        occurrence = _clamped_date(month, start_date.day)
+        # No primeiro mês da janela a ocorrência pode cair antes do início
+        if first <= occurrence <= last:
+            yield occurrence
+        month += step
+
+
+def expand_rules(rules, window_start, window_end):
+    """
+    Expande em lote várias regras numa única passada.
+    rules: iterável de (id, frequency, interval, start_date, end_date), por exemplo
+    values_list(...).iterator() — as regras não precisam caber todas em memória.
+    Gera pares (id, data).
+    """
+    for rule_id, frequency, interval, start_date, end_date in rules:
+        for occurrence in occurrences(frequency, interval, start_date, end_date, window_start, window_end):
+            yield rule_id, occurrence
@@ -0,0 +1,141 @@
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+
+from .engine import FREQUENCIES, expand_rules, occurrences
+
+
+class RecurringEntry(models.Model):
+    """
+    Regra de lançamento recorrente (receita ou despesa).
+    As ocorrências são calculadas sob demanda pelo motor de recorrência e só viram
+    Transactions quando um período é materializado.
+    """
+    ENTRY_TYPES = [
+        ('despesas', 'Despesas'),
+        ('receitas', 'Receitas'),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='recurring_entries',
+        verbose_name='Usuário'
+    )
+    relative = models.ForeignKey(
+        'api.Relative',
+        on_delete=models.CASCADE,
+        related_name='recurring_entries',
+        verbose_name='Parente'
+    )
+    account = models.ForeignKey(
+        'api.Account',
+        on_delete=models.CASCADE,
+        related_name='recurring_entries',
+        verbose_name='Conta'
+    )
+    category = models.ForeignKey(
+        'api.Category',
+        on_delete=models.CASCADE,
+        related_name='recurring_entries',
+        verbose_name='Categoria'
+    )
+    type = models.CharField(max_length=15, choices=ENTRY_TYPES, verbose_name='Tipo')
+    amount = models.DecimalField(max_digits=10, decimal_places=2, verbose_name='Valor')
+    description = models.CharField(max_length=200, blank=True, default='', verbose_name='Descrição')
+    frequency = models.CharField(max_length=10, choices=FREQUENCIES, verbose_name='Frequência')
+    interval = models.PositiveSmallIntegerField(default=1, verbose_name='Intervalo')
+    start_date = models.DateField(verbose_name='Data inicial')
+    end_date = models.DateField(null=True, blank=True, verbose_name='Data final')
+    is_archived = models.BooleanField(default=False, verbose_name='Excluído')
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'recurring_entry'
+        verbose_name = 'Lançamento recorrente'
+        verbose_name_plural = 'Lançamentos recorrentes'
+        ordering = ['start_date', 'id']
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(amount__gt=0),
+                name='recurring_entry_amount_positive'
+            ),
+            models.CheckConstraint(
+                condition=models.Q(interval__gte=1),
+                name='recurring_entry_interval_positive'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.description or self.get_type_display()} ({self.get_frequency_display()})"
+
+    def clean(self):
+        if self.end_date and self.end_date < self.start_date:
+            raise ValidationError({'end_date': 'A data final deve ser igual ou posterior à data inicial.'})
+
+    def save(self, *args, **kwargs):
+        self.clean()
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        """
+        Previne exclusão física de lançamentos recorrentes.
+        """
+        raise NotImplementedError("Não é permitido deletar lançamentos recorrentes.")
+
+    def occurrences(self, window_start, window_end):
+        """
+        Datas de ocorrência desta regra dentro da janela (gerador).
+        """
+        return occurrences(self.frequency, self.interval, self.start_date, self.end_date,
+                           window_start, window_end)
+
+    @classmethod
+    def materialize(cls, user, relative_id, window_start, window_end):
+        """
+        Cria as Transactions das ocorrências do período que ainda não foram materializadas.
+        Ocorrências já materializadas (inclusive lançamentos excluídos) não são recriadas.
+        Retorna a lista de lançamentos criados.
+        """
+        from backend.api.transactions.models import Transaction, bulk_create_transactions
+
+        with transaction.atomic():
+            # Bloqueia as regras (ordem de id) para que materializações simultâneas não dupliquem lançamentos.
+            # Apenas as regras (of=self): contas e categorias do JOIN não são bloqueadas aqui; as contas
+            # são bloqueadas em ordem de id por lock_accounts dentro de bulk_create_transactions
+            entries = {
+                entry.id: entry
+                for entry in cls.objects.select_for_update(of=('self',))
+                .filter(user=user, relative_id=relative_id, is_archived=False)
+                .select_related('account', 'category')
+                .order_by('id')
+            }
+            existing = set(
+                Transaction.objects.filter(
+                    recurring_entry_id__in=entries,
+                    recurrence_date__gte=window_start,
+                    recurrence_date__lte=window_end
+                ).values_list('recurring_entry_id', 'recurrence_date')
+            )
+
+            rules = ((entry.id, entry.frequency, entry.interval, entry.start_date, entry.end_date)
+                     for entry in entries.values())
+            transactions = [
+                Transaction(
+                    user=user,
+                    relative_id=relative_id,
+                    account=entries[entry_id].account,
+                    category=entries[entry_id].category,
+                    recurring_entry=entries[entry_id],
+                    type=entries[entry_id].type,
+                    amount=entries[entry_id].amount,
+                    description=entries[entry_id].description,
+                    date=occurrence,
+                    recurrence_date=occurrence,
+                )
+                for entry_id, occurrence in expand_rules(rules, window_start, window_end)
+                if (entry_id, occurrence) not in existing and not entries[entry_id].account.is_archived
+            ]
+            return bulk_create_transactions(transactions) if transactions else []
@@ -0,0 +1,74 @@
+from rest_framework import serializers
+
+from backend.api.core.mixins.relative_scope import (RelativeScopedSerializerMixin,
+                                                   resolve_relative_id)
+from backend.api.transactions.serializers import validate_account_and_category
+
+from .models import RecurringEntry
+
+
+class RecurringEntrySerializer(RelativeScopedSerializerMixin, serializers.ModelSerializer):
+    class Meta:
+        model = RecurringEntry
+        fields = '__all__'
+        read_only_fields = ['user', 'relative', 'is_archived']  # Definidos automaticamente
+
+    def validate_amount(self, value):
+        if value <= 0:
+            raise serializers.ValidationError("O valor deve ser maior que zero.")
+        return value
+
+    def validate_interval(self, value):
+        if value < 1:
+            raise serializers.ValidationError("O intervalo deve ser maior que zero.")
+        return value
+
+    def validate(self, attrs):
+        """
+        Valida conta, categoria e tipo como num lançamento comum e o período da regra.
+        """
+        request = self.context['request']
+        relative_id = self.instance.relative_id if self.instance else resolve_relative_id(request)
+
+        def current(field):
+            return attrs.get(field, getattr(self.instance, field, None))
+
+        validate_account_and_category(
+            request.user.pk, relative_id, current('account'), current('category'), current('type'),
+            account_changed='account' in attrs)
+
+        start_date, end_date = current('start_date'), current('end_date')
+        if start_date and end_date and end_date < start_date:
+            raise serializers.ValidationError(
+                {'end_date': 'A data final deve ser igual ou posterior à data inicial.'})
+
+        return attrs
+
+    def create(self, validated_data):
+        """
+        Cria a regra associando automaticamente ao usuário logado e relative do header.
+        """
+        validated_data['user'] = self.context['request'].user
+
+        # Perfil do header já resolvido e autorizado para este request
+        validated_data['relative_id'] = self.get_request_relative_id()
+
+        return super().create(validated_data)
+
+
+class PeriodSerializer(serializers.Serializer):
+    """
+    Período (datas inclusivas) para expandir ou materializar ocorrências.
+    """
+    start = serializers.DateField()
+    end = serializers.DateField()
+
+    # Limite da janela para não materializar anos de lançamentos de uma vez
+    MAX_PERIOD_DAYS = 366
+
+    def validate(self, attrs):
+        if attrs['end'] < attrs['start']:
+            raise serializers.ValidationError({'end': 'A data final deve ser igual ou posterior à data inicial.'})
+        if (attrs['end'] - attrs['start']).days >= self.MAX_PERIOD_DAYS:
+            raise serializers.ValidationError({'end': 'O período máximo é de um ano.'})
+        return attrs
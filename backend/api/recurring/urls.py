@@ -0,0 +1,11 @@
+from django.urls import include, path
+from rest_framework.routers import DefaultRouter
+
+from .views import RecurringEntryViewSet
+
+router = DefaultRouter()
+router.register(r'recurring-entries', RecurringEntryViewSet)
+
+urlpatterns = [
+    path('', include(router.urls)),
+]
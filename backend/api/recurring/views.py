@@ -0,0 +1,109 @@
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from backend.api.core.mixins.relative_scope import RelativeScopedViewSetMixin
+from backend.api.transactions.serializers import TransactionSerializer
+
+from .engine import expand_rules
+from .models import RecurringEntry
+from .serializers import PeriodSerializer, RecurringEntrySerializer
+
+
+class RecurringEntryViewSet(RelativeScopedViewSetMixin, viewsets.ModelViewSet):
+    """
+    ViewSet para operações CRUD da entidade RecurringEntry.
+    As ocorrências são calculadas sob demanda (occurrences) e materializadas
+    em lançamentos apenas para o período pedido (materialize).
+    """
+    queryset = RecurringEntry.objects.all()
+    serializer_class = RecurringEntrySerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        """
+        Mostra apenas regras do usuário autenticado (e do perfil do header, se presente).
+        Por padrão, mostra apenas regras não excluídas.
+        """
+        queryset = RecurringEntry.objects.filter(user=self.request.user)
+        queryset = self.filter_by_relative(queryset)
+
+        if self.action in ('list', 'occurrences'):
+            only_archived = self.request.query_params.get('only_archived', 'false')
+            queryset = queryset.filter(is_archived=only_archived.lower() == 'true')
+
+        return queryset.order_by('start_date', 'id')
+
+    def perform_create(self, serializer):
+        """
+        Associa a regra ao usuário autenticado durante a criação.
+        """
+        serializer.save(user=self.request.user)
+
+    def destroy(self, request, *args, **kwargs):
+        """
+        Exclui logicamente a regra; lançamentos já materializados são mantidos.
+        """
+        entry = self.get_object()
+        entry.is_archived = True
+        entry.save()
+
+        return Response(
+            {"detail": "Lançamento recorrente excluído com sucesso."},
+            status=status.HTTP_200_OK
+        )
+
+    @action(detail=False, methods=['get'])
+    def occurrences(self, request):
+        """
+        Lista as ocorrências previstas no período (?start=AAAA-MM-DD&end=AAAA-MM-DD) sem criar lançamentos.
+        """
+        period = PeriodSerializer(data=request.query_params)
+        period.is_valid(raise_exception=True)
+        start, end = period.validated_data['start'], period.validated_data['end']
+
+        entries = {
+            entry['id']: entry
+            for entry in self.get_queryset().values(
+                'id', 'frequency', 'interval', 'start_date', 'end_date', 'type', 'amount', 'description',
+                'account_id', 'category_id')
+        }
+        rules = ((entry['id'], entry['frequency'], entry['interval'], entry['start_date'], entry['end_date'])
+                 for entry in entries.values())
+
+        results = [
+            {
+                'recurring_entry': entry_id,
+                'date': occurrence,
+                'type': entries[entry_id]['type'],
+                'amount': str(entries[entry_id]['amount']),
+                'description': entries[entry_id]['description'],
+                'account': entries[entry_id]['account_id'],
+                'category': entries[entry_id]['category_id'],
+            }
+            for entry_id, occurrence in expand_rules(rules, start, end)
+        ]
+        results.sort(key=lambda item: (item['date'], item['recurring_entry']))
+        return Response({'start': start, 'end': end, 'results': results})
+
+    @action(detail=False, methods=['post'])
+    def materialize(self, request):
+        """
+        Cria os lançamentos das ocorrências do período ({"start", "end"}) no perfil do header.
+        Pode ser chamado mais de uma vez: ocorrências já materializadas são ignoradas.
+        """
+        relative_id = self.require_relative_id()
+        period = PeriodSerializer(data=request.data)
+        period.is_valid(raise_exception=True)
+
+        created = RecurringEntry.materialize(
+            request.user, relative_id, period.validated_data['start'], period.validated_data['end'])
+
+        return Response(
+            {
+                'created': len(created),
+                'results': TransactionSerializer(created, many=True, context={'request': request}).data,
+            },
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK
+        )
@@ -0,0 +1,41 @@
+from django.core.cache import cache
+
+# Prefixo das chaves de cache com os ids de perfis de cada usuário
+OWNED_RELATIVES_KEY = 'relatives:owned:{user_id}'
+
+
+def get_owned_relative_ids(user_id):
+    """
+    Retorna o conjunto de ids de perfis pertencentes ao usuário.
+    O resultado fica em cache até que algum perfil do usuário seja salvo.
+    """
+    key = OWNED_RELATIVES_KEY.format(user_id=user_id)
+    relative_ids = cache.get(key)
+    if relative_ids is None:
+        from .models import Relative
+
+        relative_ids = frozenset(
+            Relative.objects.filter(user_id=user_id).values_list('id', flat=True)
+        )
+        cache.set(key, relative_ids)
+    return relative_ids
+
+
+def is_owned_relative(user_id, relative_id):
+    """
+    Verifica se o perfil pertence ao usuário.
+    Perfis não podem ser excluídos nem trocar de dono, então um acerto no cache é
+    sempre válido; em caso de falha o cache é recarregado uma vez antes de negar.
+    """
+    if relative_id in get_owned_relative_ids(user_id):
+        return True
+
+    invalidate_owned_relative_ids(user_id)
+    return relative_id in get_owned_relative_ids(user_id)
+
+
+def invalidate_owned_relative_ids(user_id):
+    """
+    Remove do cache os ids de perfis do usuário.
+    """
+    cache.delete(OWNED_RELATIVES_KEY.format(user_id=user_id))
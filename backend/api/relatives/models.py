@@ -2,8 +2,12 @@ from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
 
+from backend.api.core.mixins.unique_constraint import UniqueConstraintMixin
 
-class Relative(models.Model):
+from .cache import invalidate_owned_relative_ids
+
+
+class Relative(UniqueConstraintMixin, models.Model):
     """
     Modelo que representa perfils/parentes do usuário.
     """
@@ -35,6 +39,11 @@ class Relative(models.Model):
         verbose_name='Atualizado em'
     )
 
+    # Mensagens para violações de unicidade detectadas pelo banco ao salvar
+    unique_error_messages = {
+        ('user', 'name'): {'name': 'Você já possui um perfil com este nome.'},
+    }
+
     class Meta:
         db_table = 'relative'
         verbose_name = 'Parente'
@@ -58,6 +67,7 @@ class Relative(models.Model):
         """
         self.clean()
         super().save(*args, **kwargs)
+        invalidate_owned_relative_ids(self.user_id)
 
     def delete(self, *args, **kwargs):
         """
@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from backend.api.core.mixins.unique_constraint import field_errors_from_model
+
 from .models import Relative
 
 
@@ -16,29 +18,20 @@ class RelativeSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
 
-    def validate_name(self, value):
-        """
-        Verifica se o usuário já possui um perfil com o mesmo nome.
-        """
-        user = self.context['request'].user
-        queryset = Relative.objects.filter(user=user, name=value)
-
-        # Em caso de update, exclui o próprio registro da verificação
-        if self.instance:
-            queryset = queryset.exclude(pk=self.instance.pk)
-
-        if queryset.exists():
-            raise serializers.ValidationError(
-                'Você já possui um perfil com este nome.')
-
-        return value
-
     def create(self, validated_data):
         """
         Cria um novo perfil associando automaticamente ao usuário logado.
         """
         validated_data['user'] = self.context['request'].user
-        return super().create(validated_data)
+        with field_errors_from_model():
+            return super().create(validated_data)
+
+    def update(self, instance, validated_data):
+        """
+        Atualiza o perfil; nome duplicado é detectado pela constraint do banco.
+        """
+        with field_errors_from_model():
+            return super().update(instance, validated_data)
 
 
 class RelativeListSerializer(serializers.ModelSerializer):
@@ -5,6 +5,8 @@ from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from backend.api.core.pagination.keyset import KeysetPagination
+
 from .models import Relative
 from .serializers import RelativeListSerializer, RelativeSerializer
 
@@ -16,6 +18,7 @@ class RelativeViewSet(viewsets.ModelViewSet):
     """
     serializer_class = RelativeSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ['is_archived']
     search_fields = ['name']
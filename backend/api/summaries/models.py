@@ -0,0 +1,137 @@
+from django.conf import settings
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, F, Sum
+
+from backend.api.dashboard.cache import invalidate_dashboard
+
+
+class MonthlySummary(models.Model):
+    """
+    Totais mensais de receitas e despesas por conta e categoria de um perfil.
+    Mantido incrementalmente a cada escrita de lançamento; transferências não entram
+    (apenas movem saldo entre contas). Pode ser reconstruído com rebuild().
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='monthly_summaries',
+        verbose_name='Usuário'
+    )
+    relative = models.ForeignKey(
+        'api.Relative',
+        on_delete=models.CASCADE,
+        related_name='monthly_summaries',
+        verbose_name='Parente'
+    )
+    account = models.ForeignKey(
+        'api.Account',
+        on_delete=models.CASCADE,
+        related_name='monthly_summaries',
+        verbose_name='Conta'
+    )
+    category = models.ForeignKey(
+        'api.Category',
+        on_delete=models.CASCADE,
+        related_name='monthly_summaries',
+        verbose_name='Categoria'
+    )
+    # Primeiro dia do mês
+    month = models.DateField(verbose_name='Mês')
+    type = models.CharField(max_length=15, verbose_name='Tipo')
+    total = models.DecimalField(max_digits=14, decimal_places=2, default=0, verbose_name='Total')
+    count = models.PositiveIntegerField(default=0, verbose_name='Quantidade')
+
+    class Meta:
+        db_table = 'monthly_summary'
+        verbose_name = 'Resumo mensal'
+        verbose_name_plural = 'Resumos mensais'
+        constraints = [
+            # (relative, month) como prefixo: leituras do dashboard viram busca no índice
+            models.UniqueConstraint(
+                fields=['relative', 'month', 'account', 'category', 'type'],
+                name='monthly_summary_unique_key'
+            ),
+        ]
+        indexes = [
+            # Consultas consolidadas da família: todos os perfis do usuário num intervalo de meses
+            models.Index(fields=['user', 'month'], name='monthly_summary_user_month_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.month:%Y-%m} {self.type} - {self.total}"
+
+    @classmethod
+    def rebuild(cls, relative_id=None, batch_size=1000):
+        """
+        Reconstrói o resumo a partir dos lançamentos (todos ou de um perfil) para reparo.
+        Retorna a quantidade de linhas geradas.
+        """
+        from backend.api.relatives.models import Relative
+        from backend.api.transactions.models import Transaction
+
+        transactions = Transaction.objects.filter(is_archived=False).exclude(type='transferencia')
+        summaries = cls.objects.all()
+        if relative_id is not None:
+            transactions = transactions.filter(relative_id=relative_id)
+            summaries = summaries.filter(relative_id=relative_id)
+
+        # Agrupa pela coluna month (mês local já gravado), sem TruncMonth por linha
+        rows = (
+            transactions
+            .values('user_id', 'relative_id', 'account_id', 'category_id', 'month', 'type')
+            .annotate(total=Sum('amount'), count=Count('id'))
+            .order_by()
+        )
+
+        with transaction.atomic():
+            summaries.delete()
+            created = cls.objects.bulk_create((cls(**row) for row in rows.iterator()), batch_size=batch_size)
+
+            relative_ids = [relative_id] if relative_id is not None else Relative.objects.values_list('id', flat=True)
+            for rebuilt_relative_id in relative_ids:
+                invalidate_dashboard(rebuilt_relative_id)
+
+        return len(created)
+
+
+def summary_deltas(original, current):
+    """
+    Combina a entrada anterior e a atual em {chave: (delta_total, delta_quantidade)}.
+    Cada entrada é (chave, valor) ou None quando o lançamento não entra no resumo.
+    """
+    deltas = {}
+    for entry, sign in ((original, -1), (current, 1)):
+        if entry is None:
+            continue
+        key, amount = entry
+        total, count = deltas.get(key, (0, 0))
+        deltas[key] = (total + sign * amount, count + sign)
+
+    return {key: delta for key, delta in deltas.items() if delta != (0, 0)}
+
+
+def apply_summary_deltas(deltas):
+    """
+    Aplica os deltas com UPDATE total = total + delta; cria a linha do mês quando ainda não existe.
+    As chaves são processadas em ordem para manter uma ordem de bloqueio determinística.
+    """
+    for key in sorted(deltas):
+        user_id, relative_id, account_id, category_id, month, type_ = key
+        total, count = deltas[key]
+        lookup = {
+            'relative_id': relative_id,
+            'month': month,
+            'account_id': account_id,
+            'category_id': category_id,
+            'type': type_,
+        }
+        increment = {'total': F('total') + total, 'count': F('count') + count}
+
+        if MonthlySummary.objects.filter(**lookup).update(**increment):
+            continue
+        try:
+            with transaction.atomic():
+                MonthlySummary.objects.create(user_id=user_id, total=total, count=count, **lookup)
+        except IntegrityError:
+            # Outra escrita concorrente criou a linha do mês primeiro
+            MonthlySummary.objects.filter(**lookup).update(**increment)
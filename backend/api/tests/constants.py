@@ -26,7 +26,12 @@ account = Account.objects.create(user=user, **account_data)
 from .constants import get_category_data
 category_data = get_category_data(name="Teste", color="#FF0000")
 category = Category.objects.create(user=user, **category_data)
+
+# Criar lançamento pelo ORM (usuário e perfil vêm da conta, tipo vem da categoria)
+from .constants import get_transaction_model_data
+transaction = Transaction.objects.create(**get_transaction_model_data(account, category, amount='20.00'))
 """
+from decimal import Decimal
 
 # CPFs válidos para testes (com dígitos verificadores corretos)
 VALID_CPFS = {
@@ -93,6 +98,14 @@ DEFAULT_CATEGORY_DATA = {
     'subcategory': None
 }
 
+# Dados padrão para transações (account e category são definidos no teste)
+DEFAULT_TRANSACTION_DATA = {
+    'type': 'despesas',
+    'amount': '150.00',
+    'description': 'Supermercado',
+    'date': '2026-01-15',
+}
+
 # Tipos de categoria válidos
 CATEGORY_TYPES = ['despesas', 'receitas']
 
@@ -183,3 +196,51 @@ def get_category_data(relative=None, **overrides):
         data['relative'] = relative
     data.update(overrides)
     return data
+
+# Função helper para criar dados de transação
+
+
+def get_transaction_data(account=None, category=None, **overrides):
+    """
+    Retorna dados de transação para testes.
+
+    Args:
+        account: Instância do modelo Account (o payload recebe o id)
+        category: Instância do modelo Category (o payload recebe o id)
+        **overrides: Campos a serem sobrescritos
+
+    Returns:
+        dict: Dados da transação
+    """
+    data = DEFAULT_TRANSACTION_DATA.copy()
+    if account:
+        data['account'] = account.id
+    if category:
+        data['category'] = category.id
+    data.update(overrides)
+    return data
+
+
+def get_transaction_model_data(account, category, **overrides):
+    """
+    Retorna dados de transação para criação direta pelo ORM (Transaction.objects.create).
+
+    Args:
+        account: Instância do modelo Account (define também usuário e perfil)
+        category: Instância do modelo Category (define também o tipo)
+        **overrides: Campos a serem sobrescritos
+
+    Returns:
+        dict: Dados da transação
+    """
+    data = DEFAULT_TRANSACTION_DATA.copy()
+    data.update({
+        'user': account.user,
+        'relative': account.relative,
+        'account': account,
+        'category': category,
+        'type': category.type_category,
+    })
+    data.update(overrides)
+    data['amount'] = Decimal(data['amount'])
+    return data
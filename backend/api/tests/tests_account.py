@@ -1,6 +1,10 @@
 from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
 
 from backend.api.accounts.models import Account
+from backend.api.core.pagination.keyset import KeysetPagination
+from backend.api.relatives.models import Relative
 
 from .base import BaseAuthenticatedTestCase
 from .constants import get_account_data
@@ -27,6 +31,9 @@ class AccountTestCase(BaseAuthenticatedTestCase):
         response = self.client.post(
             '/api/v1/accounts/', self.valid_payload, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['error']['name'],
+                         ['Você já possui uma conta com este nome. Use outro nome.'])
+        self.assertEqual(Account.objects.count(), 1)
 
     def test_create_account_invalid_include_calc(self):
         payload = self.valid_payload.copy()
@@ -89,6 +96,19 @@ class AccountTestCase(BaseAuthenticatedTestCase):
         # Deve retornar apenas 1 conta, a ativa
         self.assertEqual(len(response.json().get('results')), 1)
 
+    def test_list_accounts_by_name_ignores_accents(self):
+        payload = self.valid_payload.copy()
+        payload['name'] = 'Saúde'
+        Account.objects.create(user=self.user, relative=self.relative, **payload)
+
+        response = self.client.get('/api/v1/accounts/?name=saude')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([account['name'] for account in response.json().get('results')], ['Saúde'])
+
+        response = self.client.get('/api/v1/accounts/?name=SAÚ')
+        self.assertEqual(len(response.json().get('results')), 1)
+
     def test_update_account(self):
         account = Account.objects.create(user=self.user, relative=self.relative, **self.valid_payload)
         update_payload = {'name': 'Conta Atualizada'}
@@ -205,6 +225,27 @@ class AccountTestCase(BaseAuthenticatedTestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('Perfil não encontrado ou não pertence ao usuário.', str(response.json()))
 
+    def test_list_accounts_with_non_numeric_relative_id(self):
+        # Header com valor não numérico deve ser tratado como perfil inexistente
+        self.client.defaults['HTTP_X_RELATIVE_ID'] = 'abc'
+
+        response = self.client.get('/api/v1/accounts/')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('X-Relative-Id', response.json())
+
+    def test_create_account_with_relative_created_after_cache(self):
+        # Perfil criado depois do primeiro acesso deve ser aceito imediatamente
+        self.client.get('/api/v1/accounts/')
+        new_relative = Relative.objects.create(name='Novo Perfil', user=self.user)
+        self.client.defaults['HTTP_X_RELATIVE_ID'] = str(new_relative.id)
+
+        response = self.client.post(
+            '/api/v1/accounts/', self.valid_payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()['relative'], new_relative.id)
+
     def test_create_account_with_invalid_color_format(self):
         # Cor em formato inválido (nome CSS ao invés de hex) deve ser rejeitada
         payload = self.valid_payload.copy()
@@ -239,3 +280,39 @@ class AccountTestCase(BaseAuthenticatedTestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertTrue(response.json()['is_archived'])
+
+    def test_list_accounts_cursor_pagination(self):
+        # Cria 5 contas e pagina de 2 em 2 pelo cursor (name, id)
+        for name in ['E', 'A', 'C', 'B', 'D']:
+            payload = self.valid_payload.copy()
+            payload['name'] = f'Conta {name}'
+            Account.objects.create(user=self.user, relative=self.relative, **payload)
+
+        names = []
+        url = '/api/v1/accounts/?pagination=cursor&page_size=2'
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn('count', response.json())
+            names += [account['name'] for account in response.json()['results']]
+            url = response.json()['next']
+
+        self.assertEqual(names, ['Conta A', 'Conta B', 'Conta C', 'Conta D', 'Conta E'])
+
+        # Volta uma página a partir da última
+        last_page = self.client.get('/api/v1/accounts/?pagination=cursor&page_size=2')
+        second_page = self.client.get(last_page.json()['next'])
+        previous_page = self.client.get(second_page.json()['previous'])
+        self.assertEqual([account['name'] for account in previous_page.json()['results']],
+                         ['Conta A', 'Conta B'])
+
+    def test_list_accounts_cursor_page_size_is_capped(self):
+        # page_size acima do limite do servidor é reduzido para max_page_size
+        request = Request(APIRequestFactory().get('/api/v1/accounts/', {'page_size': 1000}))
+
+        self.assertEqual(KeysetPagination().get_page_size(request), KeysetPagination.max_page_size)
+
+    def test_list_accounts_invalid_cursor(self):
+        response = self.client.get('/api/v1/accounts/?cursor=invalido')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,187 @@
+from datetime import date
+from decimal import Decimal
+
+from django.db import connection
+from django.test import SimpleTestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from backend.api.accounts.models import Account
+from backend.api.balances.history import _merge_ranges, balances_as_of, running_balances
+from backend.api.balances.models import BalanceCheckpoint
+from backend.api.categories.models import Category
+from backend.api.transactions.models import Transaction
+
+from .base import BaseAuthenticatedTestCase
+from .constants import get_account_data, get_category_data, get_transaction_data
+
+SERIES = ['2025-12-31', '2026-01-09', '2026-01-31', '2026-02-15', '2026-03-31']
+EXPECTED = ['1000.00', '1000.00', '900.00', '1400.00', '1350.00']
+
+
+class MergeRangesTest(SimpleTestCase):
+    def test_merge_ranges(self):
+        self.assertEqual(
+            _merge_ranges([
+                (date(2026, 3, 1), date(2026, 3, 10)),
+                (date(2026, 1, 1), date(2026, 1, 31)),
+                (date(2026, 2, 1), date(2026, 2, 5)),
+                (date(2026, 3, 5), None),
+            ]),
+            [(date(2026, 1, 1), date(2026, 2, 5)), (date(2026, 3, 1), None)]
+        )
+
+
+class BalanceCheckpointTestCase(BaseAuthenticatedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.defaults['HTTP_X_RELATIVE_ID'] = str(self.relative.id)
+        self.account = Account.objects.create(user=self.user, relative=self.relative, **get_account_data())
+        self.expense = Category.objects.create(user=self.user, relative=self.relative, **get_category_data())
+        self.income = Category.objects.create(
+            user=self.user, relative=self.relative, **get_category_data(name='Salário', type_category='receitas'))
+
+        self.post_transaction(self.expense, amount='100.00', date='2026-01-10')
+        self.post_transaction(self.income, type='receitas', amount='500.00', date='2026-02-05')
+        self.post_transaction(self.expense, amount='50.00', date='2026-03-20')
+
+    def post_transaction(self, category, account=None, **overrides):
+        payload = get_transaction_data(account or self.account, category, **overrides)
+        response = self.client.post('/api/v1/transactions/', payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.json())
+        return Transaction.objects.get(pk=response.json()['id'])
+
+    def get_series(self, dates=SERIES):
+        response = self.client.get(f'/api/v1/accounts/{self.account.id}/balance/?date={",".join(dates)}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.json())
+        return [item['balance'] for item in response.json()['balances']]
+
+    def checkpoints(self):
+        return dict(BalanceCheckpoint.objects.filter(account=self.account).values_list('month', 'balance'))
+
+    def close(self, *months):
+        for month in months:
+            BalanceCheckpoint.close_month(month)
+
+    def test_series_without_checkpoints(self):
+        self.assertEqual(self.get_series(), EXPECTED)
+
+    def test_close_month_writes_month_end_balance(self):
+        self.close(date(2026, 1, 1), date(2026, 2, 1))
+        self.assertEqual(self.checkpoints(), {date(2026, 1, 1): Decimal('900.00'), date(2026, 2, 1): Decimal('1400.00')})
+        self.assertEqual(self.get_series(), EXPECTED)
+
+    def test_series_uses_checkpoint_and_one_month_scan(self):
+        self.close(date(2025, 12, 1), date(2026, 1, 1), date(2026, 2, 1))
+
+        with CaptureQueriesContext(connection) as context:
+            result = balances_as_of([self.account], [date.fromisoformat(day) for day in SERIES[1:4]])
+
+        self.assertEqual([str(value) for _, value in result[self.account.id]], EXPECTED[1:4])
+        self.assertEqual(len(context.captured_queries), 2)
+        scan = context.captured_queries[1]['sql']
+        # Apenas os meses das datas pedidas são varridos
+        self.assertIn('2026-01-01', scan)
+        self.assertNotIn('2026-03', scan)
+
+    def test_backdated_transaction_repairs_checkpoints(self):
+        self.close(date(2025, 12, 1), date(2026, 1, 1), date(2026, 2, 1))
+
+        item = self.post_transaction(self.expense, amount='30.00', date='2026-01-02')
+        self.assertEqual(self.checkpoints(), {
+            date(2025, 12, 1): Decimal('1000.00'),
+            date(2026, 1, 1): Decimal('870.00'),
+            date(2026, 2, 1): Decimal('1370.00'),
+        })
+
+        # Edição movendo o lançamento para fevereiro e depois exclusão
+        response = self.client.patch(f'/api/v1/transactions/{item.id}/', {'date': '2026-02-10'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.checkpoints()[date(2026, 1, 1)], Decimal('900.00'))
+        self.assertEqual(self.checkpoints()[date(2026, 2, 1)], Decimal('1370.00'))
+
+        self.client.delete(f'/api/v1/transactions/{item.id}/')
+        self.assertEqual(self.checkpoints()[date(2026, 2, 1)], Decimal('1400.00'))
+        self.assertEqual(self.get_series(), EXPECTED)
+
+    def test_transfer_updates_checkpoints(self):
+        savings = Account.objects.create(
+            user=self.user, relative=self.relative, **get_account_data(name='Poupança', balance='0.00'))
+        self.close(date(2026, 1, 1))
+
+        response = self.client.post('/api/v1/transfers/', {
+            'from_account': self.account.id, 'to_account': savings.id, 'amount': '200.00', 'date': '2026-01-20',
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        self.assertEqual(self.checkpoints()[date(2026, 1, 1)], Decimal('700.00'))
+        self.assertEqual(BalanceCheckpoint.objects.get(account=savings, month=date(2026, 1, 1)).balance,
+                         Decimal('200.00'))
+
+    def test_rebuild_matches_incremental_checkpoints(self):
+        self.close(date(2026, 1, 1), date(2026, 2, 1), date(2026, 3, 1))
+        incremental = self.checkpoints()
+
+        BalanceCheckpoint.rebuild(account_id=self.account.id)
+        rebuilt = self.checkpoints()
+
+        self.assertEqual(rebuilt[date(2025, 12, 1)], Decimal('1000.00'))
+        for month, balance in incremental.items():
+            self.assertEqual(rebuilt[month], balance)
+
+    def test_balance_date_validation(self):
+        url = f'/api/v1/accounts/{self.account.id}/balance/'
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(f'{url}?date=2026-13-01').status_code, status.HTTP_400_BAD_REQUEST)
+        many = ','.join(['2026-01-01'] * 367)
+        self.assertEqual(self.client.get(f'{url}?date={many}').status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_balance_of_another_users_account(self):
+        other_user = self.create_additional_user()
+        other_account = Account.objects.create(
+            user=other_user, relative=other_user.relatives.first(), **get_account_data())
+
+        response = self.client.get(f'/api/v1/accounts/{other_account.id}/balance/?date=2026-01-01')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def running(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def test_list_running_balance(self):
+        results = self.running('/api/v1/transactions/')['results']
+        self.assertEqual([item['running_balance'] for item in results], ['1350.00', '1400.00', '900.00'])
+
+    def test_running_balance_across_cursor_pages_and_filters(self):
+        self.close(date(2025, 12, 1), date(2026, 1, 1))
+
+        first = self.running('/api/v1/transactions/?pagination=cursor&page_size=2')
+        second = self.running(first['next'])
+        self.assertEqual([item['running_balance'] for item in first['results']], ['1350.00', '1400.00'])
+        self.assertEqual([item['running_balance'] for item in second['results']], ['900.00'])
+
+        # Lançamentos fora do filtro continuam entrando no saldo acumulado
+        results = self.running(f'/api/v1/transactions/?category={self.expense.id}')['results']
+        self.assertEqual([item['running_balance'] for item in results], ['1350.00', '900.00'])
+
+    def test_running_balance_same_day_ordered_by_id(self):
+        self.post_transaction(self.expense, amount='10.00', date='2026-03-20')
+        results = self.running('/api/v1/transactions/?start_date=2026-03-01')['results']
+        self.assertEqual([item['running_balance'] for item in results], ['1340.00', '1350.00'])
+
+        response = self.client.get(f"/api/v1/transactions/{results[1]['id']}/")
+        self.assertEqual(response.json()['running_balance'], '1350.00')
+
+    def test_running_balance_uses_window_query(self):
+        self.close(date(2026, 1, 1))
+        page = list(Transaction.objects.filter(account=self.account, date__gte='2026-02-01'))
+
+        with CaptureQueriesContext(connection) as context:
+            result = running_balances(page)
+
+        self.assertEqual(sorted(result.values()), [Decimal('1350.00'), Decimal('1400.00')])
+        window_sql = context.captured_queries[-1]['sql']
+        self.assertIn('OVER (PARTITION BY', window_sql)
+        # Saldo inicial vem do checkpoint de janeiro, sem varrer lançamentos anteriores
+        self.assertEqual(len(context.captured_queries), 3)
@@ -1,3 +1,6 @@
+import base64
+import json
+
 from django.core.exceptions import ValidationError
 from rest_framework import status
 
@@ -336,6 +339,37 @@ class CategoryTestCase(BaseAuthenticatedTestCase):
         # Deve retornar apenas 1 categoria, a ativa
         self.assertEqual(len(response.json().get('results')), 1)
 
+    def test_list_categories_by_name_ignores_accents(self):
+        Category.objects.create(user=self.user, relative=self.relative, **self.valid_payload)
+
+        response = self.client.get('/api/v1/categories/?name=alimentacao')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([category['name'] for category in response.json().get('results')], ['Alimentação'])
+
+    def test_list_categories_cursor_pagination(self):
+        Category.objects.filter(user=self.user, relative=self.relative).delete()
+        for name in ['Lazer', 'Casa', 'Saúde', 'Mercado']:
+            Category.objects.create(user=self.user, relative=self.relative, **{**self.valid_payload, 'name': name})
+
+        names = []
+        url = '/api/v1/categories/?pagination=cursor&page_size=3'
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            names += [category['name'] for category in response.json()['results']]
+            url = response.json()['next']
+
+        self.assertEqual(names, ['Casa', 'Lazer', 'Mercado', 'Saúde'])
+
+    def test_list_categories_cursor_with_wrong_types(self):
+        for position in (['Casa', 'abc'], ['Casa', None], ['Casa', [1]], 'ab'):
+            cursor = base64.urlsafe_b64encode(json.dumps({'position': position}).encode()).decode()
+
+            response = self.client.get(f'/api/v1/categories/?cursor={cursor}')
+
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_list_categories_only_archived(self):
         # Cria categoria ativa
         Category.objects.create(user=self.user, relative=self.relative, **self.valid_payload)
@@ -689,6 +723,44 @@ class CategoryTestCase(BaseAuthenticatedTestCase):
 
         self.assertIn('type_category', cm.exception.message_dict)
 
+    def test_cannot_update_type_category_via_model_without_loaded_original(self):
+        # Instância sem o tipo original carregado busca o valor do banco
+        category = Category.objects.create(
+            user=self.user, relative=self.relative, **self.valid_payload)
+
+        detached = Category(
+            pk=category.pk, user=self.user, relative=self.relative,
+            name=category.name, color=category.color, icon=category.icon,
+            type_category='receitas')
+        with self.assertRaises(ValidationError) as cm:
+            detached.save()
+
+        self.assertIn('type_category', cm.exception.message_dict)
+
+    def test_subcategory_clean_fetches_parent_and_original_in_one_query(self):
+        # Pai e tipo original são carregados em uma única consulta de validação
+        subcategory = Category.objects.create(
+            user=self.user, relative=self.relative, name='Combustível', color='#FF5733',
+            icon='fuel', type_category='despesas', subcategory_id=self.main_category.id)
+
+        detached = Category(
+            pk=subcategory.pk, user_id=self.user.id, relative_id=self.relative.id,
+            name='Gasolina', color='#FF5733', icon='fuel', type_category='despesas',
+            subcategory_id=self.main_category.id)
+        with self.assertNumQueries(1):
+            detached.clean()
+
+    def test_subcategory_clean_reuses_loaded_instance(self):
+        # Categoria pai e tipo original já carregados não geram consultas
+        subcategory = Category.objects.create(
+            user=self.user, relative=self.relative, name='Combustível', color='#FF5733',
+            icon='fuel', type_category='despesas', subcategory=self.main_category)
+        subcategory = Category.objects.select_related('subcategory').get(pk=subcategory.pk)
+
+        subcategory.name = 'Gasolina'
+        with self.assertNumQueries(0):
+            subcategory.clean()
+
     def test_type_category_is_returned_in_list(self):
         # type_category deve aparecer nos resultados da listagem
         response = self.client.get('/api/v1/categories/')
@@ -712,3 +784,76 @@ class CategoryTestCase(BaseAuthenticatedTestCase):
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.json().get('type_category'), 'receitas')
+
+    def test_category_tree_nests_subcategories(self):
+        Category.objects.create(
+            user=self.user, relative=self.relative, name='Combustível', color='#FF5733',
+            icon='fuel', type_category='despesas', subcategory=self.main_category)
+        self.client.get('/api/v1/categories/tree/')
+
+        # Com usuário e perfil já em cache, a árvore é montada com uma única consulta
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/v1/categories/tree/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        tree = response.json()
+        self.assertEqual([node['name'] for node in tree], ['Salário', 'Transporte'])
+        self.assertEqual(tree[1]['children'][0]['name'], 'Combustível')
+        self.assertEqual(tree[1]['children'][0]['subcategory'], self.main_category.id)
+
+    def test_category_tree_archived_filter(self):
+        self.main_category_receitas.is_archived = True
+        self.main_category_receitas.save()
+
+        response = self.client.get('/api/v1/categories/tree/')
+        self.assertEqual([node['name'] for node in response.json()], ['Transporte'])
+
+        response = self.client.get('/api/v1/categories/tree/?include_archived=true')
+        self.assertEqual(len(response.json()), 2)
+
+    def test_category_tree_etag_revalidation(self):
+        response = self.client.get('/api/v1/categories/tree/')
+        etag = response['ETag']
+
+        response = self.client.get('/api/v1/categories/tree/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # Alteração na árvore gera novo ETag
+        self.main_category.name = 'Mobilidade'
+        self.main_category.save()
+        response = self.client.get('/api/v1/categories/tree/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_category_tree_requires_relative_header(self):
+        self.client.defaults.pop('HTTP_X_RELATIVE_ID', None)
+
+        response = self.client.get('/api/v1/categories/tree/')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('X-Relative-Id', response.json())
+
+    def test_category_full_name_maintained_on_save(self):
+        subcategory = Category.objects.create(
+            user=self.user, relative=self.relative, name='Combustível', color='#FF5733',
+            icon='fuel', type_category='despesas', subcategory=self.main_category)
+
+        self.assertEqual(subcategory.full_name, 'Transporte > Combustível')
+
+        # __str__ lê o caminho materializado sem consultar a categoria pai
+        subcategory = Category.objects.get(pk=subcategory.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(str(subcategory), 'Transporte > Combustível')
+
+    def test_category_rename_updates_children_full_name(self):
+        subcategory = Category.objects.create(
+            user=self.user, relative=self.relative, name='Combustível', color='#FF5733',
+            icon='fuel', type_category='despesas', subcategory=self.main_category)
+
+        response = self.client.patch(
+            f'/api/v1/categories/{self.main_category.id}/', {'name': 'Mobilidade'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['full_name'], 'Mobilidade')
+        subcategory.refresh_from_db()
+        self.assertEqual(subcategory.full_name, 'Mobilidade > Combustível')
@@ -0,0 +1,178 @@
+from datetime import date
+from decimal import Decimal
+from unittest import mock
+
+from django.test import SimpleTestCase
+from rest_framework import status
+
+from backend.api.categories.models import Category
+from backend.api.credit_cards.invoice import invoice_dates, invoice_month_for, split_installments
+from backend.api.credit_cards.models import CreditCard, CreditCardExpense, CreditCardInstallment
+
+from .base import BaseAuthenticatedTestCase
+from .constants import get_category_data
+
+
+class InvoiceCycleTest(SimpleTestCase):
+    def test_purchase_before_closing_day_goes_to_current_invoice(self):
+        self.assertEqual(invoice_month_for(date(2026, 3, 9), closing_day=10), date(2026, 3, 1))
+
+    def test_purchase_on_or_after_closing_day_goes_to_next_invoice(self):
+        self.assertEqual(invoice_month_for(date(2026, 3, 10), closing_day=10), date(2026, 4, 1))
+        self.assertEqual(invoice_month_for(date(2026, 12, 20), closing_day=10), date(2027, 1, 1))
+
+    def test_closing_day_clamped_to_month_end(self):
+        self.assertEqual(invoice_month_for(date(2026, 2, 27), closing_day=31), date(2026, 2, 1))
+        self.assertEqual(invoice_month_for(date(2026, 2, 28), closing_day=31), date(2026, 3, 1))
+
+    def test_invoice_dates(self):
+        self.assertEqual(invoice_dates(date(2026, 3, 1), 3, 10), (date(2026, 3, 3), date(2026, 3, 10)))
+        self.assertEqual(invoice_dates(date(2026, 1, 1), 25, 5), (date(2026, 1, 25), date(2026, 2, 5)))
+
+    def test_split_installments_keeps_total(self):
+        parts = split_installments(Decimal('100.00'), 3)
+        self.assertEqual(parts, [Decimal('33.34'), Decimal('33.33'), Decimal('33.33')])
+        self.assertEqual(sum(parts), Decimal('100.00'))
+
+
+class CreditCardTestCase(BaseAuthenticatedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.defaults['HTTP_X_RELATIVE_ID'] = str(self.relative.id)
+        self.category = Category.objects.create(user=self.user, relative=self.relative, **get_category_data())
+        self.card = CreditCard.objects.create(
+            user=self.user, relative=self.relative, name='Nubank', limit=Decimal('5000.00'),
+            closing_day=10, due_day=17, color='#8A05BE')
+
+    def post_expense(self, **overrides):
+        payload = {
+            'category': self.category.id,
+            'description': 'Notebook',
+            'total_amount': '3000.00',
+            'installments_count': 10,
+            'purchase_date': '2026-03-15',
+        }
+        payload.update(overrides)
+        return self.client.post(f'/api/v1/credit-cards/{self.card.id}/expenses/', payload, format='json')
+
+    def test_create_card(self):
+        response = self.client.post('/api/v1/credit-cards/', {
+            'name': 'Inter', 'limit': '1000.00', 'closing_day': 5, 'due_day': 12, 'color': '#FF7A00',
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()['relative'], self.relative.id)
+
+    def test_create_card_invalid_days(self):
+        response = self.client.post('/api/v1/credit-cards/', {
+            'name': 'Inter', 'limit': '1000.00', 'closing_day': 32, 'due_day': 0, 'color': '#FF7A00',
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_update_card_keeps_invoice_cycle(self):
+        self.post_expense()
+
+        response = self.client.patch(f'/api/v1/credit-cards/{self.card.id}/', {'closing_day': 25}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('closing_day', response.json())
+
+        response = self.client.patch(f'/api/v1/credit-cards/{self.card.id}/', {'due_day': 5}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('due_day', response.json())
+
+        # Os demais campos continuam editáveis; reenviar os mesmos dias é aceito
+        response = self.client.patch(f'/api/v1/credit-cards/{self.card.id}/', {
+            'name': 'Nubank Roxo', 'closing_day': 10, 'due_day': 17,
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.card.refresh_from_db()
+        self.assertEqual((self.card.closing_day, self.card.due_day), (10, 17))
+        self.assertEqual(self.card.expenses.get().installments.order_by('number').first().invoice_month,
+                         date(2026, 4, 1))
+
+    def test_installment_expense_schedule(self):
+        response = self.post_expense()
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        installments = response.json()['installments']
+        self.assertEqual(len(installments), 10)
+        # Compra após o fechamento (dia 10) entra na fatura de abril
+        self.assertEqual(installments[0]['invoice_month'], '2026-04-01')
+        self.assertEqual(installments[-1]['invoice_month'], '2027-01-01')
+
+    def test_installments_created_with_single_bulk_insert(self):
+        expense = CreditCardExpense(
+            user=self.user, relative=self.relative, card=self.card, category=self.category,
+            description='Geladeira', total_amount=Decimal('1200.00'), installments_count=12,
+            purchase_date=date(2026, 3, 1),
+        )
+        # SAVEPOINT + INSERT do gasto + INSERT em lote das 12 parcelas + RELEASE
+        with self.assertNumQueries(4):
+            expense.save()
+        self.assertEqual(expense.installments.count(), 12)
+
+    def test_invoice_for_month(self):
+        self.post_expense()
+        self.post_expense(description='Mercado', total_amount='250.00', installments_count=1,
+                          purchase_date='2026-04-02')
+
+        response = self.client.get(f'/api/v1/credit-cards/{self.card.id}/invoice/?month=2026-04')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.json()
+        self.assertEqual(body['total'], '550.00')
+        self.assertEqual(body['closing_date'], '2026-04-10')
+        self.assertEqual(body['due_date'], '2026-04-17')
+        self.assertEqual([item['description'] for item in body['installments']], ['Notebook', 'Mercado'])
+
+    def test_invoice_is_single_range_query(self):
+        self.post_expense()
+        self.client.get(f'/api/v1/credit-cards/{self.card.id}/invoice/?month=2026-04')
+
+        # Cartão (get_object) + parcelas da fatura
+        with self.assertNumQueries(2):
+            self.client.get(f'/api/v1/credit-cards/{self.card.id}/invoice/?month=2026-05')
+
+    def test_available_limit(self):
+        self.post_expense()
+        self.post_expense(description='Antigo', total_amount='100.00', installments_count=1,
+                          purchase_date='2026-01-05')
+
+        with mock.patch('backend.api.credit_cards.views.timezone.localdate', return_value=date(2026, 6, 20)):
+            response = self.client.get(f'/api/v1/credit-cards/{self.card.id}/limit/')
+
+        # Fatura atual: julho; restam 7 parcelas de 300 (jul..jan) e a compra de janeiro já foi faturada
+        self.assertEqual(response.json(), {
+            'limit': '5000.00', 'used': '2100.00', 'available': '2900.00', 'current_invoice': '2026-07',
+        })
+
+    def test_delete_expense_releases_limit(self):
+        expense_id = self.post_expense().json()['id']
+
+        response = self.client.delete(f'/api/v1/credit-cards/{self.card.id}/expenses/{expense_id}/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(CreditCardInstallment.objects.filter(is_archived=False).exists())
+
+        with mock.patch('backend.api.credit_cards.views.timezone.localdate', return_value=date(2026, 3, 1)):
+            response = self.client.get(f'/api/v1/credit-cards/{self.card.id}/limit/')
+        self.assertEqual(response.json()['used'], '0.00')
+
+    def test_expense_rejects_income_category(self):
+        income = Category.objects.create(
+            user=self.user, relative=self.relative, **get_category_data(name='Salário', type_category='receitas'))
+        response = self.post_expense(category=income.id)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_card_of_other_user_not_found(self):
+        other_user = self.create_additional_user()
+        other_card = CreditCard.objects.create(
+            user=other_user, relative=other_user.relatives.first(), name='Outro', limit=Decimal('1.00'),
+            closing_day=1, due_day=10, color='#000000')
+
+        response = self.client.get(f'/api/v1/credit-cards/{other_card.id}/invoice/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_list_expenses(self):
+        self.post_expense()
+        response = self.client.get(f'/api/v1/credit-cards/{self.card.id}/expenses/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()['results']), 1)
@@ -0,0 +1,146 @@
+import threading
+import time
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from rest_framework import status
+
+from backend.api.accounts.models import Account
+from backend.api.categories.models import Category
+from backend.api.core.checks import check_shared_cache
+from backend.api.dashboard.cache import (DASHBOARD_KEY, DASHBOARD_LOCK_KEY, _get_version,
+                                         get_or_build_dashboard)
+from backend.api.transactions.models import Transaction
+
+from .base import BaseAuthenticatedTestCase
+from .constants import get_account_data, get_category_data, get_transaction_model_data
+
+
+class DashboardTestCase(BaseAuthenticatedTestCase):
+    def setUp(self):
+        super().setUp()
+        # Ids se repetem entre testes: evita reaproveitar versões de testes anteriores
+        cache.clear()
+        self.client.defaults['HTTP_X_RELATIVE_ID'] = str(self.relative.id)
+        self.account = Account.objects.create(user=self.user, relative=self.relative, **get_account_data())
+        Account.objects.create(
+            user=self.user, relative=self.relative,
+            **get_account_data(name='Investimento', balance='5000.00', include_calc=False))
+        self.food = Category.objects.create(user=self.user, relative=self.relative, **get_category_data())
+        self.home = Category.objects.create(
+            user=self.user, relative=self.relative, **get_category_data(name='Casa'))
+        self.salary = Category.objects.create(
+            user=self.user, relative=self.relative, **get_category_data(name='Salário', type_category='receitas'))
+
+    def test_dashboard_content(self):
+        Transaction.objects.create(**get_transaction_model_data(self.account, self.food, amount='100.00'))
+        Transaction.objects.create(**get_transaction_model_data(self.account, self.home, amount='300.00'))
+        Transaction.objects.create(**get_transaction_model_data(self.account, self.salary, amount='2000.00'))
+        Transaction.objects.create(**get_transaction_model_data(
+            self.account, self.food, amount='999.00', date='2026-02-01'))
+
+        response = self.client.get('/api/v1/dashboard/?month=2026-01')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.json()
+        self.assertEqual(body['month'], '2026-01')
+        self.assertEqual(body['totals'], {'receitas': '2000.00', 'despesas': '400.00', 'resultado': '1600.00'})
+        # Apenas contas com include_calc entram no saldo
+        self.assertEqual(body['balance'], '1601.00')
+        self.assertEqual([item['name'] for item in body['top_categories']], ['Casa', 'Alimentação'])
+        self.assertEqual(body['top_categories'][0]['total'], '300.00')
+
+    def test_dashboard_requires_relative_header(self):
+        del self.client.defaults['HTTP_X_RELATIVE_ID']
+        response = self.client.get('/api/v1/dashboard/')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_dashboard_invalid_month(self):
+        response = self.client.get('/api/v1/dashboard/?month=01-2026')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_dashboard_served_from_cache(self):
+        self.client.get('/api/v1/dashboard/?month=2026-01')
+
+        # Usuário, perfil e dashboard em cache: nenhuma consulta ao banco
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/v1/dashboard/?month=2026-01')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_transaction_write_invalidates_dashboard(self):
+        self.client.get('/api/v1/dashboard/?month=2026-01')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Transaction.objects.create(**get_transaction_model_data(self.account, self.food, amount='50.00'))
+
+        response = self.client.get('/api/v1/dashboard/?month=2026-01')
+        self.assertEqual(response.json()['totals']['despesas'], '50.00')
+        self.assertEqual(response.json()['balance'], '950.00')
+
+    def test_category_and_account_writes_invalidate_dashboard(self):
+        Transaction.objects.create(**get_transaction_model_data(self.account, self.food))
+        self.client.get('/api/v1/dashboard/?month=2026-01')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.food.name = 'Mercado'
+            self.food.save()
+        response = self.client.get('/api/v1/dashboard/?month=2026-01')
+        self.assertEqual(response.json()['top_categories'][0]['name'], 'Mercado')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.account.include_calc = False
+            self.account.save()
+        response = self.client.get('/api/v1/dashboard/?month=2026-01')
+        self.assertEqual(response.json()['balance'], '0.00')
+
+    def test_version_not_bumped_before_commit(self):
+        version = _get_version(self.relative.id)
+        with self.captureOnCommitCallbacks(execute=False):
+            Transaction.objects.create(**get_transaction_model_data(self.account, self.food))
+        self.assertEqual(_get_version(self.relative.id), version)
+
+
+class DashboardCoalescingTest(BaseAuthenticatedTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_concurrent_misses_build_once(self):
+        calls = []
+
+        def build():
+            calls.append(1)
+            time.sleep(0.2)
+            return {'value': 1}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_or_build_dashboard(self.relative.id, '2026-01', build)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{'value': 1}] * 5)
+
+    def test_waits_for_result_of_lock_holder(self):
+        version = _get_version(self.relative.id)
+        key = DASHBOARD_KEY.format(relative_id=self.relative.id, version=version, month='2026-01')
+        cache.add(DASHBOARD_LOCK_KEY.format(relative_id=self.relative.id, version=version, month='2026-01'), True)
+        threading.Timer(0.1, lambda: cache.set(key, {'value': 'pronto'})).start()
+
+        result = get_or_build_dashboard(self.relative.id, '2026-01', lambda: self.fail('não deveria calcular'))
+        self.assertEqual(result, {'value': 'pronto'})
+
+
+class SharedCacheCheckTest(SimpleTestCase):
+    @override_settings(DEBUG=False, TESTING=False, CACHE_IS_SHARED=False)
+    def test_warns_about_per_process_cache(self):
+        self.assertEqual([warning.id for warning in check_shared_cache(None)], ['api.W001'])
+
+    @override_settings(DEBUG=False, TESTING=False, CACHE_IS_SHARED=True)
+    def test_shared_cache_passes(self):
+        self.assertEqual(check_shared_cache(None), [])
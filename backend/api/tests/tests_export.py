@@ -0,0 +1,92 @@
+import csv
+import io
+import json
+from decimal import Decimal
+from unittest import mock
+
+from django.db.models.query import QuerySet
+from rest_framework import status
+
+from backend.api.accounts.models import Account
+from backend.api.categories.models import Category
+from backend.api.core.export.streaming import EXPORT_CHUNK_SIZE
+from backend.api.transactions.models import Transaction
+
+from .base import BaseAuthenticatedTestCase
+from .constants import get_account_data, get_category_data, get_transaction_data
+
+
+class StreamingExportTestCase(BaseAuthenticatedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.defaults['HTTP_X_RELATIVE_ID'] = str(self.relative.id)
+        self.account = Account.objects.create(user=self.user, relative=self.relative, **get_account_data())
+        self.category = Category.objects.create(user=self.user, relative=self.relative, **get_category_data())
+        for day, amount in ((5, '10.00'), (15, '20.50'), (25, '30.00')):
+            payload = get_transaction_data(self.account, self.category, amount=amount, date=f'2026-01-{day:02d}')
+            response = self.client.post('/api/v1/transactions/', payload, format='json')
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def read(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return b''.join(response.streaming_content).decode('utf-8')
+
+    def test_export_transactions_csv(self):
+        response = self.client.get('/api/v1/transactions/export/csv/?start_date=2026-01-10')
+
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        self.assertIn('lancamentos.csv', response['Content-Disposition'])
+        rows = list(csv.DictReader(io.StringIO(self.read(response))))
+        self.assertEqual([(row['date'], row['amount']) for row in rows], [('2026-01-25', '30.00'), ('2026-01-15', '20.50')])
+        self.assertEqual(rows[0]['account_name'], self.account.name)
+        self.assertEqual(rows[0]['category_full_name'], self.category.full_name)
+
+    def test_export_transactions_jsonl(self):
+        response = self.client.get('/api/v1/transactions/export/jsonl/')
+
+        lines = [json.loads(line) for line in self.read(response).splitlines()]
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(Decimal(lines[-1]['amount']), Decimal('10.00'))
+        self.assertEqual(lines[-1]['date'], '2026-01-05')
+
+    def test_export_uses_iterator_without_pagination(self):
+        Transaction.objects.bulk_create([
+            Transaction(user=self.user, relative=self.relative, account=self.account, category=self.category,
+                        type='despesas', amount=Decimal('1.00'), date='2025-12-01')
+            for _ in range(30)
+        ])
+
+        with mock.patch.object(QuerySet, 'iterator', autospec=True, side_effect=QuerySet.iterator) as iterator:
+            content = self.read(self.client.get('/api/v1/transactions/export/jsonl/'))
+
+        self.assertEqual(iterator.call_args.kwargs['chunk_size'], EXPORT_CHUNK_SIZE)
+        self.assertEqual(len(content.splitlines()), 33)
+
+    def test_export_accounts_and_categories(self):
+        Account.objects.create(user=self.user, relative=self.relative, **get_account_data(name='Arquivada', is_archived=True))
+
+        rows = list(csv.DictReader(io.StringIO(self.read(self.client.get('/api/v1/accounts/export/csv/')))))
+        self.assertEqual([row['name'] for row in rows], [self.account.name])
+
+        rows = list(csv.DictReader(io.StringIO(self.read(
+            self.client.get('/api/v1/accounts/export/csv/?only_archived=true')))))
+        self.assertEqual([row['name'] for row in rows], ['Arquivada'])
+
+        lines = self.read(self.client.get('/api/v1/categories/export/jsonl/')).splitlines()
+        self.assertEqual(json.loads(lines[0])['name'], self.category.name)
+
+    def test_export_only_own_data(self):
+        other_user = self.create_additional_user()
+        Account.objects.create(user=other_user, relative=other_user.relatives.first(), **get_account_data(name='Outra'))
+        del self.client.defaults['HTTP_X_RELATIVE_ID']
+
+        rows = list(csv.DictReader(io.StringIO(self.read(self.client.get('/api/v1/accounts/export/csv/')))))
+        self.assertEqual([row['name'] for row in rows], [self.account.name])
+
+    def test_export_invalid_format_and_filters(self):
+        self.assertEqual(self.client.get('/api/v1/transactions/export/xml/').status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(
+            self.client.get('/api/v1/transactions/export/csv/?start_date=abc').status_code,
+            status.HTTP_400_BAD_REQUEST
+        )
@@ -0,0 +1,110 @@
+from rest_framework import status
+
+from backend.api.accounts.models import Account
+from backend.api.categories.models import Category
+from backend.api.relatives.models import Relative
+from backend.api.transactions.models import Transaction
+
+from .base import BaseAuthenticatedTestCase
+from .constants import get_account_data, get_category_data, get_transaction_model_data
+
+
+class FamilyTestCase(BaseAuthenticatedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.partner = Relative.objects.create(name='Cônjuge', image_num=2, user=self.user)
+
+        self.account = Account.objects.create(user=self.user, relative=self.relative, **get_account_data())
+        self.partner_account = Account.objects.create(
+            user=self.user, relative=self.partner, **get_account_data(balance='500.00'))
+        Account.objects.create(
+            user=self.user, relative=self.partner,
+            **get_account_data(name='Fora do cálculo', balance='9999.00', include_calc=False))
+
+        self.food = Category.objects.create(user=self.user, relative=self.relative, **get_category_data())
+        self.partner_food = Category.objects.create(user=self.user, relative=self.partner, **get_category_data())
+        self.partner_salary = Category.objects.create(
+            user=self.user, relative=self.partner, **get_category_data(name='Salário', type_category='receitas'))
+
+        Transaction.objects.create(**get_transaction_model_data(self.account, self.food, amount='100.00'))
+        Transaction.objects.create(**get_transaction_model_data(
+            self.partner_account, self.partner_food, amount='40.00'))
+        Transaction.objects.create(**get_transaction_model_data(
+            self.partner_account, self.partner_food, amount='10.00', date='2026-02-03'))
+        Transaction.objects.create(**get_transaction_model_data(
+            self.partner_account, self.partner_salary, amount='3000.00'))
+
+        # Dados de outro usuário nunca entram na visão da família
+        other_user = self.create_additional_user()
+        other_relative = other_user.relatives.first()
+        Account.objects.create(user=other_user, relative=other_relative, **get_account_data())
+
+    def test_balances_per_relative_and_consolidated(self):
+        response = self.client.get('/api/v1/family/balances/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.json()
+        self.assertEqual(body['relatives'], [
+            {'id': self.partner.id, 'name': 'Cônjuge', 'balance': '3450.00', 'accounts': 1},
+            {'id': self.relative.id, 'name': 'Perfil Teste', 'balance': '900.00', 'accounts': 1},
+        ])
+        self.assertEqual(body['total'], {'balance': '4350.00', 'accounts': 2})
+
+    def test_monthly_totals(self):
+        response = self.client.get('/api/v1/family/monthly-totals/?start=2026-01&end=2026-02')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.json()
+        self.assertEqual(body['total']['months'], [
+            {'month': '2026-01', 'receitas': '3000.00', 'despesas': '140.00'},
+            {'month': '2026-02', 'receitas': '0.00', 'despesas': '10.00'},
+        ])
+        relatives = {item['id']: item['months'] for item in body['relatives']}
+        self.assertEqual(relatives[self.relative.id], [
+            {'month': '2026-01', 'receitas': '0.00', 'despesas': '100.00'},
+        ])
+
+    def test_category_breakdown_consolidates_by_path(self):
+        response = self.client.get('/api/v1/family/categories/?start=2026-01&end=2026-02')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['total']['categories'], [
+            {'category': 'Alimentação', 'type': 'despesas', 'total': '150.00'},
+            {'category': 'Salário', 'type': 'receitas', 'total': '3000.00'},
+        ])
+
+    def test_each_endpoint_runs_single_query(self):
+        # Primeira chamada aquece o cache do usuário autenticado
+        self.client.get('/api/v1/family/balances/')
+
+        for url in ('/api/v1/family/balances/',
+                    '/api/v1/family/monthly-totals/?start=2026-01&end=2026-12',
+                    '/api/v1/family/categories/?start=2026-01'):
+            with self.assertNumQueries(1):
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_archived_relative_is_excluded(self):
+        self.partner.is_archived = True
+        self.partner.save()
+
+        body = self.client.get('/api/v1/family/balances/').json()
+        self.assertEqual([item['id'] for item in body['relatives']], [self.relative.id])
+        self.assertEqual(body['total']['balance'], '900.00')
+
+    def test_invalid_period(self):
+        response = self.client.get('/api/v1/family/monthly-totals/?start=2026-05&end=2026-01')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get('/api/v1/family/categories/?start=2020-01&end=2026-01')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get('/api/v1/family/categories/?start=janeiro')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_without_accounts_in_calc(self):
+        Account.objects.filter(user=self.user).update(include_calc=False)
+
+        body = self.client.get('/api/v1/family/balances/').json()
+        self.assertEqual(body['relatives'], [])
+        self.assertEqual(body['total'], {'balance': '0.00', 'accounts': 0})
@@ -0,0 +1,211 @@
+import io
+from datetime import date
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from backend.api.accounts.models import Account
+from backend.api.categories.models import Category
+from backend.api.summaries.models import MonthlySummary
+from backend.api.transactions.importers import (TransactionImporter, parse_amount, parse_csv, parse_ofx,
+                                                 parse_ofx_date)
+from backend.api.transactions.models import Transaction
+
+from .base import BaseAuthenticatedTestCase
+from .constants import get_account_data, get_category_data
+
+CSV_CONTENT = (
+    'Data;Descrição;Valor;Categoria;ID\n'
+    '05/01/2026;Mercado;-150,50;Alimentação;a1\n'
+    '10/01/2026;Salário;3.000,00;Salário;a2\n'
+    '\n'
+    '12/01/2026;Padaria;-20,00;Inexistente;a3\n'
+)
+
+OFX_CONTENT = """OFXHEADER:100
+DATA:OFXSGML
+
+<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN>
+<TRNTYPE>DEBIT
+<DTPOSTED>20260105120000[-3:BRT]
+<TRNAMT>-150.50
+<FITID>F1
+<MEMO>Mercado
+</STMTTRN>
+<STMTTRN>
+<TRNTYPE>CREDIT
+<DTPOSTED>20260110
+<TRNAMT>3000.00
+<FITID>F2
+<NAME>Salário
+</STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>
+"""
+
+
+class ImportParserTest(BaseAuthenticatedTestCase):
+    def test_parse_csv_semicolon_and_comma_decimals(self):
+        rows = list(parse_csv(io.StringIO(CSV_CONTENT)))
+
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0].date, '05/01/2026')
+        self.assertEqual(rows[0].amount, '-150,50')
+        self.assertEqual(rows[1].external_id, 'a2')
+        # Linha em branco é ignorada mas a numeração segue o arquivo
+        self.assertEqual(rows[2].line, 5)
+
+    def test_parse_ofx_in_small_chunks(self):
+        stream = io.StringIO(OFX_CONTENT)
+        original_read = stream.read
+        # Blocos pequenos forçam tags cortadas entre leituras
+        stream.read = lambda size: original_read(7)
+
+        rows = list(parse_ofx(stream))
+
+        self.assertEqual(
+            [(row.date, row.amount, row.description, row.external_id) for row in rows],
+            [('20260105', '-150.50', 'Mercado', 'F1'), ('20260110', '3000.00', 'Salário', 'F2')]
+        )
+
+    def test_parse_ofx_date_converts_to_local_date(self):
+        # 02:00 em Greenwich ainda é o dia anterior em São Paulo
+        self.assertEqual(parse_ofx_date('20260106020000.000[0:GMT]'), '20260105')
+        self.assertEqual(parse_ofx_date('20260105230000[-3:BRT]'), '20260105')
+        self.assertEqual(parse_ofx_date('20260106'), '20260106')
+        self.assertEqual(parse_ofx_date('20260106120000'), '20260106')
+
+    def test_parse_ofx_date_with_out_of_range_offset(self):
+        # Fuso fora do intervalo aceito (±24h) mantém a data informada, sem derrubar a importação
+        self.assertEqual(parse_ofx_date('20260106020000[-30:XYZ]'), '20260106')
+        self.assertEqual(parse_ofx_date('20260106020000[99999999999999999999:XYZ]'), '20260106')
+        self.assertEqual(parse_ofx_date('20260106250000[-3:BRT]'), '20260106')
+
+    def test_parse_amount_rejects_non_finite_and_overflow(self):
+        self.assertEqual(parse_amount('-1.234,50'), Decimal('-1234.50'))
+        self.assertEqual(parse_amount('99999999.99'), Decimal('99999999.99'))
+        for value in ('NaN', 'sNaN', 'Infinity', '-inf', '1e12', '100000000,00', '10,005'):
+            with self.subTest(value=value), self.assertRaises(ValidationError):
+                parse_amount(value)
+
+
+class TransactionImportTestCase(BaseAuthenticatedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.defaults['HTTP_X_RELATIVE_ID'] = str(self.relative.id)
+        self.account = Account.objects.create(user=self.user, relative=self.relative, **get_account_data())
+        self.expense_category = Category.objects.create(user=self.user, relative=self.relative, **get_category_data())
+        self.income_category = Category.objects.create(
+            user=self.user, relative=self.relative, **get_category_data(name='Salário', type_category='receitas'))
+        self.other_category = Category.objects.create(
+            user=self.user, relative=self.relative, **get_category_data(name='Outros'))
+
+    def upload(self, content, name='extrato.csv', **data):
+        payload = {
+            'file': SimpleUploadedFile(name, content.encode('utf-8')),
+            'account': self.account.id,
+            'expense_category': self.other_category.id,
+            **data,
+        }
+        return self.client.post('/api/v1/transactions/import/', payload, format='multipart')
+
+    def test_import_csv(self):
+        response = self.upload(CSV_CONTENT)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.json())
+        self.assertEqual(response.json()['created'], 3)
+        self.assertEqual(
+            list(Transaction.objects.order_by('date').values_list('description', 'type', 'amount', 'category_id')),
+            [
+                ('Mercado', 'despesas', Decimal('150.50'), self.expense_category.id),
+                ('Salário', 'receitas', Decimal('3000.00'), self.income_category.id),
+                # Categoria não encontrada: usa a categoria padrão de despesas
+                ('Padaria', 'despesas', Decimal('20.00'), self.other_category.id),
+            ]
+        )
+        self.assertEqual(Account.objects.get(pk=self.account.pk).balance, Decimal('3829.50'))
+        self.assertEqual(
+            MonthlySummary.objects.get(month=date(2026, 1, 1), type='despesas',
+                                       category=self.expense_category).total,
+            Decimal('150.50')
+        )
+
+    def test_import_ofx_skips_duplicates(self):
+        response = self.upload(OFX_CONTENT, name='extrato.ofx', income_category=self.income_category.id)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.json())
+        self.assertEqual(response.json()['created'], 2)
+
+        response = self.upload(OFX_CONTENT, name='extrato.ofx', income_category=self.income_category.id)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['created'], 0)
+        self.assertEqual(response.json()['duplicates'], 2)
+        self.assertEqual(Transaction.objects.count(), 2)
+        self.assertEqual(Account.objects.get(pk=self.account.pk).balance, Decimal('3849.50'))
+
+    def test_invalid_rows_are_reported(self):
+        content = (
+            'data,descricao,valor\n'
+            '2026-01-05,Mercado,-10.00\n'
+            '2026-13-40,Data inválida,-10.00\n'
+            '2026-01-06,Valor inválido,abc\n'
+            '2026-01-07,Receita sem categoria padrão,50.00\n'
+        )
+        response = self.upload(content)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        body = response.json()
+        self.assertEqual(body['created'], 1)
+        self.assertEqual(body['error_count'], 3)
+        self.assertEqual([error['line'] for error in body['errors']], [3, 4, 5])
+
+    def test_invalid_amounts_are_reported_per_row(self):
+        content = (
+            'data;descricao;valor\n'
+            '2026-01-05;Mercado;-10,00\n'
+            '2026-01-06;Não numérico;NaN\n'
+            '2026-01-07;Infinito;-Infinity\n'
+            '2026-01-08;Estouro;-1e12\n'
+        )
+        response = self.upload(content)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()['created'], 1)
+        self.assertEqual([error['line'] for error in response.json()['errors']], [3, 4, 5])
+        self.assertEqual(Account.objects.get(pk=self.account.pk).balance, Decimal('990.00'))
+
+    def test_import_requires_format(self):
+        response = self.upload(CSV_CONTENT, name='extrato.txt')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.upload(CSV_CONTENT, name='extrato.txt', format='csv')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_import_rejects_account_from_another_user(self):
+        other_user = self.create_additional_user()
+        other_account = Account.objects.create(
+            user=other_user, relative=other_user.relatives.first(), **get_account_data())
+
+        response = self.upload(CSV_CONTENT, account=other_account.id)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Transaction.objects.count(), 0)
+
+    def test_batches_use_one_lookup_and_one_balance_update(self):
+        content = 'data;descricao;valor;categoria\n' + ''.join(
+            f'2026-01-{day:02d};Item {day};-1,00;Alimentação\n' for day in range(1, 21))
+        importer = TransactionImporter(self.user, self.relative.id, self.account, batch_size=5)
+
+        with CaptureQueriesContext(connection) as context:
+            result = importer.run(parse_csv(io.StringIO(content)))
+
+        self.assertEqual(result['created'], 20)
+        sql = [query['sql'] for query in context.captured_queries]
+        # Categoria resolvida apenas no primeiro lote
+        self.assertEqual(sum(1 for query in sql if query.startswith('SELECT') and '"category"' in query), 1)
+        self.assertEqual(sum(1 for query in sql if query.startswith('INSERT INTO "transaction"')), 4)
+        self.assertEqual(sum(1 for query in sql if query.startswith('UPDATE "account"')), 1)
+        self.assertEqual(Account.objects.get(pk=self.account.pk).balance, Decimal('980.00'))
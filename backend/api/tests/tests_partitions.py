@@ -0,0 +1,149 @@
+from datetime import date
+from unittest import skipUnless
+
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError, connection, models, transaction
+from django.test import SimpleTestCase
+from django.utils import timezone
+
+from backend.api.accounts.models import Account
+from backend.api.balances.models import month_start
+from backend.api.categories.models import Category
+from backend.api.recurring.engine import MONTHLY
+from backend.api.recurring.models import RecurringEntry
+from backend.api.transactions.models import Transaction
+from backend.api.transactions.partitions import (
+    UNIQUE_KEY_INDEXES,
+    UNIQUE_KEY_TABLE,
+    add_months,
+    convert_to_partitioned,
+    ensure_partitions,
+    is_partitioned,
+    iter_months,
+    partition_name,
+    partition_statements,
+    unique_key_statements,
+)
+
+from .base import BaseAuthenticatedTestCase
+from .constants import get_account_data, get_category_data, get_transaction_model_data
+
+
+class LedgerPartitionsTest(SimpleTestCase):
+    def test_months_and_partition_names(self):
+        self.assertEqual(add_months(date(2026, 11, 1), 3), date(2027, 2, 1))
+        self.assertEqual(
+            [partition_name(month) for month in iter_months(date(2026, 11, 20), date(2027, 1, 1))],
+            ['transaction_p2026_11', 'transaction_p2026_12', 'transaction_p2027_01']
+        )
+
+    def test_partition_statements_move_rows_from_default_partition(self):
+        statements = partition_statements(date(2026, 12, 15))
+
+        self.assertEqual(
+            statements[0],
+            'CREATE TABLE transaction_p2026_12 (LIKE transaction INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+        )
+        self.assertIn(
+            "DELETE FROM transaction_default WHERE date >= '2026-12-01' AND date < '2027-01-01'", statements[1])
+        self.assertEqual(
+            statements[2],
+            'ALTER TABLE transaction ATTACH PARTITION transaction_p2026_12 '
+            "FOR VALUES FROM ('2026-12-01') TO ('2027-01-01')"
+        )
+        # Índices únicos da partição e chaves das linhas movidas de volta na tabela de unicidade global
+        self.assertEqual(len(statements), 6)
+        self.assertTrue(all(statement.startswith('CREATE UNIQUE INDEX') for statement in statements[3:5]))
+        self.assertEqual(
+            statements[5],
+            'INSERT INTO transaction_unique_key (id, recurring_entry_id, recurrence_date, account_id, external_id) '
+            'SELECT id, recurring_entry_id, recurrence_date, account_id, external_id FROM transaction_p2026_12'
+        )
+        self.assertEqual(len(partition_statements(
+            date(2026, 12, 1), table='bench', unique_indexes={}, unique_key_table=None)), 3)
+
+    def test_unique_keys_keep_model_constraint_names(self):
+        # DROP INDEX de uma migration futura que remova a restrição continua valendo no layout particionado
+        constraints = {
+            constraint.name for constraint in Transaction._meta.constraints
+            if isinstance(constraint, models.UniqueConstraint)
+        }
+        self.assertEqual(set(UNIQUE_KEY_INDEXES), constraints)
+
+        statements = unique_key_statements()
+        self.assertTrue(statements[0].startswith(f'CREATE TABLE IF NOT EXISTS {UNIQUE_KEY_TABLE} (id bigint'))
+        self.assertTrue(statements[-1].startswith('CREATE TRIGGER transaction_unique_key_sync AFTER INSERT OR DELETE'))
+
+    def test_partitioning_requires_postgresql(self):
+        self.assertFalse(is_partitioned())
+        with self.assertRaises(CommandError):
+            call_command('create_transaction_partitions')
+        with self.assertRaises(CommandError):
+            call_command('benchmark_ledger_storage', rows=10)
+
+
+@skipUnless(connection.vendor == 'postgresql', 'O particionamento requer PostgreSQL')
+class PartitionedLedgerUniquenessTest(BaseAuthenticatedTestCase):
+    """
+    Garantias globais do model na tabela particionada (executado no PostgreSQL da CI).
+    """
+
+    def setUp(self):
+        super().setUp()
+        if not is_partitioned():
+            convert_to_partitioned(months_ahead=1)
+        self.account = Account.objects.create(user=self.user, relative=self.relative, **get_account_data())
+        self.category = Category.objects.create(user=self.user, relative=self.relative, **get_category_data())
+        self.current = month_start(timezone.localdate())
+        # Mês sem partição própria: a linha fica na partição padrão
+        self.old_date = date(2020, 1, 15)
+
+    def create_transaction(self, **overrides):
+        return Transaction.objects.create(**get_transaction_model_data(self.account, self.category, **overrides))
+
+    def assert_rejected(self, **overrides):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            self.create_transaction(**overrides)
+
+    def test_external_id_is_unique_across_partitions(self):
+        self.create_transaction(date=self.current, external_id='FIT-1')
+
+        self.assert_rejected(date=self.old_date, external_id='FIT-1')
+        self.create_transaction(date=self.old_date, external_id='FIT-2')
+
+    def test_recurrence_date_is_unique_across_partitions(self):
+        entry = RecurringEntry.objects.create(
+            user=self.user, relative=self.relative, account=self.account, category=self.category,
+            type='despesas', amount='50.00', frequency=MONTHLY, start_date=self.current)
+        self.create_transaction(date=self.current, recurring_entry=entry, recurrence_date=self.current)
+
+        # Ocorrência editada para outra data (outra partição) continua única
+        self.assert_rejected(date=self.old_date, recurring_entry=entry, recurrence_date=self.current)
+
+    def test_id_is_unique_across_partitions(self):
+        first = self.create_transaction(date=self.current)
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Transaction.objects.bulk_create([Transaction(**get_transaction_model_data(
+                self.account, self.category, id=first.id, date=self.old_date))])
+
+    def test_keys_follow_updates_and_new_partitions(self):
+        future = add_months(self.current, 6)
+        moved = self.create_transaction(date=future, external_id='FIT-3')
+        changed = self.create_transaction(date=self.current, external_id='FIT-4')
+
+        # A partição do mês recebe a linha da partição padrão sem perder a chave
+        ensure_partitions(future, future)
+        self.assert_rejected(date=self.current, external_id='FIT-3')
+
+        # Chave alterada libera o valor antigo; mudança de partição mantém a chave
+        changed.external_id = 'FIT-5'
+        changed.save()
+        self.create_transaction(date=self.old_date, external_id='FIT-4')
+        moved.date = self.old_date
+        moved.save()
+        self.assert_rejected(date=future, external_id='FIT-3')
+
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT COUNT(*) FROM {UNIQUE_KEY_TABLE}')
+            self.assertEqual(cursor.fetchone()[0], Transaction.objects.count())
@@ -0,0 +1,180 @@
+import gzip
+import json
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+from rest_framework import status
+
+from backend.api.accounts.models import Account
+from backend.api.balances.models import BalanceCheckpoint
+from backend.api.categories.models import Category
+from backend.api.credit_cards.models import CreditCard, CreditCardInstallment
+from backend.api.recurring.models import RecurringEntry
+from backend.api.relatives.models import Relative
+from backend.api.summaries.models import MonthlySummary
+from backend.api.transactions.models import Transaction, Transfer
+from backend.api.users.portability import ARCHIVE_FORMAT, restore_user_archive
+
+from .base import BaseAuthenticatedTestCase
+from .constants import VALID_CPFS, get_account_data, get_category_data, get_transaction_data
+
+
+class UserDataPortabilityTestCase(BaseAuthenticatedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.defaults['HTTP_X_RELATIVE_ID'] = str(self.relative.id)
+        self.checking = Account.objects.create(user=self.user, relative=self.relative, **get_account_data())
+        self.savings = Account.objects.create(
+            user=self.user, relative=self.relative, **get_account_data(name='Poupança', balance='0.00'))
+        self.parent = Category.objects.create(user=self.user, relative=self.relative, **get_category_data())
+        self.child = Category.objects.create(
+            user=self.user, relative=self.relative, **get_category_data(name='Restaurante', subcategory=self.parent))
+
+        self.post('/api/v1/transactions/', get_transaction_data(self.checking, self.child))
+        self.post('/api/v1/transfers/', {
+            'from_account': self.checking.id, 'to_account': self.savings.id,
+            'amount': '100.00', 'date': '2026-01-20',
+        })
+        self.post('/api/v1/recurring-entries/', {
+            'account': self.checking.id, 'category': self.parent.id, 'type': 'despesas',
+            'amount': '50.00', 'frequency': 'mensal', 'start_date': '2026-01-10',
+        })
+        self.post('/api/v1/recurring-entries/materialize/', {'start': '2026-01-01', 'end': '2026-02-28'})
+        self.card = CreditCard.objects.create(
+            user=self.user, relative=self.relative, name='Nubank', limit=Decimal('5000.00'),
+            closing_day=10, due_day=17, color='#8A05BE')
+        self.post(f'/api/v1/credit-cards/{self.card.id}/expenses/', {
+            'category': self.parent.id, 'description': 'Notebook', 'total_amount': '300.00',
+            'installments_count': 3, 'purchase_date': '2026-03-15',
+        })
+
+    def post(self, url, payload):
+        response = self.client.post(url, payload, format='json')
+        self.assertIn(response.status_code, (status.HTTP_200_OK, status.HTTP_201_CREATED), response.json())
+        return response
+
+    def export_lines(self):
+        response = self.client.get('/api/v1/auth/export/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/gzip')
+        return gzip.decompress(b''.join(response.streaming_content)).decode('utf-8').splitlines()
+
+    def test_export_contains_all_owned_data(self):
+        other_user = self.create_additional_user()
+        Account.objects.create(user=other_user, relative=other_user.relatives.first(), **get_account_data())
+
+        lines = self.export_lines()
+        header = json.loads(lines[0])
+        records = [json.loads(line) for line in lines[1:]]
+
+        self.assertEqual(header['format'], ARCHIVE_FORMAT)
+        self.assertEqual(header['user']['email'], self.user.email)
+        counts = {}
+        for record in records:
+            counts[record['model']] = counts.get(record['model'], 0) + 1
+        self.assertEqual(counts, {
+            'relative': 1, 'account': 2, 'category': 2, 'transfer': 1, 'recurringentry': 1,
+            'transaction': 5, 'creditcard': 1, 'creditcardexpense': 1, 'creditcardinstallment': 3,
+        })
+        self.assertNotIn('user_id', records[0]['data'])
+
+    def test_restore_into_fresh_account(self):
+        lines = self.export_lines()
+        target = self.create_additional_user()
+        target.relatives.all().delete()
+
+        user, counts = restore_user_archive(lines, user=target, batch_size=2)
+
+        self.assertEqual(counts['transaction'], 5)
+        relative = Relative.objects.get(user=user)
+        checking = Account.objects.get(user=user, name=self.checking.name)
+        savings = Account.objects.get(user=user, name='Poupança')
+        self.assertEqual(checking.balance, Account.objects.get(pk=self.checking.pk).balance)
+        self.assertEqual(savings.balance, Decimal('100.00'))
+
+        # Chaves estrangeiras apontam para os registros novos
+        self.assertFalse(Transaction.objects.filter(user=user).exclude(relative=relative).exists())
+        self.assertEqual(
+            set(Transaction.objects.filter(user=user).values_list('account_id', flat=True)),
+            {checking.id, savings.id}
+        )
+        child = Category.objects.get(user=user, name='Restaurante')
+        self.assertEqual(child.subcategory, Category.objects.get(user=user, name=self.parent.name))
+        transfer = Transfer.objects.get(user=user)
+        self.assertEqual(set(transfer.legs.values_list('account_id', flat=True)), {checking.id, savings.id})
+        entry = RecurringEntry.objects.get(user=user)
+        self.assertEqual(entry.transactions.count(), 2)
+        self.assertEqual(
+            CreditCardInstallment.objects.filter(card__user=user, expense__user=user).count(), 3)
+
+        # Resumo mensal reconstruído a partir dos lançamentos restaurados
+        original = MonthlySummary.objects.filter(relative=self.relative).values_list('month', 'type', 'total')
+        restored = MonthlySummary.objects.filter(relative=relative).values_list('month', 'type', 'total')
+        self.assertEqual(sorted(restored), sorted(original))
+
+    def test_restore_subcategories_with_repeated_names(self):
+        house = Category.objects.create(user=self.user, relative=self.relative, **get_category_data(name='Casa'))
+        car = Category.objects.create(user=self.user, relative=self.relative, **get_category_data(name='Carro'))
+        for parent in (house, car, self.parent):
+            Category.objects.create(
+                user=self.user, relative=self.relative, **get_category_data(name='Outros', subcategory=parent))
+        # Raiz com o mesmo nome de uma subcategoria, criada depois das filhas
+        Category.objects.create(user=self.user, relative=self.relative, **get_category_data(name='Outros'))
+        # Pai com id maior que o da filha: a filha aguarda o pai no arquivo
+        late_parent = Category.objects.create(
+            user=self.user, relative=self.relative, **get_category_data(name='Lazer'))
+        Category.objects.filter(name='Outros', subcategory=car).update(subcategory=late_parent)
+
+        target = self.create_additional_user()
+        target.relatives.all().delete()
+        user, counts = restore_user_archive(self.export_lines(), user=target, batch_size=2)
+
+        self.assertEqual(counts['category'], 9)
+        self.assertEqual(
+            sorted(Category.objects.filter(user=user, name='Outros').values_list('subcategory__name', flat=True),
+                   key=str),
+            sorted([None, 'Casa', 'Lazer', self.parent.name], key=str)
+        )
+
+    def test_restore_keeps_timestamps_and_rebuilds_checkpoints(self):
+        BalanceCheckpoint.rebuild(account_id=self.checking.id)
+        Account.objects.filter(pk=self.checking.pk).update(
+            created_at=datetime(2020, 5, 1, 12, tzinfo=dt_timezone.utc),
+            updated_at=datetime(2021, 6, 1, 12, tzinfo=dt_timezone.utc))
+
+        target = self.create_additional_user()
+        target.relatives.all().delete()
+        user, _ = restore_user_archive(self.export_lines(), user=target)
+
+        checking = Account.objects.get(user=user, name=self.checking.name)
+        self.assertEqual(checking.created_at, datetime(2020, 5, 1, 12, tzinfo=dt_timezone.utc))
+        self.assertEqual(checking.updated_at, datetime(2021, 6, 1, 12, tzinfo=dt_timezone.utc))
+        self.assertEqual(
+            list(BalanceCheckpoint.objects.filter(account=checking).order_by('month').values_list('month', 'balance')),
+            list(BalanceCheckpoint.objects.filter(account=self.checking).order_by('month')
+                 .values_list('month', 'balance'))
+        )
+        self.assertTrue(BalanceCheckpoint.objects.filter(account=checking).exists())
+
+    def test_restore_creates_user_from_header(self):
+        lines = self.export_lines()
+        header = json.loads(lines[0])
+        header['user'].update(email='restaurado@email.com', cpf=VALID_CPFS['USER_4'])
+        lines[0] = json.dumps(header)
+
+        user, counts = restore_user_archive(lines)
+
+        self.assertEqual(user.email, 'restaurado@email.com')
+        self.assertFalse(user.has_usable_password())
+        self.assertEqual(Account.objects.filter(user=user).count(), 2)
+
+    def test_restore_rejects_user_with_data_and_invalid_archive(self):
+        lines = self.export_lines()
+
+        with self.assertRaises(ValidationError):
+            restore_user_archive(lines, user=self.user)
+        with self.assertRaises(ValidationError):
+            restore_user_archive(['{"format": "outro"}'], user=self.create_additional_user())
+        self.assertEqual(Account.objects.filter(user=self.user).count(), 2)
@@ -0,0 +1,180 @@
+from datetime import date
+from decimal import Decimal
+
+from django.db import connection
+from django.test import SimpleTestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from backend.api.accounts.models import Account
+from backend.api.categories.models import Category
+from backend.api.recurring.engine import expand_rules, occurrences
+from backend.api.recurring.models import RecurringEntry
+from backend.api.summaries.models import MonthlySummary
+from backend.api.transactions.models import Transaction
+
+from .base import BaseAuthenticatedTestCase
+from .constants import get_account_data, get_category_data
+
+
+class RecurrenceEngineTest(SimpleTestCase):
+    def expand(self, frequency, start_date, window_start, window_end, interval=1, end_date=None):
+        return list(occurrences(frequency, interval, start_date, end_date, window_start, window_end))
+
+    def test_monthly_clamps_to_month_end_without_drifting(self):
+        result = self.expand('mensal', date(2026, 1, 31), date(2026, 1, 1), date(2026, 5, 31))
+        self.assertEqual(result, [
+            date(2026, 1, 31), date(2026, 2, 28), date(2026, 3, 31), date(2026, 4, 30), date(2026, 5, 31),
+        ])
+
+    def test_monthly_leap_year(self):
+        result = self.expand('mensal', date(2027, 12, 30), date(2028, 2, 1), date(2028, 2, 29))
+        self.assertEqual(result, [date(2028, 2, 29)])
+
+    def test_yearly_on_leap_day(self):
+        result = self.expand('anual', date(2024, 2, 29), date(2025, 1, 1), date(2028, 12, 31))
+        self.assertEqual(result, [date(2025, 2, 28), date(2026, 2, 28), date(2027, 2, 28), date(2028, 2, 29)])
+
+    def test_window_starts_mid_series(self):
+        # A primeira ocorrência da janela é calculada a partir da data inicial, não da janela
+        result = self.expand('semanal', date(2020, 1, 1), date(2026, 3, 1), date(2026, 3, 20), interval=2)
+        self.assertEqual(result, [date(2026, 3, 4), date(2026, 3, 18)])
+
+    def test_monthly_occurrence_before_window_start_is_skipped(self):
+        result = self.expand('mensal', date(2026, 1, 10), date(2026, 3, 15), date(2026, 5, 1))
+        self.assertEqual(result, [date(2026, 4, 10)])
+
+    def test_daily_with_interval_and_end_date(self):
+        result = self.expand('diaria', date(2026, 1, 1), date(2026, 1, 1), date(2026, 1, 31),
+                             interval=10, end_date=date(2026, 1, 25))
+        self.assertEqual(result, [date(2026, 1, 1), date(2026, 1, 11), date(2026, 1, 21)])
+
+    def test_rule_outside_window(self):
+        self.assertEqual(self.expand('mensal', date(2027, 1, 1), date(2026, 1, 1), date(2026, 12, 31)), [])
+        self.assertEqual(self.expand('mensal', date(2020, 1, 1), date(2026, 1, 1), date(2026, 12, 31),
+                                     end_date=date(2025, 12, 31)), [])
+
+    def test_occurrences_are_lazy(self):
+        generator = occurrences('diaria', 1, date(2000, 1, 1), None, date(2000, 1, 1), date(9999, 12, 31))
+        self.assertEqual(next(generator), date(2000, 1, 1))
+
+    def test_expand_rules_in_batch(self):
+        rules = [
+            (1, 'mensal', 1, date(2026, 1, 5), None),
+            (2, 'anual', 1, date(2025, 2, 10), None),
+        ]
+        result = list(expand_rules(rules, date(2026, 1, 1), date(2026, 3, 31)))
+        self.assertEqual(result, [
+            (1, date(2026, 1, 5)), (1, date(2026, 2, 5)), (1, date(2026, 3, 5)), (2, date(2026, 2, 10)),
+        ])
+
+
+class RecurringEntryTestCase(BaseAuthenticatedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.defaults['HTTP_X_RELATIVE_ID'] = str(self.relative.id)
+        self.account = Account.objects.create(user=self.user, relative=self.relative, **get_account_data())
+        self.category = Category.objects.create(user=self.user, relative=self.relative, **get_category_data())
+        self.payload = {
+            'account': self.account.id,
+            'category': self.category.id,
+            'type': 'despesas',
+            'amount': '1200.00',
+            'description': 'Aluguel',
+            'frequency': 'mensal',
+            'start_date': '2026-01-31',
+        }
+
+    def create_entry(self, **overrides):
+        payload = {**self.payload, **overrides}
+        response = self.client.post('/api/v1/recurring-entries/', payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.json())
+        return RecurringEntry.objects.get(pk=response.json()['id'])
+
+    def test_create_does_not_generate_transactions(self):
+        self.create_entry()
+        self.assertEqual(Transaction.objects.count(), 0)
+
+    def test_create_validates_category_type_and_dates(self):
+        response = self.client.post(
+            '/api/v1/recurring-entries/', {**self.payload, 'type': 'receitas'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(
+            '/api/v1/recurring-entries/', {**self.payload, 'end_date': '2025-12-31'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_occurrences_preview(self):
+        entry = self.create_entry()
+        response = self.client.get('/api/v1/recurring-entries/occurrences/?start=2026-02-01&end=2026-03-31')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(item['recurring_entry'], item['date']) for item in response.json()['results']],
+            [(entry.id, '2026-02-28'), (entry.id, '2026-03-31')]
+        )
+        self.assertEqual(Transaction.objects.count(), 0)
+
+    def test_occurrences_period_limit(self):
+        response = self.client.get('/api/v1/recurring-entries/occurrences/?start=2026-01-01&end=2027-06-01')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_materialize_period_is_idempotent(self):
+        entry = self.create_entry()
+        period = {'start': '2026-01-01', 'end': '2026-03-31'}
+
+        response = self.client.post('/api/v1/recurring-entries/materialize/', period, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()['created'], 3)
+        self.assertEqual(
+            list(entry.transactions.order_by('date').values_list('date', flat=True)),
+            [date(2026, 1, 31), date(2026, 2, 28), date(2026, 3, 31)]
+        )
+        self.assertEqual(Account.objects.get(pk=self.account.pk).balance, Decimal('-2600.00'))
+        self.assertEqual(MonthlySummary.objects.get(month=date(2026, 2, 1)).total, Decimal('1200.00'))
+
+        response = self.client.post('/api/v1/recurring-entries/materialize/', period, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['created'], 0)
+        self.assertEqual(Account.objects.get(pk=self.account.pk).balance, Decimal('-2600.00'))
+
+    def test_edited_or_deleted_occurrence_is_not_recreated(self):
+        self.create_entry()
+        period = {'start': '2026-01-01', 'end': '2026-02-28'}
+        self.client.post('/api/v1/recurring-entries/materialize/', period, format='json')
+
+        january, february = Transaction.objects.order_by('date')
+        january.date = date(2026, 2, 2)
+        january.save()
+        february.soft_delete()
+
+        response = self.client.post('/api/v1/recurring-entries/materialize/', period, format='json')
+        self.assertEqual(response.json()['created'], 0)
+
+    def test_materialize_applies_aggregated_balance_delta(self):
+        self.create_entry(frequency='semanal', start_date='2026-01-01', amount='10.00')
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post('/api/v1/recurring-entries/materialize/',
+                                        {'start': '2026-01-01', 'end': '2026-01-31'}, format='json')
+
+        self.assertEqual(response.json()['created'], 5)
+        # Um único INSERT em lote e um único UPDATE de saldo para as 5 ocorrências
+        statements = [query['sql'].split(' ', 2)[:2] for query in context.captured_queries]
+        self.assertEqual(statements.count(['INSERT', 'INTO']), 2)  # lançamentos + linha do resumo mensal
+        self.assertEqual(statements.count(['UPDATE', '"account"']), 1)
+        self.assertEqual(Account.objects.get(pk=self.account.pk).balance, Decimal('950.00'))
+
+    def test_destroy_archives_entry_and_keeps_transactions(self):
+        entry = self.create_entry()
+        self.client.post('/api/v1/recurring-entries/materialize/',
+                         {'start': '2026-01-01', 'end': '2026-01-31'}, format='json')
+
+        response = self.client.delete(f'/api/v1/recurring-entries/{entry.id}/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(RecurringEntry.objects.get(pk=entry.pk).is_archived)
+        self.assertEqual(Transaction.objects.count(), 1)
+
+        response = self.client.post('/api/v1/recurring-entries/materialize/',
+                                    {'start': '2026-02-01', 'end': '2026-02-28'}, format='json')
+        self.assertEqual(response.json()['created'], 0)
@@ -1,7 +1,11 @@
+import base64
+import json
+
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from backend.api.relatives.cache import get_owned_relative_ids, is_owned_relative
 from backend.api.relatives.models import Relative
 from backend.api.tests.base import BaseAuthenticatedTestCase
 from backend.api.tests.constants import VALID_CPFS
@@ -114,6 +118,26 @@ class RelativeModelTest(BaseAuthenticatedTestCase):
         with self.assertRaises(Exception):
             Relative.objects.create(name='Perfil 4', user=self.user)
 
+    def test_owned_relative_ids_cache_invalidated_on_save(self):
+        """
+        Testa se o cache de perfis do usuário é invalidado ao salvar um perfil.
+        """
+        self.assertEqual(get_owned_relative_ids(self.user.pk), {self.relative.pk})
+
+        relative = Relative.objects.create(name='Novo Perfil', user=self.user)
+
+        self.assertEqual(get_owned_relative_ids(self.user.pk), {self.relative.pk, relative.pk})
+
+    def test_is_owned_relative(self):
+        """
+        Testa a verificação de posse de perfil usando o cache.
+        """
+        other_user = self.create_additional_user()
+        other_relative = Relative.objects.get(user=other_user)
+
+        self.assertTrue(is_owned_relative(self.user.pk, self.relative.pk))
+        self.assertFalse(is_owned_relative(self.user.pk, other_relative.pk))
+
 
 class RelativeAPITest(APITestCase):
     """
@@ -195,6 +219,49 @@ class RelativeAPITest(APITestCase):
         self.assertEqual(len(response.data['results']), 1)
         self.assertEqual(response.data['results'][0]['name'], 'Perfil Teste')
 
+    def test_list_relatives_cursor_pagination(self):
+        """
+        Testa a paginação por cursor na ordem (name, id).
+        """
+        Relative.objects.create(name='Ana', user=self.user)
+        Relative.objects.create(name='Bruno', user=self.user)
+        self.client.force_authenticate(user=self.user)
+
+        names = []
+        url = f'{self.url}?pagination=cursor&page_size=1'
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            names += [relative['name'] for relative in response.data['results']]
+            url = response.data['next']
+
+        self.assertEqual(names, ['Ana', 'Bruno', 'Perfil Teste'])
+
+    def test_list_relatives_cursor_rejects_ordering(self):
+        """
+        Testa que ?ordering= é recusado no modo cursor, que só pagina pela chave (name, id).
+        """
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.get(self.url, {'pagination': 'cursor', 'ordering': '-created_at'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('ordering', response.data)
+
+        # Na paginação por página a ordenação continua disponível
+        response = self.client.get(self.url, {'ordering': '-created_at'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_relatives_cursor_with_wrong_types(self):
+        """
+        Testa que um cursor com valores de tipo errado resulta em 404, e não em erro do servidor.
+        """
+        self.client.force_authenticate(user=self.user)
+        cursor = base64.urlsafe_b64encode(json.dumps({'position': ['a', 'abc']}).encode()).decode()
+
+        response = self.client.get(self.url, {'cursor': cursor})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_update_relative(self):
         """
         Testa a atualização de um perfil.
@@ -0,0 +1,102 @@
+from datetime import date
+from decimal import Decimal
+
+from backend.api.accounts.models import Account
+from backend.api.categories.models import Category
+from backend.api.summaries.models import MonthlySummary
+from backend.api.transactions.models import Transaction, Transfer
+
+from .base import BaseAuthenticatedTestCase
+from .constants import get_account_data, get_category_data, get_transaction_model_data
+
+
+class MonthlySummaryTestCase(BaseAuthenticatedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.account = Account.objects.create(user=self.user, relative=self.relative, **get_account_data())
+        self.other_account = Account.objects.create(
+            user=self.user, relative=self.relative, **get_account_data(name='Poupança'))
+        self.food = Category.objects.create(user=self.user, relative=self.relative, **get_category_data())
+        self.salary = Category.objects.create(
+            user=self.user, relative=self.relative, **get_category_data(name='Salário', type_category='receitas'))
+
+    def get_summaries(self):
+        return sorted(
+            MonthlySummary.objects.values_list('account_id', 'category_id', 'month', 'type', 'total', 'count')
+            .exclude(count=0)
+        )
+
+    def assert_matches_rebuild(self):
+        incremental = self.get_summaries()
+        MonthlySummary.rebuild()
+        self.assertEqual(incremental, self.get_summaries())
+
+    def test_transactions_accumulate_in_month_row(self):
+        Transaction.objects.create(**get_transaction_model_data(self.account, self.food, amount='100.00'))
+        Transaction.objects.create(**get_transaction_model_data(
+            self.account, self.food, amount='50.00', date='2026-01-31'))
+        Transaction.objects.create(**get_transaction_model_data(
+            self.account, self.food, amount='30.00', date='2026-02-01'))
+
+        self.assertEqual(self.get_summaries(), [
+            (self.account.id, self.food.id, date(2026, 1, 1), 'despesas', Decimal('150.00'), 2),
+            (self.account.id, self.food.id, date(2026, 2, 1), 'despesas', Decimal('30.00'), 1),
+        ])
+        self.assert_matches_rebuild()
+
+    def test_edit_moves_amount_between_keys(self):
+        transaction = Transaction.objects.create(**get_transaction_model_data(self.account, self.food))
+        Transaction.objects.create(**get_transaction_model_data(self.account, self.food, amount='20.00'))
+
+        transaction.account = self.other_account
+        transaction.date = date(2026, 3, 10)
+        transaction.amount = Decimal('80.00')
+        transaction.save()
+
+        self.assertEqual(self.get_summaries(), [
+            (self.account.id, self.food.id, date(2026, 1, 1), 'despesas', Decimal('20.00'), 1),
+            (self.other_account.id, self.food.id, date(2026, 3, 1), 'despesas', Decimal('80.00'), 1),
+        ])
+        self.assert_matches_rebuild()
+
+    def test_type_change_and_soft_delete(self):
+        transaction = Transaction.objects.create(**get_transaction_model_data(self.account, self.food))
+        income = Transaction.objects.create(**get_transaction_model_data(
+            self.account, self.salary, amount='900.00'))
+
+        transaction.soft_delete()
+        income.amount = Decimal('1000.00')
+        income.save()
+
+        self.assertEqual(self.get_summaries(), [
+            (self.account.id, self.salary.id, date(2026, 1, 1), 'receitas', Decimal('1000.00'), 1),
+        ])
+        self.assert_matches_rebuild()
+
+    def test_transfers_are_not_summarized(self):
+        Transfer.create_transfer(
+            user=self.user,
+            relative_id=self.relative.id,
+            from_account_id=self.account.id,
+            to_account_id=self.other_account.id,
+            amount=Decimal('10.00'),
+            date=date(2026, 1, 5),
+        )
+        self.assertEqual(self.get_summaries(), [])
+
+    def test_rebuild_single_relative_keeps_others(self):
+        Transaction.objects.create(**get_transaction_model_data(self.account, self.food, amount='100.00'))
+        other_user = self.create_additional_user()
+        other_relative = other_user.relatives.first()
+        Transaction.objects.create(**get_transaction_model_data(
+            Account.objects.create(user=other_user, relative=other_relative, **get_account_data()),
+            Category.objects.create(user=other_user, relative=other_relative, **get_category_data()),
+            amount='10.00', date='2026-01-01'))
+
+        # Corrompe o resumo do perfil e repara apenas ele
+        MonthlySummary.objects.filter(relative=self.relative).update(total=Decimal('1.00'))
+        rows = MonthlySummary.rebuild(relative_id=self.relative.id)
+
+        self.assertEqual(rows, 1)
+        self.assertEqual(MonthlySummary.objects.get(relative=self.relative).total, Decimal('100.00'))
+        self.assertEqual(MonthlySummary.objects.get(relative=other_relative).total, Decimal('10.00'))
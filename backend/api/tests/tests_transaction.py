@@ -0,0 +1,408 @@
+from datetime import date
+from decimal import Decimal
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import SimpleTestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from backend.api.accounts.models import Account
+from backend.api.categories.models import Category
+from backend.api.core.search.fulltext import build_prefix_query, search_words
+from backend.api.transactions.models import Transaction, Transfer, balance_deltas
+
+from .base import BaseAuthenticatedTestCase
+from .constants import get_account_data, get_category_data, get_transaction_data, get_transaction_model_data
+
+
+class TransactionTestCase(BaseAuthenticatedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.defaults['HTTP_X_RELATIVE_ID'] = str(self.relative.id)
+        self.account = Account.objects.create(user=self.user, relative=self.relative, **get_account_data())
+        self.expense_category = Category.objects.create(
+            user=self.user, relative=self.relative, **get_category_data())
+        self.income_category = Category.objects.create(
+            user=self.user, relative=self.relative, **get_category_data(name='Salário', type_category='receitas'))
+
+    def get_balance(self, account=None):
+        return Account.objects.get(pk=(account or self.account).pk).balance
+
+    def test_create_expense_debits_balance(self):
+        payload = get_transaction_data(self.account, self.expense_category)
+        response = self.client.post('/api/v1/transactions/', payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()['relative'], self.relative.id)
+        self.assertEqual(self.get_balance(), Decimal('850.00'))
+
+    def test_create_income_credits_balance(self):
+        payload = get_transaction_data(self.account, self.income_category, type='receitas', amount='200.00')
+        response = self.client.post('/api/v1/transactions/', payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.get_balance(), Decimal('1200.00'))
+
+    def test_create_rejects_category_of_other_type(self):
+        payload = get_transaction_data(self.account, self.income_category)
+        response = self.client.post('/api/v1/transactions/', payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.get_balance(), Decimal('1000.00'))
+
+    def test_create_rejects_non_positive_amount(self):
+        payload = get_transaction_data(self.account, self.expense_category, amount='0.00')
+        response = self.client.post('/api/v1/transactions/', payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Transaction.objects.count(), 0)
+
+    def test_create_rejects_account_of_other_user(self):
+        other_user = self.create_additional_user()
+        other_account = Account.objects.create(
+            user=other_user, relative=other_user.relatives.first(), **get_account_data())
+        payload = get_transaction_data(other_account, self.expense_category)
+        response = self.client.post('/api/v1/transactions/', payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.get_balance(other_account), Decimal('1000.00'))
+
+    def test_update_amount_applies_only_the_difference(self):
+        transaction = Transaction.objects.create(**get_transaction_model_data(self.account, self.expense_category))
+        response = self.client.patch(
+            f'/api/v1/transactions/{transaction.id}/', {'amount': '100.00'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get_balance(), Decimal('900.00'))
+
+    def test_update_type_reverts_and_applies_effect(self):
+        transaction = Transaction.objects.create(**get_transaction_model_data(self.account, self.expense_category))
+        response = self.client.patch(
+            f'/api/v1/transactions/{transaction.id}/',
+            {'type': 'receitas', 'category': self.income_category.id}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get_balance(), Decimal('1150.00'))
+
+    def test_update_account_moves_effect_between_accounts(self):
+        other_account = Account.objects.create(
+            user=self.user, relative=self.relative, **get_account_data(name='Poupança'))
+        transaction = Transaction.objects.create(**get_transaction_model_data(self.account, self.expense_category))
+
+        response = self.client.patch(
+            f'/api/v1/transactions/{transaction.id}/', {'account': other_account.id}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get_balance(), Decimal('1000.00'))
+        self.assertEqual(self.get_balance(other_account), Decimal('850.00'))
+
+    def test_destroy_soft_deletes_and_reverts_balance(self):
+        transaction = Transaction.objects.create(**get_transaction_model_data(self.account, self.expense_category))
+        response = self.client.delete(f'/api/v1/transactions/{transaction.id}/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(Transaction.objects.get(pk=transaction.pk).is_archived)
+        self.assertEqual(self.get_balance(), Decimal('1000.00'))
+
+        # Excluir novamente não reverte o saldo duas vezes
+        self.client.delete(f'/api/v1/transactions/{transaction.id}/')
+        self.assertEqual(self.get_balance(), Decimal('1000.00'))
+
+    def test_physical_delete_not_allowed(self):
+        transaction = Transaction.objects.create(**get_transaction_model_data(self.account, self.expense_category))
+        with self.assertRaises(NotImplementedError):
+            transaction.delete()
+
+    def test_balance_updated_with_single_delta_query(self):
+        transaction = Transaction.objects.create(**get_transaction_model_data(self.account, self.expense_category))
+        transaction.amount = Decimal('120.00')
+
+        # SELECT FOR UPDATE da linha + UPDATE do lançamento + UPDATE do saldo + UPDATE do resumo
+        # mensal + UPDATE dos checkpoints (sem SELECT/SUM do histórico)
+        with self.assertNumQueries(5 + 2 * connection.features.uses_savepoints):
+            transaction.save()
+        self.assertEqual(self.get_balance(), Decimal('880.00'))
+
+    def test_stale_instances_do_not_lose_updates(self):
+        transaction = Transaction.objects.create(**get_transaction_model_data(
+            self.account, self.expense_category, amount='10.00'))
+        first = Transaction.objects.get(pk=transaction.pk)
+        second = Transaction.objects.get(pk=transaction.pk)
+
+        # Duas edições carregadas antes de qualquer gravação: o delta parte do valor gravado
+        first.amount = Decimal('20.00')
+        first.save()
+        second.amount = Decimal('30.00')
+        second.save()
+        self.assertEqual(self.get_balance(), Decimal('970.00'))
+
+        # Exclusões com instâncias desatualizadas revertem o saldo uma única vez
+        first.soft_delete()
+        second.soft_delete()
+        self.assertEqual(self.get_balance(), Decimal('1000.00'))
+        self.assertEqual(Transaction.objects.get(pk=transaction.pk).amount, Decimal('30.00'))
+
+    def test_account_save_does_not_overwrite_balance(self):
+        stale_account = Account.objects.get(pk=self.account.pk)
+        Transaction.objects.create(**get_transaction_model_data(self.account, self.expense_category))
+
+        # Editar a conta com uma instância desatualizada não pode desfazer o delta aplicado
+        stale_account.name = 'Conta Renomeada'
+        stale_account.save()
+
+        self.assertEqual(self.get_balance(), Decimal('850.00'))
+        self.assertEqual(Account.objects.get(pk=self.account.pk).name, 'Conta Renomeada')
+
+    def test_concurrent_like_saves_do_not_lose_updates(self):
+        # Instâncias carregadas antes de qualquer escrita simulam requisições concorrentes
+        first = Transaction.objects.create(**get_transaction_model_data(
+            self.account, self.expense_category, amount='10.00'))
+        second = Transaction.objects.create(**get_transaction_model_data(
+            self.account, self.expense_category, amount='20.00'))
+        first_copy = Transaction.objects.get(pk=first.pk)
+        second_copy = Transaction.objects.get(pk=second.pk)
+
+        first_copy.amount = Decimal('15.00')
+        second_copy.amount = Decimal('25.00')
+        first_copy.save()
+        second_copy.save()
+
+        self.assertEqual(self.get_balance(), Decimal('960.00'))
+
+    def test_list_filters_and_order(self):
+        Transaction.objects.create(**get_transaction_model_data(
+            self.account, self.expense_category, date='2026-01-10', description='Antiga'))
+        Transaction.objects.create(**get_transaction_model_data(
+            self.account, self.expense_category, date='2026-02-10', description='Recente'))
+        archived = Transaction.objects.create(**get_transaction_model_data(
+            self.account, self.expense_category, date='2026-02-11', description='Excluída'))
+        archived.soft_delete()
+
+        response = self.client.get('/api/v1/transactions/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['description'] for item in response.json()['results']], ['Recente', 'Antiga'])
+
+        response = self.client.get('/api/v1/transactions/?start_date=2026-02-01')
+        self.assertEqual([item['description'] for item in response.json()['results']], ['Recente'])
+
+        response = self.client.get('/api/v1/transactions/?month=2026-01')
+        self.assertEqual([item['description'] for item in response.json()['results']], ['Antiga'])
+
+        response = self.client.get('/api/v1/transactions/?only_archived=true')
+        self.assertEqual([item['description'] for item in response.json()['results']], ['Excluída'])
+
+    def test_list_invalid_filter(self):
+        response = self.client.get('/api/v1/transactions/?start_date=15-01-2026')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get('/api/v1/transactions/?account=abc')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get('/api/v1/transactions/?month=2026-13')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_local_month_stored_on_save_and_bulk_create(self):
+        item = Transaction.objects.create(**get_transaction_model_data(
+            self.account, self.expense_category, date='2026-01-31'))
+        self.assertEqual(Transaction.objects.get(pk=item.pk).month, date(2026, 1, 1))
+
+        item.date = date(2026, 2, 1)
+        item.save()
+        self.assertEqual(Transaction.objects.get(pk=item.pk).month, date(2026, 2, 1))
+
+        Transaction.objects.bulk_create([Transaction(
+            user=self.user, relative=self.relative, account=self.account, category=self.expense_category,
+            type='despesas', amount=Decimal('1.00'), date=date(2026, 3, 31), description='Lote')])
+        self.assertEqual(Transaction.objects.get(description='Lote').month, date(2026, 3, 1))
+
+    def test_list_cursor_pagination_by_date(self):
+        for day in range(1, 6):
+            Transaction.objects.create(**get_transaction_model_data(
+                self.account, self.expense_category, date=f'2026-01-0{day}', description=f'Dia {day}'))
+
+        response = self.client.get('/api/v1/transactions/?pagination=cursor&page_size=2')
+        body = response.json()
+        self.assertEqual([item['description'] for item in body['results']], ['Dia 5', 'Dia 4'])
+
+        response = self.client.get(body['next'])
+        body = response.json()
+        self.assertEqual([item['description'] for item in body['results']], ['Dia 3', 'Dia 2'])
+
+        response = self.client.get(body['previous'])
+        self.assertEqual([item['description'] for item in response.json()['results']], ['Dia 5', 'Dia 4'])
+
+    def test_list_scoped_to_user(self):
+        other_user = self.create_additional_user()
+        other_relative = other_user.relatives.first()
+        Transaction.objects.create(
+            user=other_user,
+            relative=other_relative,
+            account=Account.objects.create(user=other_user, relative=other_relative, **get_account_data()),
+            category=Category.objects.create(user=other_user, relative=other_relative, **get_category_data()),
+            type='despesas',
+            amount=Decimal('10.00'),
+            date='2026-01-01',
+        )
+        Transaction.objects.create(**get_transaction_model_data(self.account, self.expense_category))
+
+        response = self.client.get('/api/v1/transactions/')
+        self.assertEqual(len(response.json()['results']), 1)
+
+    def test_search_by_description_with_filters(self):
+        Transaction.objects.create(**get_transaction_model_data(
+            self.account, self.expense_category, description='Mercado São João', date='2026-01-10'))
+        Transaction.objects.create(**get_transaction_model_data(
+            self.account, self.expense_category, description='Supermercado', date='2026-02-10'))
+        Transaction.objects.create(**get_transaction_model_data(
+            self.account, self.expense_category, description='Uber para o mercado', date='2026-02-12', amount='20.00'))
+        Transaction.objects.create(**get_transaction_model_data(
+            self.account, self.expense_category, description='Padaria', date='2026-02-15'))
+
+        response = self.client.get('/api/v1/transactions/search/?q=sao joao')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['description'] for item in response.json()['results']], ['Mercado São João'])
+
+        response = self.client.get('/api/v1/transactions/search/?q=mercado&month=2026-02')
+        results = response.json()['results']
+        self.assertEqual(response.json()['count'], 2)
+        self.assertNotIn('search_vector', results[0])
+        self.assertEqual({item['description'] for item in results}, {'Supermercado', 'Uber para o mercado'})
+
+        response = self.client.get(f'/api/v1/transactions/search/?q=uber&category={self.income_category.id}')
+        self.assertEqual(response.json()['count'], 0)
+
+    def test_search_requires_term(self):
+        self.assertEqual(self.client.get('/api/v1/transactions/search/').status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get('/api/v1/transactions/search/?q=%25%25')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['count'], 0)
+
+
+class FullTextQueryTest(SimpleTestCase):
+    def test_prefix_query_keeps_only_words(self):
+        words = search_words("pão & 'mercado' | !uber:*")
+        self.assertEqual(words, ['pão', 'mercado', 'uber'])
+        self.assertEqual(build_prefix_query(words), 'pão:* & mercado:* & uber:*')
+
+    def test_search_benchmark_requires_postgresql(self):
+        with self.assertRaises(CommandError):
+            call_command('benchmark_transaction_search', rows=10)
+
+
+class BalanceDeltasTest(SimpleTestCase):
+    def test_new_transaction(self):
+        self.assertEqual(balance_deltas(None, (1, Decimal('-10'))), {1: Decimal('-10')})
+
+    def test_same_account_keeps_difference(self):
+        self.assertEqual(balance_deltas((1, Decimal('-10')), (1, Decimal('-15'))), {1: Decimal('-5')})
+
+    def test_unchanged_effect_has_no_delta(self):
+        self.assertEqual(balance_deltas((1, Decimal('-10')), (1, Decimal('-10'))), {})
+
+    def test_account_change(self):
+        self.assertEqual(
+            balance_deltas((1, Decimal('-10')), (2, Decimal('-10'))),
+            {1: Decimal('10'), 2: Decimal('-10')}
+        )
+
+
+class TransferTestCase(BaseAuthenticatedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.defaults['HTTP_X_RELATIVE_ID'] = str(self.relative.id)
+        self.checking = Account.objects.create(user=self.user, relative=self.relative, **get_account_data())
+        self.savings = Account.objects.create(
+            user=self.user, relative=self.relative, **get_account_data(name='Poupança', balance='500.00'))
+
+    def get_balance(self, account):
+        return Account.objects.get(pk=account.pk).balance
+
+    def post_transfer(self, from_account, to_account, amount='100.00'):
+        return self.client.post('/api/v1/transfers/', {
+            'from_account': from_account.id,
+            'to_account': to_account.id,
+            'amount': amount,
+            'date': '2026-01-20',
+            'description': 'Reserva',
+        }, format='json')
+
+    def test_create_transfer_writes_both_legs_and_balances(self):
+        response = self.post_transfer(self.checking, self.savings)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.get_balance(self.checking), Decimal('900.00'))
+        self.assertEqual(self.get_balance(self.savings), Decimal('600.00'))
+
+        transfer = Transfer.objects.get(pk=response.json()['id'])
+        legs = {leg.direction: leg for leg in transfer.legs.all()}
+        self.assertEqual(legs['saida'].account_id, self.checking.id)
+        self.assertEqual(legs['entrada'].account_id, self.savings.id)
+        self.assertTrue(all(leg.type == 'transferencia' for leg in legs.values()))
+
+    def test_transfer_updates_accounts_in_id_order(self):
+        # Independente do sentido, as contas são sempre atualizadas em ordem crescente de id
+        for from_account, to_account in ((self.checking, self.savings), (self.savings, self.checking)):
+            with CaptureQueriesContext(connection) as context:
+                self.post_transfer(from_account, to_account)
+
+            updated_ids = [
+                int(query['sql'].rsplit('=', 1)[1].strip(' )'))
+                for query in context.captured_queries
+                if query['sql'].startswith('UPDATE "account"')
+            ]
+            self.assertEqual(updated_ids, sorted(updated_ids))
+            self.assertEqual(len(updated_ids), 2)
+
+    def test_transfer_rolls_back_when_destination_is_invalid(self):
+        archived = Account.objects.create(
+            user=self.user, relative=self.relative, **get_account_data(name='Antiga', is_archived=True))
+        response = self.post_transfer(self.checking, archived)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.get_balance(self.checking), Decimal('1000.00'))
+        self.assertEqual(Transfer.objects.count(), 0)
+        self.assertEqual(Transaction.objects.count(), 0)
+
+    def test_transfer_to_same_account(self):
+        response = self.post_transfer(self.checking, self.checking)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_transfer_to_account_of_other_user(self):
+        other_user = self.create_additional_user()
+        other_account = Account.objects.create(
+            user=other_user, relative=other_user.relatives.first(), **get_account_data())
+        response = self.post_transfer(self.checking, other_account)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.get_balance(other_account), Decimal('1000.00'))
+
+    def test_destroy_transfer_reverts_both_balances(self):
+        transfer_id = self.post_transfer(self.checking, self.savings).json()['id']
+        response = self.client.delete(f'/api/v1/transfers/{transfer_id}/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get_balance(self.checking), Decimal('1000.00'))
+        self.assertEqual(self.get_balance(self.savings), Decimal('500.00'))
+        self.assertFalse(Transaction.objects.filter(is_archived=False).exists())
+
+    def test_transfer_legs_cannot_be_edited_or_deleted_directly(self):
+        transfer_id = self.post_transfer(self.checking, self.savings).json()['id']
+        leg = Transaction.objects.filter(transfer_id=transfer_id).first()
+
+        response = self.client.patch(f'/api/v1/transactions/{leg.id}/', {'amount': '1.00'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.delete(f'/api/v1/transactions/{leg.id}/')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.get_balance(self.checking), Decimal('900.00'))
+
+    def test_transaction_endpoint_rejects_transfer_type(self):
+        payload = get_transaction_data(self.checking, type='transferencia')
+        response = self.client.post('/api/v1/transactions/', payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_transfer_update_not_allowed(self):
+        transfer_id = self.post_transfer(self.checking, self.savings).json()['id']
+        response = self.client.patch(f'/api/v1/transfers/{transfer_id}/', {'amount': '1.00'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
@@ -5,6 +5,7 @@ from rest_framework import status
 from rest_framework.test import APITestCase
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from backend.api.users.cache import LOCAL_AUTH_USER_CACHE_TIMEOUT, get_auth_cache_timeout
 from backend.api.users.models import User
 from backend.api.users.serializers import (ChangePasswordSerializer,
                                            UserLoginSerializer,
@@ -306,6 +307,58 @@ class UserAuthenticationAPITest(APITestCase):
         self.assertEqual(response.json().get(
             'data').get('display_name'), 'João Silva')
 
+    def test_user_profile_summary_served_from_auth_cache(self):
+        user = User.objects.create_user(**BRAZILIAN_USER_DATA)
+
+        # Autenticar usuário
+        refresh = RefreshToken.for_user(user)
+        self.client.credentials(  # type: ignore
+            HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')  # type: ignore
+
+        self.client.get(self.me_url)
+
+        # Segunda requisição com o mesmo token não deve buscar o usuário no banco
+        with self.assertNumQueries(0):
+            response = self.client.get(self.me_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_deactivated_user_is_removed_from_auth_cache(self):
+        user = User.objects.create_user(**BRAZILIAN_USER_DATA)
+
+        # Autenticar usuário
+        refresh = RefreshToken.for_user(user)
+        self.client.credentials(  # type: ignore
+            HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')  # type: ignore
+
+        self.client.get(self.me_url)
+        self.client.delete(self.deactivate_url)
+
+        response = self.client.get(self.me_url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_profile_update_refreshes_auth_cache(self):
+        user = User.objects.create_user(**BRAZILIAN_USER_DATA)
+
+        # Autenticar usuário
+        refresh = RefreshToken.for_user(user)
+        self.client.credentials(  # type: ignore
+            HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')  # type: ignore
+
+        self.client.get(self.me_url)
+        self.client.patch(self.profile_url, {'social_name': 'Novo Nome'})
+
+        response = self.client.get(self.me_url)
+
+        self.assertEqual(response.json().get('data').get('display_name'), 'Novo Nome')
+
+    def test_auth_cache_timeout_limited_without_shared_cache(self):
+        with self.settings(CACHE_IS_SHARED=False, AUTH_USER_CACHE_TIMEOUT=60):
+            self.assertEqual(get_auth_cache_timeout(), LOCAL_AUTH_USER_CACHE_TIMEOUT)
+        with self.settings(CACHE_IS_SHARED=True, AUTH_USER_CACHE_TIMEOUT=60):
+            self.assertEqual(get_auth_cache_timeout(), 60)
+
 
 class UserSerializerTest(TestCase):
     """
@@ -321,28 +374,54 @@ class UserSerializerTest(TestCase):
     def test_registration_duplicate_cpf_validation(self):
         """
         Testa validação de CPF duplicado
-        Testa diretamente o método validate_cpf do serializer
+        A duplicidade é detectada pela constraint unique no INSERT
         """
-        serializer = UserRegistrationSerializer()
+        data = self.registration_data.copy()
+        data['email'] = 'outro@email.com'
+        serializer = UserRegistrationSerializer(data=data)
+        self.assertTrue(serializer.is_valid())
 
-        # Simular CPF já existente no banco
         with self.assertRaises(Exception) as cm:
-            serializer.validate_cpf(self.existing_user.cpf)  # type: ignore
+            serializer.save()
         self.assertIn('Este CPF já está registrado', str(cm.exception))
+        self.assertNotIn('email', cm.exception.detail)  # type: ignore
 
     def test_registration_duplicate_email_validation(self):
         """
         Testa validação de email duplicado
-        Testa diretamente o método validate_email do serializer
+        A duplicidade é detectada pela constraint unique no INSERT (testando normalização também)
         """
-        serializer = UserRegistrationSerializer()
+        data = self.registration_data.copy()
+        data['cpf'] = VALID_CPFS['USER_2']
+        data['email'] = self.existing_user.email.upper()
+        serializer = UserRegistrationSerializer(data=data)
+        self.assertTrue(serializer.is_valid())
 
-        # Simular email já existente no banco (testando normalização também)
         with self.assertRaises(Exception) as cm:
-            serializer.validate_email(  # type: ignore
-                self.existing_user.email.upper())
+            serializer.save()
         self.assertIn('Este email já está registrado', str(cm.exception))
 
+    def test_registration_hashes_password_and_saves_once(self):
+        """
+        Testa que o registro gera o hash da senha e salva o usuário uma única vez
+        """
+        from unittest.mock import patch
+
+        data = self.registration_data.copy()
+        data['cpf'] = VALID_CPFS['USER_2']
+        data['email'] = 'novo@email.com'
+        serializer = UserRegistrationSerializer(data=data)
+        self.assertTrue(serializer.is_valid())
+
+        with patch('backend.api.users.models.User.set_password', autospec=True,
+                   side_effect=lambda user, raw: setattr(user, 'password', raw)) as set_password, \
+                patch('backend.api.users.models.User.clean', autospec=True) as clean:
+            user = serializer.save()
+
+        self.assertEqual(set_password.call_count, 1)
+        self.assertEqual(clean.call_count, 1)
+        self.assertEqual(User.objects.filter(pk=user.pk).count(), 1)
+
     def test_login_inactive_user_validation(self):
         """
         Testa validação de usuário inativo
@@ -1,6 +1,12 @@
+from types import SimpleNamespace
+
 from django.test import TestCase
 from rest_framework.serializers import ValidationError
 
+from django.db import IntegrityError
+
+from backend.api.accounts.models import Account
+from backend.api.core.mixins.unique_constraint import get_unique_constraint_columns, get_violated_columns
 from backend.api.utils.validators import validate_cpf
 
 
@@ -127,3 +133,60 @@ class CPFValidatorTest(TestCase):
             validate_cpf("...-/-")
         self.assertIn("CPF deve conter exatamente 11 números",
                       str(cm.exception))
+
+
+class UniqueConstraintErrorTest(TestCase):
+    """
+    Testes para a tradução de violações de unicidade do banco
+    """
+
+    def postgres_error(self, constraint_name, message):
+        """IntegrityError como o Django levanta no PostgreSQL: erro do driver (com diag) em __cause__"""
+        cause = Exception(message)
+        cause.diag = SimpleNamespace(constraint_name=constraint_name)
+        exc = IntegrityError(message)
+        exc.__cause__ = cause
+        return exc
+
+    def get_account_unique_constraint(self):
+        columns = frozenset({'user_id', 'relative_id', 'name'})
+        return next(name for name, unique_columns in get_unique_constraint_columns(Account).items()
+                    if unique_columns == columns)
+
+    def test_violated_columns_postgres_constraint_name(self):
+        """Testa a identificação pelo nome da constraint, com mensagens do servidor em português"""
+        exc = self.postgres_error(
+            self.get_account_unique_constraint(),
+            'duplicar valor da chave viola a restrição de unicidade\n'
+            'DETAIL:  Chave (user_id, relative_id, name)=(1, 1, Casa) já existe.'
+        )
+        self.assertEqual(get_violated_columns(exc, Account), {'user_id', 'relative_id', 'name'})
+        self.assertEqual(
+            Account.get_unique_error(exc),
+            {'name': 'Você já possui uma conta com este nome. Use outro nome.'}
+        )
+
+    def test_unknown_postgres_constraint_is_not_translated(self):
+        """Testa que constraints fora de unique_error_messages continuam como IntegrityError"""
+        exc = self.postgres_error('account_pkey', 'DETAIL:  Key (id)=(1) already exists.')
+        self.assertIsNone(get_violated_columns(exc, Account))
+        self.assertIsNone(Account.get_unique_error(exc))
+
+    def test_violated_columns_sqlite_message(self):
+        """Testa extração das colunas da mensagem do SQLite"""
+        exc = IntegrityError(
+            'UNIQUE constraint failed: account.user_id, account.relative_id, account.name')
+        self.assertEqual(get_violated_columns(exc), {'user_id', 'relative_id', 'name'})
+
+    def test_violated_columns_unknown_message(self):
+        """Testa mensagem sem colunas identificáveis"""
+        self.assertIsNone(get_violated_columns(IntegrityError('NOT NULL constraint failed')))
+
+    def test_known_constraint_maps_to_model_message(self):
+        """Testa se a constraint conhecida é traduzida na mensagem do modelo"""
+        exc = IntegrityError('UNIQUE constraint failed: account.user_id, account.relative_id, account.name')
+        self.assertEqual(
+            Account.get_unique_error(exc),
+            {'name': 'Você já possui uma conta com este nome. Use outro nome.'}
+        )
+        self.assertIsNone(Account.get_unique_error(IntegrityError('UNIQUE constraint failed: account.id')))
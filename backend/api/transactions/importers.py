@@ -0,0 +1,328 @@
+"""
+Importação de extratos (CSV/OFX) em lançamentos.
+
+O arquivo é lido como stream e processado em lotes: memória constante, independente do
+tamanho do arquivo. Contas e categorias citadas no lote são resolvidas com uma consulta
+por lote (apenas nomes ainda não vistos) e guardadas num mapa em memória; os lançamentos
+válidos são gravados com bulk_create e os saldos/resumos são atualizados uma única vez no fim.
+"""
+import csv
+import re
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal, InvalidOperation
+from itertools import chain, islice
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from backend.api.accounts.models import Account
+from backend.api.categories.models import Category
+
+from .models import Transaction, TransactionDeltas
+
+IMPORT_BATCH_SIZE = 1000
+
+# Apenas os primeiros erros são devolvidos (o total é sempre informado)
+MAX_REPORTED_ERRORS = 100
+
+# Linha lida do extrato, ainda sem validação (valores em texto)
+ImportRow = namedtuple('ImportRow', 'line date description amount type category account external_id')
+
+# Cabeçalhos aceitos no CSV (português ou inglês) -> campo do ImportRow
+CSV_COLUMNS = {
+    'data': 'date', 'date': 'date',
+    'descricao': 'description', 'descrição': 'description', 'description': 'description', 'historico': 'description',
+    'valor': 'amount', 'amount': 'amount',
+    'tipo': 'type', 'type': 'type',
+    'categoria': 'category', 'category': 'category',
+    'conta': 'account', 'account': 'account',
+    'id': 'external_id', 'external_id': 'external_id',
+}
+
+DATE_FORMATS = ('%Y-%m-%d', '%d/%m/%Y', '%Y%m%d')
+
+TYPE_ALIASES = {
+    'despesa': 'despesas', 'despesas': 'despesas', 'debito': 'despesas', 'débito': 'despesas',
+    'receita': 'receitas', 'receitas': 'receitas', 'credito': 'receitas', 'crédito': 'receitas',
+}
+
+OFX_TAG = re.compile(r'<(/?)([A-Za-z0-9.]+)>([^<]*)')
+OFX_CHUNK_SIZE = 64 * 1024
+
+# Data/hora OFX: AAAAMMDD[HHMMSS[.XXX]][deslocamento:fuso], ex. 20260106020000.000[0:GMT]
+OFX_DATETIME = re.compile(r'^(\d{8})(\d{6})?(?:\.\d+)?(?:\[([+-]?\d+(?:\.\d+)?)(?::[^\]]*)?\])?')
+
+
+def parse_csv(stream):
+    """
+    Gera ImportRow a partir de um stream de texto CSV (separador ',' ou ';', detectado no cabeçalho).
+    """
+    header = next(stream, '')
+    delimiter = ';' if header.count(';') > header.count(',') else ','
+    reader = csv.reader(chain([header], stream), delimiter=delimiter)
+
+    columns = [CSV_COLUMNS.get(name.strip().lower()) for name in next(reader, [])]
+    for line, values in enumerate(reader, start=2):
+        if not any(value.strip() for value in values):
+            continue
+        data = {column: value.strip() for column, value in zip(columns, values) if column}
+        yield ImportRow(
+            line=line,
+            date=data.get('date', ''),
+            description=data.get('description', ''),
+            amount=data.get('amount', ''),
+            type=data.get('type', ''),
+            category=data.get('category', ''),
+            account=data.get('account', ''),
+            external_id=data.get('external_id', ''),
+        )
+
+
+def parse_ofx(stream):
+    """
+    Gera ImportRow para cada <STMTTRN> de um stream de texto OFX (SGML 1.x ou XML 2.x),
+    lendo o arquivo em blocos.
+    """
+    buffer = ''
+    current = None
+    count = 0
+
+    for chunk in chain(iter(lambda: stream.read(OFX_CHUNK_SIZE), ''), [None]):
+        if chunk is None:
+            # Fim do arquivo: processa o que sobrou no buffer
+            pending, buffer = buffer, ''
+        else:
+            buffer += chunk
+            # Só processa até o último '<': a última tag pode estar cortada no fim do bloco
+            cut = buffer.rfind('<')
+            pending, buffer = buffer[:cut], buffer[cut:]
+
+        for closing, tag, value in OFX_TAG.findall(pending):
+            tag = tag.upper()
+            if tag == 'STMTTRN':
+                if closing and current is not None:
+                    count += 1
+                    yield ImportRow(
+                        line=count,
+                        date=parse_ofx_date(current.get('DTPOSTED', '')),
+                        description=current.get('MEMO') or current.get('NAME', ''),
+                        amount=current.get('TRNAMT', ''),
+                        type='',
+                        category='',
+                        account='',
+                        external_id=current.get('FITID', ''),
+                    )
+                current = None if closing else {}
+            elif current is not None and not closing:
+                current[tag] = value.strip()
+
+
+def parse_ofx_date(value):
+    """
+    Converte o DTPOSTED na data local (settings.TIME_ZONE).
+    Com hora e fuso explícitos (ex.: 02:00 GMT), a data é convertida para o fuso local,
+    que pode ser o dia anterior; sem fuso, vale a data informada pelo banco.
+    """
+    match = OFX_DATETIME.match(value)
+    if not match:
+        return value[:8]
+
+    day, time, offset = match.groups()
+    if time is None or offset is None:
+        return day
+
+    # Hora ou fuso inválidos (ex.: [-30:XYZ]): vale a data informada pelo banco
+    try:
+        posted = datetime.strptime(day + time, '%Y%m%d%H%M%S')
+        posted = posted.replace(tzinfo=dt_timezone(timedelta(hours=float(offset))))
+    except (ValueError, OverflowError):
+        return day
+    return timezone.localtime(posted).strftime('%Y%m%d')
+
+
+def parse_date(value):
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format).date()
+        except ValueError:
+            continue
+    raise ValidationError({'date': f'Data inválida: "{value}".'})
+
+
+def parse_amount(value):
+    """
+    Converte valores como '1234.56', '-1.234,56' ou 'R$ 10,00' em Decimal com sinal.
+    """
+    cleaned = value.replace('R$', '').replace(' ', '')
+    if ',' in cleaned:
+        cleaned = cleaned.replace('.', '').replace(',', '.')
+    try:
+        amount = Decimal(cleaned)
+    except InvalidOperation:
+        raise ValidationError({'amount': f'Valor inválido: "{value}".'})
+    # NaN e infinito não são comparáveis e estourariam fora do tratamento por linha
+    if not amount.is_finite():
+        raise ValidationError({'amount': f'Valor inválido: "{value}".'})
+    if not amount:
+        raise ValidationError({'amount': 'O valor deve ser diferente de zero.'})
+
+    # Mesmo limite de dígitos da coluna: valores maiores falhariam no INSERT e desfariam o lote inteiro
+    field = Transaction._meta.get_field('amount')
+    if abs(amount) >= Decimal(10) ** (field.max_digits - field.decimal_places):
+        raise ValidationError({'amount': f'Valor fora do limite permitido: "{value}".'})
+    quantized = amount.quantize(Decimal(1).scaleb(-field.decimal_places))
+    if quantized != amount:
+        raise ValidationError({'amount': f'Valor com mais de {field.decimal_places} casas decimais: "{value}".'})
+    return quantized
+
+
+def batched(rows, size):
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class TransactionImporter:
+    """
+    Importa linhas de extrato para um perfil.
+    Linhas sem conta usam a conta padrão; linhas sem categoria (ou com categoria não encontrada)
+    usam a categoria padrão do tipo. Linhas inválidas são ignoradas e reportadas;
+    linhas com identificador externo já importado na conta são ignoradas como duplicadas.
+    """
+
+    def __init__(self, user, relative_id, account, expense_category=None, income_category=None,
+                 batch_size=IMPORT_BATCH_SIZE):
+        self.user = user
+        self.relative_id = relative_id
+        self.account = account
+        self.default_categories = {'despesas': expense_category, 'receitas': income_category}
+        self.batch_size = batch_size
+
+        # Mapas em memória (nome -> objeto) preenchidos sob demanda, lote a lote
+        self.accounts = {}
+        self.categories = {}
+
+        self.created = 0
+        self.duplicates = 0
+        self.error_count = 0
+        self.errors = []
+
+    def run(self, rows):
+        """
+        Importa todas as linhas numa única transação do banco e aplica os deltas de saldo
+        e do resumo mensal uma única vez no fim.
+        """
+        deltas = TransactionDeltas()
+        with transaction.atomic():
+            for batch in batched(rows, self.batch_size):
+                self.import_batch(batch, deltas)
+            deltas.apply()
+
+        return {
+            'created': self.created,
+            'duplicates': self.duplicates,
+            'error_count': self.error_count,
+            'errors': self.errors,
+        }
+
+    def import_batch(self, rows, deltas):
+        self.resolve_names(rows)
+        existing = self.get_existing_external_ids(rows)
+
+        transactions = []
+        for row in rows:
+            try:
+                item = self.build_transaction(row)
+            except ValidationError as exc:
+                self.add_error(row.line, exc)
+                continue
+
+            if item.external_id:
+                key = (item.account_id, item.external_id)
+                if key in existing:
+                    self.duplicates += 1
+                    continue
+                existing.add(key)
+
+            transactions.append(item)
+
+        Transaction.objects.bulk_create(transactions)
+        for item in transactions:
+            deltas.add(item)
+        self.created += len(transactions)
+
+    def resolve_names(self, rows):
+        """
+        Carrega com uma consulta cada as contas e categorias do lote que ainda não estão no mapa.
+        """
+        scope = {'user': self.user, 'relative_id': self.relative_id, 'is_archived': False}
+
+        account_names = {row.account for row in rows if row.account} - self.accounts.keys()
+        if account_names:
+            for account in Account.objects.filter(name__in=account_names, **scope):
+                self.accounts[account.name] = account
+            self.accounts.update({name: None for name in account_names - self.accounts.keys()})
+
+        category_names = {row.category for row in rows if row.category} - self.categories.keys()
+        if category_names:
+            found = list(Category.objects.filter(
+                Q(full_name__in=category_names) | Q(name__in=category_names), **scope))
+            # Caminho completo ("Pai > Filha") tem prioridade sobre o nome simples de uma subcategoria
+            for category in found:
+                if category.full_name in category_names:
+                    self.categories[category.full_name] = category
+            for category in found:
+                if category.name in category_names:
+                    self.categories.setdefault(category.name, category)
+            self.categories.update({name: None for name in category_names - self.categories.keys()})
+
+    def get_existing_external_ids(self, rows):
+        external_ids = {row.external_id for row in rows if row.external_id}
+        if not external_ids:
+            return set()
+        return set(
+            Transaction.objects.filter(
+                user=self.user, external_id__in=external_ids
+            ).values_list('account_id', 'external_id')
+        )
+
+    def build_transaction(self, row):
+        amount = parse_amount(row.amount)
+        type_ = TYPE_ALIASES.get(row.type.lower()) if row.type else None
+        if row.type and type_ is None:
+            raise ValidationError({'type': f'Tipo inválido: "{row.type}".'})
+        if type_ is None:
+            type_ = 'despesas' if amount < 0 else 'receitas'
+
+        account = self.accounts.get(row.account) if row.account else self.account
+        if account is None:
+            raise ValidationError({'account': f'Conta "{row.account}" não encontrada.'})
+
+        category = self.categories.get(row.category) if row.category else None
+        if category is None or category.type_category != type_:
+            category = self.default_categories[type_]
+        if category is None:
+            raise ValidationError({'category': f'Categoria não encontrada para a linha ({type_}).'})
+
+        item = Transaction(
+            user=self.user,
+            relative_id=self.relative_id,
+            account=account,
+            category=category,
+            type=type_,
+            amount=abs(amount),
+            description=row.description[:200],
+            date=parse_date(row.date),
+            external_id=row.external_id[:255],
+        )
+        # Sem consultas: conta e categoria já estão em memória
+        item.clean()
+        return item
+
+    def add_error(self, line, exc):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'line': line, 'errors': exc.message_dict if hasattr(exc, 'error_dict') else exc.messages})
@@ -0,0 +1,474 @@
+from decimal import Decimal
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.db.models import F
+from django.db.models.functions import Now
+
+from backend.api.balances.models import apply_checkpoint_deltas, checkpoint_deltas
+from backend.api.core.fields.month import MonthField
+from backend.api.dashboard.cache import invalidate_dashboard
+from backend.api.summaries.models import apply_summary_deltas, summary_deltas
+
+
+class Transaction(models.Model):
+    """
+    Lançamento financeiro (receita, despesa ou perna de transferência) de uma conta.
+    O saldo da conta é ajustado incrementalmente a cada criação, edição e
+    exclusão lógica, sem recalcular o histórico.
+    """
+    TRANSACTION_TYPES = [
+        ('despesas', 'Despesas'),
+        ('receitas', 'Receitas'),
+        ('transferencia', 'Transferência'),
+    ]
+
+    # Sentido da perna de uma transferência (vazio para receitas e despesas)
+    TRANSFER_DIRECTIONS = [
+        ('saida', 'Saída'),
+        ('entrada', 'Entrada'),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='transactions',
+        verbose_name='Usuário'
+    )
+    relative = models.ForeignKey(
+        'api.Relative',
+        on_delete=models.CASCADE,
+        related_name='transactions',
+        verbose_name='Parente'
+    )
+    account = models.ForeignKey(
+        'api.Account',
+        on_delete=models.CASCADE,
+        related_name='transactions',
+        verbose_name='Conta'
+    )
+    category = models.ForeignKey(
+        'api.Category',
+        on_delete=models.CASCADE,
+        related_name='transactions',
+        null=True,
+        blank=True,
+        verbose_name='Categoria'
+    )
+    transfer = models.ForeignKey(
+        'api.Transfer',
+        on_delete=models.CASCADE,
+        related_name='legs',
+        null=True,
+        blank=True,
+        verbose_name='Transferência'
+    )
+    recurring_entry = models.ForeignKey(
+        'api.RecurringEntry',
+        on_delete=models.SET_NULL,
+        related_name='transactions',
+        null=True,
+        blank=True,
+        verbose_name='Lançamento recorrente'
+    )
+    # Ocorrência da regra recorrente que originou o lançamento (não muda se a data for editada)
+    recurrence_date = models.DateField(null=True, blank=True, verbose_name='Data da ocorrência')
+    # Identificador do lançamento no extrato importado (ex: FITID do OFX), evita importar duas vezes
+    external_id = models.CharField(max_length=255, blank=True, default='', verbose_name='Identificador externo')
+    type = models.CharField(max_length=15, choices=TRANSACTION_TYPES, verbose_name='Tipo')
+    direction = models.CharField(max_length=10, choices=TRANSFER_DIRECTIONS, blank=True, default='',
+                                 verbose_name='Sentido')
+    amount = models.DecimalField(max_digits=10, decimal_places=2, verbose_name='Valor')
+    description = models.CharField(max_length=200, blank=True, default='', verbose_name='Descrição')
+    # Data local (America/Sao_Paulo) do lançamento; month é o mês dela, para agregações mensais
+    date = models.DateField(verbose_name='Data')
+    month = MonthField(source='date', verbose_name='Mês')
+    is_archived = models.BooleanField(default=False, verbose_name='Excluída')
+    # Descrição indexada para busca textual (português, sem acentos); mantida por trigger no
+    # PostgreSQL (migration 0016), com índice GIN. Vazia no SQLite
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'transaction'
+        verbose_name = 'Transação'
+        verbose_name_plural = 'Transações'
+        ordering = ['-date', '-id']
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(amount__gt=0),
+                name='transaction_amount_positive'
+            ),
+            # Cada ocorrência de um lançamento recorrente é materializada no máximo uma vez
+            models.UniqueConstraint(
+                fields=['recurring_entry', 'recurrence_date'],
+                condition=models.Q(recurring_entry__isnull=False),
+                name='transaction_unique_recurring_date'
+            ),
+            models.UniqueConstraint(
+                fields=['account', 'external_id'],
+                condition=~models.Q(external_id=''),
+                name='transaction_unique_external_id'
+            ),
+        ]
+        indexes = [
+            # Listagem padrão: lançamentos ativos do perfil, do mais recente ao mais antigo
+            models.Index(
+                fields=['user', 'relative', '-date', '-id'],
+                condition=models.Q(is_archived=False),
+                name='transaction_active_date_idx'
+            ),
+            # Saldo acumulado (Window por conta em ordem de data e id) e saldo em uma data
+            models.Index(
+                fields=['account', 'date', 'id'],
+                condition=models.Q(is_archived=False),
+                name='transaction_account_date_idx'
+            ),
+            # Agregações e filtros mensais (resumo mensal, checkpoints, ?month=) sem TruncMonth
+            models.Index(
+                fields=['relative', 'month'],
+                condition=models.Q(is_archived=False),
+                name='transaction_relative_month_idx'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.description or self.get_type_display()} - {self.amount}"
+
+    def get_effects(self):
+        """
+        Retorna (efeito no saldo, entrada no resumo mensal, entrada nos checkpoints de saldo)
+        deste lançamento.
+        """
+        return (self.get_balance_effect(), self.get_summary_entry(), self.get_checkpoint_entry())
+
+    def get_balance_effect(self):
+        """
+        Retorna (account_id, delta) que este lançamento aplica ao saldo da conta.
+        Lançamentos excluídos não afetam o saldo.
+        """
+        if self.is_archived:
+            return (self.account_id, Decimal('0'))
+        if self.type == 'despesas' or self.direction == 'saida':
+            return (self.account_id, -self.amount)
+        return (self.account_id, self.amount)
+
+    def get_summary_entry(self):
+        """
+        Retorna (chave, valor) deste lançamento no resumo mensal, ou None se não entra no resumo
+        (excluído ou perna de transferência).
+        """
+        if self.is_archived or self.type == 'transferencia':
+            return None
+        month = self.date.replace(day=1)
+        key = (self.user_id, self.relative_id, self.account_id, self.category_id, month, self.type)
+        return (key, self.amount)
+
+    def get_checkpoint_entry(self):
+        """
+        Retorna (account_id, mês, delta) deste lançamento nos checkpoints de saldo,
+        ou None se não afeta o saldo (excluído).
+        """
+        account_id, delta = self.get_balance_effect()
+        if not delta:
+            return None
+        return (account_id, self.date.replace(day=1), delta)
+
+    def _lock_original_effects(self):
+        """
+        Efeitos gravados antes da edição, lidos da linha bloqueada (SELECT ... FOR UPDATE):
+        edições concorrentes do mesmo lançamento esperam umas pelas outras e cada uma calcula
+        o delta a partir do valor já gravado pela anterior, não de uma cópia carregada antes.
+        Deve ser chamado dentro de transaction.atomic().
+        """
+        if self._state.adding:
+            return (None, None, None)
+
+        original = Transaction.objects.select_for_update().filter(pk=self.pk).order_by().first()
+        return original.get_effects() if original else (None, None, None)
+
+    def clean(self):
+        """
+        Valida o valor e a consistência entre conta, categoria e perfil.
+        """
+        # Normaliza valores atribuídos como texto (ex: '2026-01-15') antes de calcular os efeitos
+        self.amount = self._meta.get_field('amount').to_python(self.amount)
+        self.date = self._meta.get_field('date').to_python(self.date)
+
+        if self.amount is None or self.amount <= 0:
+            raise ValidationError({'amount': 'O valor deve ser maior que zero.'})
+
+        if self.account.relative_id != self.relative_id or self.account.user_id != self.user_id:
+            raise ValidationError({'account': 'A conta deve pertencer ao mesmo usuário e perfil.'})
+
+        if self.type == 'transferencia':
+            if self.transfer_id is None or not self.direction or self.category_id is not None:
+                raise ValidationError({'type': 'Transferências devem ser registradas pela operação de transferência.'})
+            return
+
+        if self.category_id is None:
+            raise ValidationError({'category': 'A categoria é obrigatória.'})
+
+        if self.category.relative_id != self.relative_id or self.category.user_id != self.user_id:
+            raise ValidationError({'category': 'A categoria deve pertencer ao mesmo usuário e perfil.'})
+
+        if self.category.type_category != self.type:
+            raise ValidationError({'category': 'O tipo da categoria deve ser igual ao tipo da transação.'})
+
+    def save(self, *args, **kwargs):
+        """
+        Salva o lançamento e aplica no saldo, no resumo mensal e nos checkpoints de saldo
+        apenas a diferença (delta) via F(), na mesma transação do banco, sem perder
+        atualizações concorrentes.
+        """
+        self.clean()
+        current_balance, current_summary, current_checkpoint = self.get_effects()
+
+        with transaction.atomic():
+            original_balance, original_summary, original_checkpoint = self._lock_original_effects()
+            super().save(*args, **kwargs)
+            apply_balance_deltas(balance_deltas(original_balance, current_balance))
+            apply_summary_deltas(summary_deltas(original_summary, current_summary))
+            apply_checkpoint_deltas(checkpoint_deltas(original_checkpoint, current_checkpoint))
+            invalidate_dashboard(self.relative_id)
+
+    def delete(self, *args, **kwargs):
+        """
+        Previne exclusão física de transações.
+        """
+        raise NotImplementedError("Não é permitido deletar transações. Use soft_delete().")
+
+    def soft_delete(self):
+        """
+        Exclui logicamente o lançamento, revertendo seu efeito no saldo da conta.
+        A linha é relida bloqueada: se outro request já a excluiu, nada é revertido de novo.
+        """
+        with transaction.atomic():
+            self.refresh_from_db(from_queryset=Transaction.objects.select_for_update())
+            if self.is_archived:
+                return
+            self.is_archived = True
+            self.save(update_fields=['is_archived', 'updated_at'])
+
+
+class Transfer(models.Model):
+    """
+    Transferência entre duas contas do mesmo perfil, registrada em partidas dobradas:
+    uma perna de saída na conta de origem e uma de entrada na conta de destino.
+    As duas pernas e os dois deltas de saldo são gravados na mesma transação do banco.
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='transfers',
+        verbose_name='Usuário'
+    )
+    relative = models.ForeignKey(
+        'api.Relative',
+        on_delete=models.CASCADE,
+        related_name='transfers',
+        verbose_name='Parente'
+    )
+    from_account = models.ForeignKey(
+        'api.Account',
+        on_delete=models.CASCADE,
+        related_name='outgoing_transfers',
+        verbose_name='Conta de origem'
+    )
+    to_account = models.ForeignKey(
+        'api.Account',
+        on_delete=models.CASCADE,
+        related_name='incoming_transfers',
+        verbose_name='Conta de destino'
+    )
+    amount = models.DecimalField(max_digits=10, decimal_places=2, verbose_name='Valor')
+    description = models.CharField(max_length=200, blank=True, default='', verbose_name='Descrição')
+    date = models.DateField(verbose_name='Data')
+    is_archived = models.BooleanField(default=False, verbose_name='Excluída')
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'transfer'
+        verbose_name = 'Transferência'
+        verbose_name_plural = 'Transferências'
+        ordering = ['-date', '-id']
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(amount__gt=0),
+                name='transfer_amount_positive'
+            ),
+            models.CheckConstraint(
+                condition=~models.Q(from_account=models.F('to_account')),
+                name='transfer_distinct_accounts'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.from_account_id} -> {self.to_account_id} - {self.amount}"
+
+    @classmethod
+    def create_transfer(cls, user, relative_id, from_account_id, to_account_id, amount, date, description=''):
+        """
+        Cria a transferência e suas duas pernas numa única transação do banco.
+        As contas são bloqueadas em ordem crescente de id antes de qualquer escrita,
+        então transferências concorrentes em sentidos opostos não entram em deadlock.
+        """
+        if amount is None or amount <= 0:
+            raise ValidationError({'amount': 'O valor deve ser maior que zero.'})
+
+        if from_account_id == to_account_id:
+            raise ValidationError({'to_account': 'A conta de destino deve ser diferente da conta de origem.'})
+
+        with transaction.atomic():
+            accounts = lock_accounts([from_account_id, to_account_id])
+            from_account = accounts.get(from_account_id)
+            to_account = accounts.get(to_account_id)
+
+            for field, account in (('from_account', from_account), ('to_account', to_account)):
+                if account is None or account.user_id != user.pk or account.relative_id != relative_id:
+                    raise ValidationError({field: 'A conta deve pertencer ao mesmo usuário e perfil.'})
+                if account.is_archived:
+                    raise ValidationError({field: 'Não é permitido transferir com uma conta arquivada.'})
+
+            transfer = cls.objects.create(
+                user=user,
+                relative_id=relative_id,
+                from_account=from_account,
+                to_account=to_account,
+                amount=amount,
+                date=date,
+                description=description,
+            )
+            # Pernas gravadas também em ordem de id da conta (mesma ordem dos bloqueios)
+            legs = sorted(((from_account, 'saida'), (to_account, 'entrada')), key=lambda leg: leg[0].pk)
+            for account, direction in legs:
+                Transaction(
+                    user=user,
+                    relative_id=relative_id,
+                    account=account,
+                    transfer=transfer,
+                    type='transferencia',
+                    direction=direction,
+                    amount=amount,
+                    date=date,
+                    description=description,
+                ).save()
+
+        return transfer
+
+    def delete(self, *args, **kwargs):
+        """
+        Previne exclusão física de transferências.
+        """
+        raise NotImplementedError("Não é permitido deletar transferências. Use soft_delete().")
+
+    def soft_delete(self):
+        """
+        Exclui logicamente a transferência e suas pernas, revertendo os dois saldos
+        na mesma transação e com a mesma ordem de bloqueio da criação.
+        """
+        with transaction.atomic():
+            lock_accounts([self.from_account_id, self.to_account_id])
+            for leg in self.legs.filter(is_archived=False).order_by('account_id'):
+                leg.soft_delete()
+
+            self.is_archived = True
+            self.save(update_fields=['is_archived', 'updated_at'])
+
+
+class TransactionDeltas:
+    """
+    Acumula os efeitos de vários lançamentos novos (saldo por conta, resumo por chave e
+    checkpoints por conta/mês) para aplicá-los de uma vez: um UPDATE por chave, não por lançamento.
+    A memória usada é proporcional ao número de contas/meses, não de lançamentos.
+    """
+
+    def __init__(self):
+        self.balance = {}
+        self.summary = {}
+        self.checkpoints = {}
+        self.relative_ids = set()
+
+    def add(self, item):
+        balance_effect, summary_entry, checkpoint_entry = item.get_effects()
+        for account_id, delta in balance_deltas(None, balance_effect).items():
+            self.balance[account_id] = self.balance.get(account_id, Decimal('0')) + delta
+        for key, (total, count) in summary_deltas(None, summary_entry).items():
+            current_total, current_count = self.summary.get(key, (0, 0))
+            self.summary[key] = (current_total + total, current_count + count)
+        for key, delta in checkpoint_deltas(None, checkpoint_entry).items():
+            self.checkpoints[key] = self.checkpoints.get(key, Decimal('0')) + delta
+        self.relative_ids.add(item.relative_id)
+
+    def apply(self):
+        apply_balance_deltas({account_id: delta for account_id, delta in self.balance.items() if delta})
+        apply_summary_deltas(self.summary)
+        apply_checkpoint_deltas({key: delta for key, delta in self.checkpoints.items() if delta})
+        for relative_id in self.relative_ids:
+            invalidate_dashboard(relative_id)
+
+
+def bulk_create_transactions(transactions, batch_size=1000):
+    """
+    Cria vários lançamentos com bulk_create, aplicando os deltas de saldo e do resumo
+    mensal já somados por conta/chave.
+    """
+    deltas = TransactionDeltas()
+    for item in transactions:
+        item.clean()
+        deltas.add(item)
+
+    with transaction.atomic():
+        # Contas bloqueadas antes das escritas, em ordem de id, como em Transfer.create_transfer
+        lock_accounts(deltas.balance)
+        created = Transaction.objects.bulk_create(transactions, batch_size=batch_size)
+        deltas.apply()
+
+    return created
+
+
+def lock_accounts(account_ids):
+    """
+    Bloqueia as linhas das contas (SELECT ... FOR UPDATE) sempre em ordem crescente de id.
+    Retorna {account_id: Account}.
+    """
+    from backend.api.accounts.models import Account
+
+    accounts = Account.objects.select_for_update().filter(pk__in=set(account_ids)).order_by('pk')
+    return {account.pk: account for account in accounts}
+
+
+def balance_deltas(original, current):
+    """
+    Combina o efeito anterior e o atual em {account_id: delta}, descartando deltas nulos.
+    """
+    deltas = {}
+    if original is not None:
+        account_id, delta = original
+        deltas[account_id] = deltas.get(account_id, Decimal('0')) - delta
+
+    account_id, delta = current
+    deltas[account_id] = deltas.get(account_id, Decimal('0')) + delta
+
+    return {account_id: delta for account_id, delta in deltas.items() if delta}
+
+
+def apply_balance_deltas(deltas):
+    """
+    Aplica os deltas com um UPDATE atômico por conta (balance = balance + delta).
+    As contas são atualizadas em ordem crescente de id para evitar deadlocks entre
+    transações concorrentes que tocam as mesmas contas.
+    """
+    from backend.api.accounts.models import Account
+
+    for account_id in sorted(deltas):
+        Account.objects.filter(pk=account_id).update(
+            balance=F('balance') + deltas[account_id],
+            updated_at=Now()
+        )
@@ -0,0 +1,289 @@
+"""
+Armazenamento do livro de lançamentos (tabela transaction) no PostgreSQL.
+
+Lançamentos são quase sempre inseridos com datas recentes e consultados por período, então a
+ordem física da tabela acompanha a data. Dois layouts são suportados:
+
+- BRIN (padrão): índice BRIN em date, poucas páginas para cobrir a tabela inteira, usado nas
+  varreduras por período que não passam pelos índices B-tree por perfil/conta.
+- Particionado (TRANSACTION_PARTITIONING=True): particionamento nativo por intervalo de date,
+  uma partição por mês (transaction_pAAAA_MM) e uma partição padrão para datas sem partição.
+  Consultas por período leem apenas as partições do intervalo.
+
+No layout particionado o PostgreSQL exige a chave de partição em restrições únicas da tabela pai,
+então a chave primária passa a ser (id, date). As garantias globais do model (id único, ocorrência
+de recorrência única e identificador externo único por conta) ficam na tabela não particionada
+transaction_unique_key, mantida por trigger: uma linha por lançamento, com chave primária no id e
+índices únicos com os mesmos nomes das restrições do model. Cada lançamento custa uma escrita a
+mais nessa tabela. Os índices únicos por partição continuam servindo às buscas.
+
+As partições futuras são criadas com antecedência pelo comando create_transaction_partitions.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection as default_connection, transaction
+from django.utils import timezone
+
+from backend.api.balances.models import month_end, month_start
+
+LEDGER_TABLE = 'transaction'
+BRIN_INDEX_NAME = 'transaction_date_brin_idx'
+# Páginas por faixa do BRIN: faixas menores descartam mais páginas em períodos curtos
+BRIN_PAGES_PER_RANGE = 32
+
+# Índices únicos de cada partição, equivalentes às restrições únicas parciais do model
+PARTITION_UNIQUE_INDEXES = {
+    'recurring_uniq': '(recurring_entry_id, recurrence_date) WHERE recurring_entry_id IS NOT NULL',
+    'external_id_uniq': "(account_id, external_id) WHERE external_id <> ''",
+}
+
+# Unicidade global no layout particionado (nomes das restrições de Transaction.Meta.constraints)
+UNIQUE_KEY_TABLE = 'transaction_unique_key'
+UNIQUE_KEY_FUNCTION = 'transaction_unique_key_sync'
+UNIQUE_KEY_COLUMNS = 'id, recurring_entry_id, recurrence_date, account_id, external_id'
+UNIQUE_KEY_INDEXES = {
+    'transaction_unique_recurring_date':
+        '(recurring_entry_id, recurrence_date) WHERE recurring_entry_id IS NOT NULL',
+    'transaction_unique_external_id': "(account_id, external_id) WHERE external_id <> ''",
+}
+
+
+def next_month(month):
+    return month_end(month) + timedelta(days=1)
+
+
+def add_months(month, count):
+    for _ in range(count):
+        month = next_month(month)
+    return month
+
+
+def iter_months(first, last):
+    month = month_start(first)
+    while month <= last:
+        yield month
+        month = next_month(month)
+
+
+def partition_name(month, table=LEDGER_TABLE):
+    return f'{table}_p{month:%Y_%m}'
+
+
+def default_partition_name(table=LEDGER_TABLE):
+    return f'{table}_default'
+
+
+def unique_index_statements(partition, unique_indexes):
+    return [
+        f'CREATE UNIQUE INDEX IF NOT EXISTS {partition}_{suffix} ON {partition} {definition}'
+        for suffix, definition in unique_indexes.items()
+    ]
+
+
+def partition_statements(month, table=LEDGER_TABLE, unique_indexes=PARTITION_UNIQUE_INDEXES,
+                         unique_key_table=UNIQUE_KEY_TABLE):
+    """
+    SQL que cria a partição do mês. A tabela é criada fora da tabela pai, recebe as linhas do mês
+    que estavam na partição padrão e só então é anexada: criar a partição diretamente falharia se
+    a partição padrão já tivesse linhas do intervalo. O DELETE na partição padrão dispara o trigger
+    de unicidade, então as chaves das linhas movidas são gravadas de novo em unique_key_table.
+    """
+    partition = partition_name(month, table)
+    start, end = month_start(month).isoformat(), next_month(month).isoformat()
+    statements = [
+        f'CREATE TABLE {partition} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+        f'WITH moved AS (DELETE FROM {default_partition_name(table)} '
+        f"WHERE date >= '{start}' AND date < '{end}' RETURNING *) "
+        f'INSERT INTO {partition} SELECT * FROM moved',
+        f"ALTER TABLE {table} ATTACH PARTITION {partition} FOR VALUES FROM ('{start}') TO ('{end}')",
+        *unique_index_statements(partition, unique_indexes),
+    ]
+    if unique_key_table:
+        statements.append(
+            f'INSERT INTO {unique_key_table} ({UNIQUE_KEY_COLUMNS}) SELECT {UNIQUE_KEY_COLUMNS} FROM {partition}')
+    return statements
+
+
+def unique_key_statements(table=LEDGER_TABLE):
+    """
+    SQL da tabela de unicidade global do layout particionado e do trigger que a mantém.
+    Violações levantam IntegrityError com o nome da restrição do model, como na tabela simples.
+    Mudanças de partição (UPDATE de date) chegam ao trigger como DELETE seguido de INSERT.
+    """
+    key_columns = [column.strip() for column in UNIQUE_KEY_COLUMNS.split(',')]
+    new_values = ', '.join(f'NEW.{column}' for column in key_columns)
+    old_values = ', '.join(f'OLD.{column}' for column in key_columns)
+    assignments = ', '.join(f'{column} = NEW.{column}' for column in key_columns)
+    return [
+        f'CREATE TABLE IF NOT EXISTS {UNIQUE_KEY_TABLE} (id bigint PRIMARY KEY, recurring_entry_id bigint, '
+        'recurrence_date date, account_id bigint NOT NULL, external_id varchar(255) NOT NULL)',
+        *[
+            f'CREATE UNIQUE INDEX IF NOT EXISTS {name} ON {UNIQUE_KEY_TABLE} {definition}'
+            for name, definition in UNIQUE_KEY_INDEXES.items()
+        ],
+        f'CREATE OR REPLACE FUNCTION {UNIQUE_KEY_FUNCTION}() RETURNS trigger AS $$ BEGIN '
+        f"IF TG_OP = 'DELETE' THEN DELETE FROM {UNIQUE_KEY_TABLE} WHERE id = OLD.id; "
+        f"ELSIF TG_OP = 'INSERT' THEN INSERT INTO {UNIQUE_KEY_TABLE} ({UNIQUE_KEY_COLUMNS}) VALUES ({new_values}); "
+        f'ELSIF ({new_values}) IS DISTINCT FROM ({old_values}) THEN '
+        f'UPDATE {UNIQUE_KEY_TABLE} SET {assignments} WHERE id = OLD.id; '
+        'END IF; RETURN NULL; END $$ LANGUAGE plpgsql',
+        f'DROP TRIGGER IF EXISTS {UNIQUE_KEY_FUNCTION} ON {table}',
+        f'CREATE TRIGGER {UNIQUE_KEY_FUNCTION} AFTER INSERT OR DELETE OR UPDATE OF {UNIQUE_KEY_COLUMNS} '
+        f'ON {table} FOR EACH ROW EXECUTE FUNCTION {UNIQUE_KEY_FUNCTION}()',
+    ]
+
+
+def ensure_unique_keys(connection=default_connection):
+    """
+    Cria (ou completa) a tabela de unicidade global de uma tabela já particionada, preenchendo as
+    chaves dos lançamentos existentes. Falha com IntegrityError se já houver duplicados.
+    """
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        for statement in unique_key_statements():
+            cursor.execute(statement)
+        cursor.execute(
+            f'INSERT INTO {UNIQUE_KEY_TABLE} ({UNIQUE_KEY_COLUMNS}) SELECT {UNIQUE_KEY_COLUMNS} '
+            f'FROM {LEDGER_TABLE} ON CONFLICT (id) DO NOTHING')
+
+
+def is_partitioned(table=LEDGER_TABLE, connection=default_connection):
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s))', [table])
+        return cursor.fetchone()[0]
+
+
+def existing_partitions(table=LEDGER_TABLE, connection=default_connection):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT child.relname FROM pg_inherits '
+            'JOIN pg_class child ON child.oid = pg_inherits.inhrelid '
+            'WHERE pg_inherits.inhparent = to_regclass(%s)', [table])
+        return {row[0] for row in cursor.fetchall()}
+
+
+def ensure_partitions(first_month, last_month, table=LEDGER_TABLE, unique_indexes=PARTITION_UNIQUE_INDEXES,
+                      unique_key_table=UNIQUE_KEY_TABLE, connection=default_connection):
+    """
+    Cria as partições mensais que faltam entre first_month e last_month. Retorna os nomes criados.
+    """
+    existing = existing_partitions(table, connection)
+    created = []
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        for month in iter_months(first_month, last_month):
+            if partition_name(month, table) in existing:
+                continue
+            for statement in partition_statements(month, table, unique_indexes, unique_key_table):
+                cursor.execute(statement)
+            created.append(partition_name(month, table))
+    return created
+
+
+def ensure_future_partitions(months_ahead=None, connection=default_connection):
+    """
+    Garante as partições do mês atual e dos próximos months_ahead meses.
+    """
+    if months_ahead is None:
+        months_ahead = settings.TRANSACTION_PARTITIONS_AHEAD
+    current = month_start(timezone.localdate())
+    return ensure_partitions(current, add_months(current, months_ahead), connection=connection)
+
+
+def create_brin_index(table=LEDGER_TABLE, connection=default_connection):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'CREATE INDEX IF NOT EXISTS {BRIN_INDEX_NAME} ON {table} USING brin (date) '
+            f'WITH (pages_per_range = {BRIN_PAGES_PER_RANGE}, autosummarize = on)'
+        )
+
+
+def drop_brin_index(connection=default_connection):
+    with connection.cursor() as cursor:
+        cursor.execute(f'DROP INDEX IF EXISTS {BRIN_INDEX_NAME}')
+
+
+def convert_to_partitioned(months_ahead=None, connection=default_connection):
+    """
+    Converte a tabela de lançamentos em tabela particionada por mês, copiando as linhas.
+    Bloqueia a tabela durante a cópia: executar em janela de manutenção.
+    Índices, chaves estrangeiras e triggers são recriados a partir das definições da tabela original;
+    as restrições únicas passam para a tabela de unicidade global, preenchida pela própria cópia.
+    """
+    if months_ahead is None:
+        months_ahead = settings.TRANSACTION_PARTITIONS_AHEAD
+    legacy = f'{LEDGER_TABLE}_legacy'
+
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        cursor.execute('SELECT COUNT(*) FROM pg_constraint WHERE contype = %s AND confrelid = to_regclass(%s)',
+                       ['f', LEDGER_TABLE])
+        if cursor.fetchone()[0]:
+            raise ValueError('Outras tabelas referenciam os lançamentos; não é possível particionar.')
+
+        # Índices não únicos (exceto o BRIN, dispensável com partições) e chaves estrangeiras
+        cursor.execute(
+            'SELECT pg_get_indexdef(indexrelid) FROM pg_index '
+            'JOIN pg_class ON pg_class.oid = pg_index.indexrelid '
+            'WHERE indrelid = to_regclass(%s) AND NOT indisunique AND relname <> %s',
+            [LEDGER_TABLE, BRIN_INDEX_NAME])
+        index_definitions = [row[0] for row in cursor.fetchall()]
+        cursor.execute(
+            'SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint '
+            'WHERE contype = %s AND conrelid = to_regclass(%s)', ['f', LEDGER_TABLE])
+        foreign_keys = cursor.fetchall()
+        cursor.execute('SELECT pg_get_triggerdef(oid) FROM pg_trigger WHERE tgrelid = to_regclass(%s) '
+                       'AND NOT tgisinternal', [LEDGER_TABLE])
+        trigger_definitions = [row[0] for row in cursor.fetchall()]
+        cursor.execute(f'SELECT MIN(date), MAX(id) FROM {LEDGER_TABLE}')
+        first_date, last_id = cursor.fetchone()
+
+        cursor.execute(f'ALTER TABLE {LEDGER_TABLE} RENAME TO {legacy}')
+        cursor.execute(
+            f'CREATE TABLE {LEDGER_TABLE} (LIKE {legacy} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+            f'PARTITION BY RANGE (date)')
+        default = default_partition_name()
+        cursor.execute(f'CREATE TABLE {default} PARTITION OF {LEDGER_TABLE} DEFAULT')
+        for statement in unique_index_statements(default, PARTITION_UNIQUE_INDEXES):
+            cursor.execute(statement)
+        # Os índices únicos do model passam da tabela original para a tabela de unicidade global,
+        # preenchida pelo trigger durante a cópia das linhas
+        cursor.execute('DROP INDEX IF EXISTS ' + ', '.join(UNIQUE_KEY_INDEXES))
+        for statement in unique_key_statements():
+            cursor.execute(statement)
+
+        current = month_start(timezone.localdate())
+        ensure_partitions(min(first_date or current, current), add_months(current, months_ahead),
+                          connection=connection)
+
+        cursor.execute(f'INSERT INTO {LEDGER_TABLE} SELECT * FROM {legacy}')
+        # Remove a tabela original (e a sequência da coluna identity) antes de reusar os nomes
+        cursor.execute(f'DROP TABLE {legacy}')
+
+        cursor.execute(f'ALTER TABLE {LEDGER_TABLE} ADD CONSTRAINT {LEDGER_TABLE}_pkey PRIMARY KEY (id, date)')
+        for definition in index_definitions:
+            cursor.execute(definition)
+        for name, definition in foreign_keys:
+            cursor.execute(f'ALTER TABLE {LEDGER_TABLE} ADD CONSTRAINT {name} {definition}')
+        for definition in trigger_definitions:
+            cursor.execute(definition)
+
+        sequence = f'{LEDGER_TABLE}_id_seq'
+        cursor.execute(f'CREATE SEQUENCE {sequence} OWNED BY {LEDGER_TABLE}.id')
+        cursor.execute('SELECT setval(%s, %s, %s)', [sequence, last_id or 1, last_id is not None])
+        cursor.execute(f"ALTER TABLE {LEDGER_TABLE} ALTER COLUMN id SET DEFAULT nextval('{sequence}')")
+        cursor.execute(f'ANALYZE {LEDGER_TABLE}')
+
+
+def setup_ledger_storage(connection=default_connection):
+    """
+    Aplica o layout configurado (chamado pela migration): particiona a tabela quando
+    TRANSACTION_PARTITIONING está ativo; caso contrário, cria o índice BRIN em date.
+    """
+    if connection.vendor != 'postgresql':
+        return
+    if not settings.TRANSACTION_PARTITIONING:
+        create_brin_index(connection=connection)
+    elif not is_partitioned(connection=connection):
+        convert_to_partitioned(connection=connection)
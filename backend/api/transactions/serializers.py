@@ -0,0 +1,170 @@
+import codecs
+from decimal import Decimal
+
+from rest_framework import serializers
+
+from backend.api.accounts.models import Account
+from backend.api.categories.models import Category
+
+from backend.api.core.mixins.relative_scope import (RelativeScopedSerializerMixin,
+                                                   resolve_relative_id)
+from backend.api.core.mixins.unique_constraint import field_errors_from_model
+
+from .models import Transaction, Transfer
+
+
+def validate_account_and_category(user_id, relative_id, account, category, type_, account_changed=True):
+    """
+    Valida que conta e categoria pertencem ao usuário e perfil e que o tipo da
+    categoria corresponde ao tipo do lançamento. Conta arquivada só é aceita se não mudou.
+    """
+    if account and (account.user_id != user_id
+                    or (relative_id is not None and account.relative_id != relative_id)):
+        raise serializers.ValidationError(
+            {'account': 'A conta deve pertencer ao mesmo usuário e perfil.'})
+
+    if account and account.is_archived and account_changed:
+        raise serializers.ValidationError(
+            {'account': 'Não é permitido lançar em uma conta arquivada.'})
+
+    if category and (category.user_id != user_id
+                     or (relative_id is not None and category.relative_id != relative_id)):
+        raise serializers.ValidationError(
+            {'category': 'A categoria deve pertencer ao mesmo usuário e perfil.'})
+
+    if category and type_ and category.type_category != type_:
+        raise serializers.ValidationError(
+            {'category': 'O tipo da categoria deve ser igual ao tipo da transação.'})
+
+
+class TransactionSerializer(RelativeScopedSerializerMixin, serializers.ModelSerializer):
+    # Saldo da conta logo após o lançamento; calculado pela view (listagem e detalhe)
+    running_balance = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Transaction
+        exclude = ['search_vector']
+        # Definidos automaticamente
+        read_only_fields = ['user', 'relative', 'is_archived', 'transfer', 'direction',
+                            'recurring_entry', 'recurrence_date', 'external_id']
+
+    def get_running_balance(self, obj):
+        value = self.context.get('running_balances', {}).get(obj.pk)
+        return None if value is None else str(value.quantize(Decimal('0.01')))
+
+    def validate_amount(self, value):
+        if value <= 0:
+            raise serializers.ValidationError("O valor deve ser maior que zero.")
+        return value
+
+    def validate(self, attrs):
+        """
+        Valida que conta e categoria pertencem ao usuário e perfil do lançamento
+        e que o tipo da categoria corresponde ao tipo do lançamento.
+        """
+        if self.instance and self.instance.transfer_id:
+            raise serializers.ValidationError(
+                "Lançamentos de transferência não podem ser editados. Exclua a transferência e crie outra.")
+
+        request = self.context['request']
+        if self.instance:
+            relative_id = self.instance.relative_id
+        else:
+            relative_id = resolve_relative_id(request)
+
+        account = attrs.get('account') or (self.instance.account if self.instance else None)
+        category = attrs.get('category') or (self.instance.category if self.instance else None)
+        type_ = attrs.get('type') or (self.instance.type if self.instance else None)
+
+        if type_ == 'transferencia':
+            raise serializers.ValidationError(
+                {'type': 'Use o endpoint de transferências para transferir entre contas.'})
+
+        if category is None:
+            raise serializers.ValidationError({'category': 'Este campo é obrigatório.'})
+
+        validate_account_and_category(
+            request.user.pk, relative_id, account, category, type_, account_changed='account' in attrs)
+
+        return attrs
+
+    def create(self, validated_data):
+        """
+        Cria um novo lançamento associando automaticamente ao usuário logado e relative do header.
+        """
+        validated_data['user'] = self.context['request'].user
+
+        # Perfil do header já resolvido e autorizado para este request
+        validated_data['relative_id'] = self.get_request_relative_id()
+
+        return super().create(validated_data)
+
+
+class TransferSerializer(RelativeScopedSerializerMixin, serializers.ModelSerializer):
+    class Meta:
+        model = Transfer
+        fields = '__all__'
+        read_only_fields = ['user', 'relative', 'is_archived']  # Definidos automaticamente
+
+    def validate_amount(self, value):
+        if value <= 0:
+            raise serializers.ValidationError("O valor deve ser maior que zero.")
+        return value
+
+    def validate(self, attrs):
+        if attrs['from_account'] == attrs['to_account']:
+            raise serializers.ValidationError(
+                {'to_account': 'A conta de destino deve ser diferente da conta de origem.'})
+        return attrs
+
+    def create(self, validated_data):
+        """
+        Cria a transferência e suas duas pernas de forma atômica no perfil do header.
+        """
+        with field_errors_from_model():
+            return Transfer.create_transfer(
+                user=self.context['request'].user,
+                relative_id=self.get_request_relative_id(),
+                from_account_id=validated_data['from_account'].pk,
+                to_account_id=validated_data['to_account'].pk,
+                amount=validated_data['amount'],
+                date=validated_data['date'],
+                description=validated_data.get('description', ''),
+            )
+
+
+class TransactionImportSerializer(serializers.Serializer):
+    """
+    Parâmetros da importação de extrato (multipart): arquivo, conta padrão e
+    categorias padrão por tipo (usadas quando a linha não informa uma categoria válida).
+    """
+    FORMATS = ['csv', 'ofx']
+
+    file = serializers.FileField()
+    format = serializers.ChoiceField(choices=FORMATS, required=False)
+    encoding = serializers.CharField(required=False, default='utf-8-sig')
+    account = serializers.PrimaryKeyRelatedField(queryset=Account.objects.all())
+    expense_category = serializers.PrimaryKeyRelatedField(queryset=Category.objects.all(), required=False)
+    income_category = serializers.PrimaryKeyRelatedField(queryset=Category.objects.all(), required=False)
+
+    def validate_encoding(self, value):
+        try:
+            codecs.lookup(value)
+        except LookupError:
+            raise serializers.ValidationError("Codificação inválida.")
+        return value
+
+    def validate(self, attrs):
+        user_id = self.context['request'].user.pk
+        relative_id = self.context['relative_id']
+
+        validate_account_and_category(user_id, relative_id, attrs['account'], attrs.get('expense_category'), 'despesas')
+        validate_account_and_category(user_id, relative_id, None, attrs.get('income_category'), 'receitas')
+
+        if 'format' not in attrs:
+            extension = attrs['file'].name.rsplit('.', 1)[-1].lower()
+            if extension not in self.FORMATS:
+                raise serializers.ValidationError({'format': 'Informe o formato do arquivo (csv ou ofx).'})
+            attrs['format'] = extension
+
+        return attrs
@@ -0,0 +1,12 @@
+from django.urls import include, path
+from rest_framework.routers import DefaultRouter
+
+from .views import TransactionViewSet, TransferViewSet
+
+router = DefaultRouter()
+router.register(r'transactions', TransactionViewSet)
+router.register(r'transfers', TransferViewSet)
+
+urlpatterns = [
+    path('', include(router.urls)),
+]
@@ -0,0 +1,242 @@
+import io
+from datetime import datetime
+
+from django.utils.dateparse import parse_date
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from backend.api.balances.history import running_balances
+from backend.api.core.mixins.export import StreamingExportMixin
+from backend.api.core.mixins.relative_scope import RelativeScopedViewSetMixin
+from backend.api.core.pagination.keyset import KeysetPagination
+from backend.api.core.search.fulltext import filter_full_text_search
+
+from .importers import TransactionImporter, parse_csv, parse_ofx
+from .models import Transaction, Transfer
+from .serializers import TransactionImportSerializer, TransactionSerializer, TransferSerializer
+
+
+class TransactionPagination(KeysetPagination):
+    """
+    Lançamentos são listados do mais recente para o mais antigo.
+    """
+    keyset_ordering = ('-date', '-id')
+
+
+class TransactionSearchPagination(PageNumberPagination):
+    """
+    Resultados da busca seguem a relevância, então a paginação é por página (sem cursor).
+    """
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class TransactionViewSet(RelativeScopedViewSetMixin, StreamingExportMixin, viewsets.ModelViewSet):
+    """
+    ViewSet para operações CRUD da entidade Transaction.
+    Cada criação, edição e exclusão ajusta o saldo da conta de forma incremental.
+    """
+    queryset = Transaction.objects.all()
+    serializer_class = TransactionSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = TransactionPagination
+    export_fields = ('id', 'relative_id', 'date', 'type', 'direction', 'amount', 'description',
+                     'account_id', 'account__name', 'category_id', 'category__full_name',
+                     'transfer_id', 'external_id', 'is_archived', 'created_at', 'updated_at')
+    export_filename = 'lancamentos'
+
+    def get_queryset(self):
+        """
+        Filtros do GET:
+        Mostra apenas lançamentos do usuário autenticado
+        Se X-Relative-Id no header, filtra por perfil específico
+        Filtros opcionais: account, category, type, start_date, end_date, month (AAAA-MM)
+        Por padrão, mostra apenas lançamentos não excluídos
+        """
+        queryset = Transaction.objects.filter(user=self.request.user)
+
+        # Filtro por perfil se X-Relative-Id estiver presente no header
+        queryset = self.filter_by_relative(queryset)
+
+        # Listagem, exportação e busca aceitam os mesmos filtros
+        if self.action in ('list', 'export', 'search'):
+            only_archived = self.request.query_params.get('only_archived', 'false')
+            queryset = queryset.filter(is_archived=only_archived.lower() == 'true')
+
+            queryset = queryset.filter(**self.get_list_filters())
+
+        return queryset.order_by('-date', '-id')
+
+    def get_list_filters(self):
+        """
+        Converte os parâmetros de filtro da listagem, rejeitando valores inválidos.
+        """
+        params = self.request.query_params
+        filters = {}
+
+        for param, lookup in (('account', 'account_id'), ('category', 'category_id')):
+            value = params.get(param)
+            if value:
+                if not value.isdigit():
+                    raise ValidationError({param: 'Informe um ID numérico.'})
+                filters[lookup] = int(value)
+
+        for param, lookup in (('start_date', 'date__gte'), ('end_date', 'date__lte')):
+            value = params.get(param)
+            if value:
+                try:
+                    parsed = parse_date(value)
+                except ValueError:
+                    parsed = None
+                if parsed is None:
+                    raise ValidationError({param: 'Data inválida. Use o formato AAAA-MM-DD.'})
+                filters[lookup] = parsed
+
+        # Mês local pela coluna month (índice por perfil e mês), sem conversão de data na consulta
+        month = params.get('month')
+        if month:
+            try:
+                filters['month'] = datetime.strptime(month, '%Y-%m').date()
+            except ValueError:
+                raise ValidationError({'month': 'Mês inválido. Use o formato AAAA-MM.'})
+
+        type_ = params.get('type')
+        if type_:
+            if type_ not in dict(Transaction.TRANSACTION_TYPES):
+                raise ValidationError({'type': 'Tipo de transação inválido.'})
+            filters['type'] = type_
+
+        return filters
+
+    def list(self, request, *args, **kwargs):
+        """
+        Listagem paginada com o saldo acumulado (running_balance) de cada lançamento,
+        calculado para a página com uma consulta de janela (Window) no banco.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        items = page if page is not None else list(queryset)
+
+        context = {**self.get_serializer_context(), 'running_balances': running_balances(items)}
+        serializer = self.get_serializer(items, many=True, context=context)
+        if page is not None:
+            return self.get_paginated_response(serializer.data)
+        return Response(serializer.data)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        context = {**self.get_serializer_context(), 'running_balances': running_balances([instance])}
+        return Response(self.get_serializer(instance, context=context).data)
+
+    @action(detail=False, methods=['get'])
+    def search(self, request):
+        """
+        Busca textual na descrição (?q=mercado), em português e sem diferenciar acentos,
+        ordenada por relevância e depois pelos mais recentes. Aceita os filtros da listagem
+        (período, mês, conta, categoria e tipo), aplicados na mesma consulta.
+        """
+        term = request.query_params.get('q', '').strip()
+        if not term:
+            raise ValidationError({'q': 'Informe o texto da busca.'})
+
+        queryset = filter_full_text_search(self.get_queryset(), term).defer('search_vector')
+        queryset = queryset.order_by('-search_rank', '-date', '-id')
+        paginator = TransactionSearchPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+
+        context = {**self.get_serializer_context(), 'running_balances': running_balances(page)}
+        serializer = self.get_serializer(page, many=True, context=context)
+        return paginator.get_paginated_response(serializer.data)
+
+    def perform_create(self, serializer):
+        """
+        Associa o lançamento ao usuário autenticado durante a criação.
+        """
+        serializer.save(user=self.request.user)
+
+    @action(detail=False, methods=['post'], url_path='import', parser_classes=[MultiPartParser])
+    def import_file(self, request):
+        """
+        Importa um extrato CSV ou OFX (multipart: file, account, expense_category,
+        income_category, format e encoding opcionais) no perfil do header.
+        O arquivo é lido como stream, em lotes, sem carregar o conteúdo inteiro em memória.
+        """
+        relative_id = self.require_relative_id()
+        serializer = TransactionImportSerializer(
+            data=request.data, context={'request': request, 'relative_id': relative_id})
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        stream = io.TextIOWrapper(data['file'].file, encoding=data['encoding'], errors='replace', newline='')
+        rows = parse_csv(stream) if data['format'] == 'csv' else parse_ofx(stream)
+
+        result = TransactionImporter(
+            request.user,
+            relative_id,
+            data['account'],
+            expense_category=data.get('expense_category'),
+            income_category=data.get('income_category'),
+        ).run(rows)
+
+        return Response(result, status=status.HTTP_201_CREATED if result['created'] else status.HTTP_200_OK)
+
+    def destroy(self, request, *args, **kwargs):
+        """
+        Sobrescreve o método destroy para implementar soft delete.
+        Exclui logicamente o lançamento e reverte seu efeito no saldo da conta.
+        """
+        transaction = self.get_object()
+        if transaction.transfer_id:
+            raise ValidationError(
+                {'detail': 'Lançamentos de transferência devem ser excluídos pela transferência.'})
+        if not transaction.is_archived:
+            transaction.soft_delete()
+
+        return Response(
+            {"detail": "Transação excluída com sucesso."},
+            status=status.HTTP_200_OK
+        )
+
+
+class TransferViewSet(RelativeScopedViewSetMixin, viewsets.ModelViewSet):
+    """
+    ViewSet de transferências entre contas.
+    Transferências não são editáveis: para corrigir, exclua e crie outra.
+    """
+    queryset = Transfer.objects.all()
+    serializer_class = TransferSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = TransactionPagination
+    http_method_names = ['get', 'post', 'delete', 'head', 'options']
+
+    def get_queryset(self):
+        """
+        Mostra apenas transferências do usuário autenticado (e do perfil do header, se presente).
+        Por padrão, mostra apenas transferências não excluídas.
+        """
+        queryset = Transfer.objects.filter(user=self.request.user)
+        queryset = self.filter_by_relative(queryset)
+
+        if self.action == 'list':
+            only_archived = self.request.query_params.get('only_archived', 'false')
+            queryset = queryset.filter(is_archived=only_archived.lower() == 'true')
+
+        return queryset.order_by('-date', '-id')
+
+    def destroy(self, request, *args, **kwargs):
+        """
+        Exclui logicamente a transferência, revertendo os saldos das duas contas.
+        """
+        transfer = self.get_object()
+        if not transfer.is_archived:
+            transfer.soft_delete()
+
+        return Response(
+            {"detail": "Transferência excluída com sucesso."},
+            status=status.HTTP_200_OK
+        )
@@ -8,4 +8,9 @@ urlpatterns = [
     path('', include('backend.api.accounts.urls')),
     path('', include('backend.api.categories.urls')),
     path('', include('backend.api.relatives.urls')),
+    path('', include('backend.api.transactions.urls')),
+    path('', include('backend.api.recurring.urls')),
+    path('', include('backend.api.credit_cards.urls')),
+    path('', include('backend.api.dashboard.urls')),
+    path('', include('backend.api.family.urls')),
 ]
@@ -0,0 +1,56 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+# Versão por usuário: trocar a versão descarta de uma vez todas as entradas do usuário
+AUTH_USER_VERSION_KEY = 'users:auth:version:{user_id}'
+AUTH_USER_KEY = 'users:auth:{user_id}:{version}:{jti}'
+
+# Limite (segundos) do cache de autenticação quando o cache não é compartilhado entre os workers
+LOCAL_AUTH_USER_CACHE_TIMEOUT = 5
+
+
+def get_auth_cache_timeout():
+    """
+    TTL do usuário em cache. Sem cache compartilhado a invalidação (usuário desativado, senha
+    trocada) vale só para o worker atual: os demais dependem do TTL, então ele é limitado.
+    """
+    if settings.CACHE_IS_SHARED:
+        return settings.AUTH_USER_CACHE_TIMEOUT
+    return min(settings.AUTH_USER_CACHE_TIMEOUT, LOCAL_AUTH_USER_CACHE_TIMEOUT)
+
+
+def _get_version(user_id):
+    """
+    Retorna a versão atual do cache de autenticação do usuário, criando-a se necessário.
+    """
+    key = AUTH_USER_VERSION_KEY.format(user_id=user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def get_cached_auth_user(user_id, jti):
+    """
+    Retorna o usuário autenticado em cache para o par (user_id, jti), ou None.
+    """
+    key = AUTH_USER_KEY.format(user_id=user_id, version=_get_version(user_id), jti=jti)
+    return cache.get(key)
+
+
+def set_cached_auth_user(user_id, jti, user):
+    """
+    Guarda o usuário autenticado em cache por um curto período (get_auth_cache_timeout).
+    """
+    key = AUTH_USER_KEY.format(user_id=user_id, version=_get_version(user_id), jti=jti)
+    cache.set(key, user, timeout=get_auth_cache_timeout())
+
+
+def invalidate_auth_user(user_id):
+    """
+    Descarta todas as entradas de autenticação em cache do usuário.
+    """
+    cache.set(AUTH_USER_VERSION_KEY.format(user_id=user_id), time.time_ns(), timeout=None)
@@ -2,8 +2,11 @@ from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.core.exceptions import ValidationError
 from django.db import models
 
+from backend.api.core.mixins.unique_constraint import UniqueConstraintMixin
 from backend.api.utils.validators import validate_cpf
 
+from .cache import invalidate_auth_user
+
 
 class UserManager(BaseUserManager):
     """
@@ -41,7 +44,7 @@ class UserManager(BaseUserManager):
         return self.create_user(email, password, **extra_fields)
 
 
-class User(AbstractUser):
+class User(UniqueConstraintMixin, AbstractUser):
     """
     Modelo de usuário customizado para o sistema Orfin.
     Extende o AbstractUser do Django com campos específicos.
@@ -69,6 +72,12 @@ class User(AbstractUser):
     # Manager customizado
     objects = UserManager()  # type: ignore
 
+    # Mensagens para violações de unicidade detectadas pelo banco ao salvar
+    unique_error_messages = {
+        ('cpf',): {'cpf': 'Este CPF já está registrado.'},
+        ('email',): {'email': 'Este email já está registrado.'},
+    }
+
     class Meta:
         db_table = 'auth_user_custom'
         verbose_name = 'Usuário'
@@ -110,9 +119,11 @@ class User(AbstractUser):
     def save(self, *args, **kwargs):
         """
         Sobrescreve o método save para incluir validação.
+        Descarta o usuário do cache de autenticação JWT.
         """
         self.clean()
         super().save(*args, **kwargs)
+        invalidate_auth_user(self.pk)
 
     def delete(self, using=None, keep_parents=False):
         """
@@ -0,0 +1,271 @@
+"""
+Portabilidade de dados (LGPD): exportação completa dos dados de um usuário e restauração.
+
+O arquivo é um JSON Lines compactado com gzip: a primeira linha é o cabeçalho (formato,
+versão e dados do usuário) e cada linha seguinte é um registro {"model": ..., "data": ...},
+na ordem de dependência de ARCHIVE_MODELS. A exportação lê cada tabela com iterator() e
+comprime em blocos; a restauração lê o arquivo linha a linha e grava com bulk_create em lotes,
+remapeando as chaves estrangeiras para os novos ids. Nada é carregado inteiro em memória
+(apenas os mapas de ids dos models referenciados por outros).
+"""
+import json
+from collections import defaultdict
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+from backend.api.accounts.models import Account
+from backend.api.balances.models import BalanceCheckpoint
+from backend.api.categories.models import Category
+from backend.api.core.export.streaming import gzip_chunks, iter_rows
+from backend.api.credit_cards.models import CreditCard, CreditCardExpense, CreditCardInstallment
+from backend.api.recurring.models import RecurringEntry
+from backend.api.relatives.models import Relative
+from backend.api.summaries.models import MonthlySummary
+from backend.api.transactions.models import Transaction, Transfer
+
+from .models import User
+
+ARCHIVE_FORMAT = 'orfin-user-archive'
+ARCHIVE_VERSION = 1
+
+RESTORE_BATCH_SIZE = 1000
+
+USER_FIELDS = ('email', 'first_name', 'last_name', 'social_name', 'cpf', 'phone')
+
+# Ordem de dependência: cada model só referencia models anteriores (ou a si mesmo)
+ARCHIVE_MODELS = (
+    Relative,
+    Account,
+    Category,
+    Transfer,
+    RecurringEntry,
+    Transaction,
+    CreditCard,
+    CreditCardExpense,
+    CreditCardInstallment,
+)
+
+# Resumo mensal e checkpoints de saldo são derivados dos lançamentos: não são exportados,
+# são reconstruídos na restauração
+
+# Colunas mantidas pelo banco (trigger da busca textual): recalculadas ao gravar
+DERIVED_FIELDS = {'search_vector'}
+
+
+def get_archive_fields(model):
+    """
+    Campos exportados do model: todos os campos concretos, exceto o dono (user) e os derivados.
+    """
+    return [field for field in model._meta.concrete_fields
+            if not (field.is_relation and field.related_model is User) and field.name not in DERIVED_FIELDS]
+
+
+def get_owned_queryset(model, user):
+    """
+    Registros do usuário, incluindo os arquivados/excluídos logicamente.
+    """
+    try:
+        model._meta.get_field('user')
+    except FieldDoesNotExist:
+        return model.objects.filter(relative__user=user)
+    return model.objects.filter(user=user)
+
+
+def iter_archive_lines(user):
+    header = {
+        'format': ARCHIVE_FORMAT,
+        'version': ARCHIVE_VERSION,
+        'exported_at': timezone.now(),
+        'user': {field: getattr(user, field) for field in USER_FIELDS},
+    }
+    yield json.dumps(header, cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
+
+    for model in ARCHIVE_MODELS:
+        model_name = model._meta.model_name
+        fields = [field.attname for field in get_archive_fields(model)]
+        for row in iter_rows(get_owned_queryset(model, user).order_by('pk'), fields):
+            record = {'model': model_name, 'data': dict(zip(fields, row))}
+            yield json.dumps(record, cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
+
+
+def iter_user_archive(user):
+    """
+    Gera o arquivo de exportação do usuário em blocos de bytes (gzip).
+    """
+    return gzip_chunks(iter_archive_lines(user))
+
+
+def write_user_archive(user, path):
+    with open(path, 'wb') as output:
+        for chunk in iter_user_archive(user):
+            output.write(chunk)
+
+
+def read_archive_header(lines):
+    try:
+        header = json.loads(next(lines, '') or '{}')
+    except ValueError:
+        header = {}
+    if header.get('format') != ARCHIVE_FORMAT:
+        raise ValidationError('O arquivo não é uma exportação de dados do Orfin.')
+    if header.get('version') != ARCHIVE_VERSION:
+        raise ValidationError(f"Versão de exportação não suportada: {header.get('version')}.")
+    return header
+
+
+def restore_user_archive(lines, user=None, batch_size=RESTORE_BATCH_SIZE):
+    """
+    Restaura um arquivo de exportação (iterável de linhas de texto, já descompactado).
+    Sem usuário de destino, cria um usuário com os dados do cabeçalho (sem senha utilizável).
+    O usuário de destino não pode ter perfis. Retorna o usuário e a contagem por model.
+    """
+    lines = iter(lines)
+    header = read_archive_header(lines)
+
+    with transaction.atomic():
+        if user is None:
+            user = User.objects.create_user(password=None, **header['user'])
+        elif Relative.objects.filter(user=user).exists():
+            raise ValidationError('O usuário de destino já possui dados.')
+
+        restorer = ArchiveRestorer(user, batch_size)
+        restorer.run(lines)
+
+    return user, restorer.counts
+
+
+class ArchiveRestorer:
+    """
+    Grava os registros do arquivo em lotes, na ordem em que aparecem.
+    Chaves estrangeiras são traduzidas pelos mapas id antigo -> id novo. Referências ao próprio
+    model (subcategorias) também: cada registro só é gravado depois do registro que referencia,
+    já com a referência preenchida, para não violar restrições que dependem dela (nomes únicos
+    apenas entre as categorias raiz). Registros cujo pai ainda não apareceu aguardam o fim do arquivo.
+    """
+
+    def __init__(self, user, batch_size=RESTORE_BATCH_SIZE):
+        self.user = user
+        self.batch_size = batch_size
+        self.models = {model._meta.model_name: model for model in ARCHIVE_MODELS}
+        self.fields = {model: get_archive_fields(model) for model in ARCHIVE_MODELS}
+        self.owner_fields = {
+            model: [field.attname for field in model._meta.concrete_fields
+                    if field.is_relation and field.related_model is User]
+            for model in ARCHIVE_MODELS
+        }
+        # auto_now/auto_now_add sobrescrevem as datas no bulk_create: regravadas depois com bulk_update
+        self.timestamp_fields = {
+            model: [field for field in self.fields[model]
+                    if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False)]
+            for model in ARCHIVE_MODELS
+        }
+
+        # Mapas de ids apenas para models referenciados por outros registros
+        referenced = {field.related_model for fields in self.fields.values() for field in fields
+                      if field.is_relation}
+        self.id_maps = {model: {} for model in ARCHIVE_MODELS if model in referenced}
+
+        # model -> registros que referenciam um registro do próprio model ainda não gravado
+        self.waiting = defaultdict(list)
+        self.counts = defaultdict(int)
+
+    def run(self, lines):
+        pending_model = None
+        pending = []
+
+        for line in lines:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            model = self.models.get(record.get('model'))
+            if model is None:
+                raise ValidationError(f"Tipo de registro desconhecido: {record.get('model')}.")
+
+            if model is not pending_model or len(pending) >= self.batch_size:
+                self.flush(pending_model, pending)
+                pending_model, pending = model, []
+            pending.append(record['data'])
+
+        self.flush(pending_model, pending)
+        for model, rows in self.waiting.items():
+            if rows:
+                _, old_id = self.self_reference(model, rows[0])
+                raise ValidationError(f'Referência inválida: {model._meta.model_name} {old_id}.')
+
+        for relative_id in self.id_maps[Relative].values():
+            MonthlySummary.rebuild(relative_id)
+        for account_id in self.id_maps[Account].values():
+            BalanceCheckpoint.rebuild(account_id=account_id)
+
+    def self_reference(self, model, data):
+        """
+        Retorna (campo, id antigo) da primeira referência ao próprio model ainda sem id novo.
+        """
+        for field in self.fields[model]:
+            if field.is_relation and field.related_model is model:
+                old_id = data.get(field.attname)
+                if old_id is not None and old_id not in self.id_maps[model]:
+                    return field, old_id
+        return None, None
+
+    def flush(self, model, rows):
+        """
+        Grava os registros em ondas: primeiro os que não dependem de registros do próprio model
+        ainda não gravados, depois os que dependiam deles, e assim por diante.
+        """
+        if model is None:
+            return
+        rows = self.waiting.pop(model, []) + rows
+        while rows:
+            ready, blocked = [], []
+            for data in rows:
+                (blocked if self.self_reference(model, data)[0] else ready).append(data)
+            if not ready:
+                break
+            self.insert(model, ready)
+            rows = blocked
+        self.waiting[model] = rows
+
+    def insert(self, model, rows):
+        old_ids = []
+        objects = []
+        for data in rows:
+            old_ids.append(data['id'])
+            values = {attname: self.user.pk for attname in self.owner_fields[model]}
+            for field in self.fields[model]:
+                if field.primary_key:
+                    continue
+                value = data.get(field.attname)
+                if field.is_relation and value is not None:
+                    value = self.map_id(field.related_model, value)
+                elif not field.is_relation:
+                    value = field.to_python(value)
+                values[field.attname] = value
+            objects.append(model(**values))
+
+        for start in range(0, len(objects), self.batch_size):
+            created = model.objects.bulk_create(objects[start:start + self.batch_size])
+            self.restore_timestamps(model, created, rows[start:start + self.batch_size])
+            if model in self.id_maps:
+                self.id_maps[model].update(zip(old_ids[start:start + self.batch_size],
+                                               (item.pk for item in created)))
+            self.counts[model._meta.model_name] += len(created)
+
+    def restore_timestamps(self, model, created, rows):
+        fields = self.timestamp_fields[model]
+        if not fields:
+            return
+        for item, data in zip(created, rows):
+            for field in fields:
+                if data.get(field.attname) is not None:
+                    setattr(item, field.attname, field.to_python(data[field.attname]))
+        model.objects.bulk_update(created, [field.attname for field in fields], batch_size=self.batch_size)
+
+    def map_id(self, model, old_id):
+        try:
+            return self.id_maps[model][old_id]
+        except KeyError:
+            raise ValidationError(f'Referência inválida: {model._meta.model_name} {old_id}.')
@@ -3,6 +3,8 @@ from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from backend.api.core.mixins.unique_constraint import field_errors_from_model
+
 from .models import User
 
 
@@ -27,26 +29,24 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
             'first_name', 'last_name', 'social_name', 'cpf',
             'phone', 'email', 'password', 'password_confirm'
         ]
+        # Sem UniqueValidator: a unicidade é verificada pela constraint do banco no INSERT
+        extra_kwargs = {
+            'cpf': {'validators': []},
+            'email': {'validators': []},
+        }
 
     def validate_cpf(self, value):
         """
-        Valida se o CPF já não está em uso por outro usuário.
+        Normaliza o CPF removendo a formatação.
+        A unicidade é garantida pela constraint do banco no momento do INSERT.
         """
-        # Remove formatação
-        cpf_clean = ''.join(filter(str.isdigit, value))
-
-        if User.objects.filter(cpf=cpf_clean).exists():
-            raise serializers.ValidationError("Este CPF já está registrado.")
-
-        return cpf_clean
+        return ''.join(filter(str.isdigit, value))
 
     def validate_email(self, value):
         """
-        Valida se o email já não está em uso por outro usuário.
+        Normaliza o email para minúsculas.
+        A unicidade é garantida pela constraint do banco no momento do INSERT.
         """
-        if User.objects.filter(email=value.lower()).exists():
-            raise serializers.ValidationError("Este email já está registrado.")
-
         return value.lower()
 
     def validate(self, attrs):
@@ -65,11 +65,16 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         """
         Cria um novo usuário com senha hash.
+        A senha é gerada uma única vez e o registro é inserido com um único INSERT;
+        CPF ou email duplicados são detectados pela violação da constraint unique.
         """
         password = validated_data.pop('password')
-        user = User.objects.create_user(**validated_data)
+        user = User(**validated_data)
         user.set_password(password)
-        user.save()
+
+        with field_errors_from_model():
+            user.save(force_insert=True)
+
         return user
 
 
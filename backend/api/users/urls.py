@@ -2,7 +2,7 @@ from django.urls import path
 
 from .views import (ChangePasswordView, CustomTokenObtainPairView,
                     CustomTokenRefreshView, UserLoginView, UserProfileView,
-                    UserRegistrationView, deactivate_user,
+                    UserRegistrationView, deactivate_user, export_user_data,
                     user_profile_summary)
 
 urlpatterns = [
@@ -17,6 +17,7 @@ urlpatterns = [
     # Gerenciamento de conta
     path('change-password/', ChangePasswordView.as_view(), name='change-password'),
     path('deactivate/', deactivate_user, name='deactivate-user'),
+    path('export/', export_user_data, name='export-user-data'),
 
     # JWT Tokens
     path('token/', CustomTokenObtainPairView.as_view(), name='token-obtain-pair'),
@@ -1,3 +1,5 @@
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from rest_framework import generics, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
@@ -6,6 +8,7 @@ from rest_framework_simplejwt.views import (TokenObtainPairView,
                                             TokenRefreshView)
 
 from .models import User
+from .portability import iter_user_archive
 from .serializers import (ChangePasswordSerializer, TokenSerializer,
                           UserLoginSerializer, UserProfileSerializer,
                           UserRegistrationSerializer)
@@ -159,6 +162,22 @@ def user_profile_summary(request):
     )
 
 
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def export_user_data(request):
+    """
+    View para exportação de todos os dados do usuário (portabilidade - LGPD).
+    Endpoint: GET /api/v1/auth/export/
+    Retorna um arquivo JSON Lines compactado (gzip), gerado em streaming.
+    """
+    user = request.user
+    filename = f"orfin-{user.pk}-{timezone.localdate():%Y%m%d}.jsonl.gz"
+
+    response = StreamingHttpResponse(iter_user_archive(user), content_type='application/gzip')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
 # Views customizadas para JWT
 class CustomTokenObtainPairView(TokenObtainPairView):
     """
@@ -4,7 +4,7 @@ Django project settings
 import sys
 from pathlib import Path
 
-from decouple import Csv, config
+from decouple import Choices, Csv, config
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -123,7 +123,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # Django REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'backend.api.core.authentication.cached_jwt.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
@@ -163,6 +163,43 @@ SIMPLE_JWT = {
     'SLIDING_TOKEN_REFRESH_LIFETIME': timedelta(days=1),
 }
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# Versões do dashboard e da autenticação e os locks do dashboard precisam de um cache compartilhado
+# por todos os workers: redis (CACHE_LOCATION=redis://host:6379/0) ou memcached (host:11211).
+# locmem é por processo: use apenas em desenvolvimento e testes
+CACHE_BACKENDS = {
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+    'memcached': 'django.core.cache.backends.memcached.PyMemcacheCache',
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+}
+CACHE_BACKEND = config('CACHE_BACKEND', default='locmem', cast=Choices(list(CACHE_BACKENDS)))
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKENDS[CACHE_BACKEND],
+        'LOCATION': config('CACHE_LOCATION', default=''),
+        'KEY_PREFIX': 'orfin',
+    }
+}
+CACHE_IS_SHARED = CACHE_BACKEND != 'locmem'
+
+# Tempo (segundos) que o usuário autenticado via JWT fica em cache. Desativar o usuário ou trocar a senha
+# invalida o cache apenas se ele for compartilhado; com locmem os outros workers esperam o TTL (curto)
+AUTH_USER_CACHE_TIMEOUT = config('AUTH_USER_CACHE_TIMEOUT', default=60 if CACHE_IS_SHARED else 5, cast=int)
+
+# Tempo (segundos) que o dashboard de um perfil fica em cache (a versão por perfil já invalida a cada escrita).
+# Sem cache compartilhado a troca de versão não chega aos outros workers: o padrão passa a ser curto
+DASHBOARD_CACHE_TIMEOUT = config('DASHBOARD_CACHE_TIMEOUT', default=3600 if CACHE_IS_SHARED else 5, cast=int)
+
+# Tempo máximo (segundos) que requests simultâneos aguardam o cálculo do mesmo dashboard
+DASHBOARD_LOCK_TIMEOUT = config('DASHBOARD_LOCK_TIMEOUT', default=10, cast=int)
+
+# Tabela de lançamentos particionada por mês (PostgreSQL); desativado usa índice BRIN em date
+TRANSACTION_PARTITIONING = config('TRANSACTION_PARTITIONING', default=False, cast=bool)
+
+# Meses futuros com partição criada com antecedência (comando create_transaction_partitions)
+TRANSACTION_PARTITIONS_AHEAD = config('TRANSACTION_PARTITIONS_AHEAD', default=3, cast=int)
+
 # Modelo de usuário customizado
 AUTH_USER_MODEL = 'api.User'
 
@@ -23,6 +23,10 @@ ALLOWED_HOSTS=127.0.0.1,.localhost,0.0.0.0
 #DB_HOST=localhost
 #DB_PORT=5432
 
+# Cache compartilhado entre os workers (obrigatório em produção): redis, memcached ou locmem
+#CACHE_BACKEND=redis
+#CACHE_LOCATION=redis://localhost:6379/0
+
 #DEFAULT_FROM_EMAIL=
 #EMAIL_BACKEND=django.core.mail.backends.smtp.EmailBackend
 #EMAIL_HOST=localhost